@@ -1,19 +1,20 @@
-from System import Branding;
-
-Location = __file__.removesuffix(f"{Branding.Slash}Fluid.py")
+Location = __file__.removesuffix("Fluid.py")[:-1] # Also drop the slash, whichever way it leans.
 Extension = "py" # Change this when support added for Fluid's own file extension.
 
-try:
-    from Riverside import Runtime;
-    
-except ImportError:
-    pass
-
-try:
-    from Riverside import UI;
-    
-except ImportError:
-    pass
+def __getattr__(Name):
+    # Riverside.Runtime and Riverside.UI are optional, and only looked for when first used.
+    if Name in ("Runtime", "UI"):
+        try:
+            Module = getattr(__import__(f"Riverside.{Name}"), Name)
+            
+        except ImportError:
+            pass
+        
+        else:
+            globals()[Name] = Module
+            return Module
+        
+    raise AttributeError(f"module 'Fluid' has no attribute '{Name}'")
 
 class Exception:
     class Maloote(Exception):
@@ -37,6 +38,12 @@ class FoundationCloneError(Exception):
         There was a problem cloning the Foundation package.
         """
         
+    class FoundationDependencyError(Exception):
+        """Fluid.Exception.FoundationDependencyError
+        
+        The dependencies of the Foundation packages could not be resolved, either because of a cycle or because two packages require different commits of the same package.
+        """
+        
     class FrameworkArchitectureError(Exception):
         """Fluid.Exception.FrameworkArchitectureError
         
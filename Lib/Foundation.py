@@ -7,12 +7,15 @@
 
 from Fluid import Location as LibLocation, Extension as Fl, Exception;
 
-def Install(ApplicationPublisher = "", ApplicationName = "", ApplicationGitIdentifier = "main", ApplicationHasSubmodules: bool = False):
+def Install(ApplicationPublisher = "", ApplicationName = "", ApplicationGitIdentifier = "main", ApplicationHasSubmodules: bool = False, UseStore: bool = False, Shallow: bool = True, Partial: bool = False, ApplicationGitUrl = Null):
     """Foundation.Install()
     
     The base of connection with the outside world.
     Download packages today from GitHub and alike! You can even download non-Fluid projects. (🤔 Why you would do this we have no idea.)
     Coming soon: install Foundation packages from Git repositories not from GitHub!
+    
+    📝 With UseStore the package is fetched once into the shared Foundation.Store and then copied into place, without its .git directory; see Foundation.Store for the Shallow and Partial options.
+    Without it (the default) the package is a git clone, which can be updated with git pull.
     """
     
     # Print the variable ApplicationPublisher
@@ -22,18 +25,6 @@ def Install(ApplicationPublisher = "", ApplicationName = "", ApplicationGitIdent
     RequireDotPostActionHelper = False
     SplitApplicationName = ""
 
-    SpecialPublisherList = ["RiversideValley", "Riverside"]
-
-    for str in SpecialPublisherList:
-        if ApplicationPublisher is str:
-            # Special
-            if GitPublisher == "RiversideValley":
-                ApplicationPublisher = "Riverside"
-
-            elif GitPublisher == "Riverside":
-                GitPublisher = "RiversideValley"
-                # raise RuntimeError("Illegal Fluid Foundation publisher; github publisher 43607 ('Riverside') is blocked.")
-
     if "." in GitPublisher:
         # Very problematic.
         
@@ -46,24 +37,26 @@ def Install(ApplicationPublisher = "", ApplicationName = "", ApplicationGitIdent
         RequireDotPostActionHelper = True
         SplitApplicationName = ApplicationName.split(".")
         
-    elif "Fluid." in GitName and "RiversideValley" is GitPublisher:
+    elif "Fluid." in GitName and GitPublisher in ("RiversideValley", "Riverside"):
         # Special repository.
         
         FluidSpecialRepo = True
         ApplicationName = ApplicationName.removeprefix("Fluid.")
 
-    # TODO: Implement ability to install non-GitHub sourced Foundation packages.
-    GitRepoUrl = f"https://github.com/{GitPublisher}/{ApplicationName}.git" # In order to implement the 'Install from non-GitHub repos' task, this url must be edited.
+    GitRepoUrl, PackageLocation = Locate(ApplicationPublisher, ApplicationName, ApplicationGitUrl)
+    Slash = Branding.Slash
 
     try:
-        if Branding.SlashInPaths is not True:
-            Slash = "\\"
-        else:
-            Slash = "/"
-            
-        PackageLocation = f"{LibLocation}{Slash}{ApplicationPublisher}{Slash}{ApplicationName}"
+        if UseStore is True:
+            Entry = Store.Fetch(GitRepoUrl, ApplicationGitIdentifier, ApplicationHasSubmodules, Shallow, Partial)
+
+            try:
+                Store.Materialize(Entry, PackageLocation)
 
-        if ApplicationHasSubmodules:
+            finally:
+                Store.Release(Entry)
+
+        elif ApplicationHasSubmodules:
             Processing.Execute(f"git clone {GitRepoUrl} {PackageLocation} --recurse-submodules", Language="shell")
 
         elif ApplicationHasSubmodules is not True:
@@ -72,8 +65,8 @@ def Install(ApplicationPublisher = "", ApplicationName = "", ApplicationGitIdent
         else:
             raise Exception.FoundationCloneError("Error with submodules")
         
-        Processing.Execute(f"cd {PackageLocation}", Language="shell")
-        Processing.Execute(f"git checkout -q {ApplicationGitIdentifier}", Language="shell")
+        if UseStore is not True:
+            Processing.Execute(["git", "-C", PackageLocation, "checkout", "-q", ApplicationGitIdentifier], Language="shell")
 
     except:
         raise Exception.FoundationCloneError("There was a problem cloning the Foundation package")
@@ -94,7 +87,7 @@ def Install(ApplicationPublisher = "", ApplicationName = "", ApplicationGitIdent
 
         Console.WriteLine("\nThe package you are attempting to install appears to contain illegal characters.\nNot to worry, the Fluid Helper will solve the problem for you. We will run some checks and tests on your machine; ignore console output if there is any.\n")
         
-        HelperFile = f"{LibLocation}{Slash}{ApplicationPublisher}{Slash}{SplitApplicationName[0]}.{Fl}"
+        HelperFile = f"{Legacy._os.path.dirname(PackageLocation)}{Slash}{SplitApplicationName[0]}.{Fl}"
         
         try:
             Explore(HelperFile, True).Read()
@@ -118,4 +111,468 @@ def Install(ApplicationPublisher = "", ApplicationName = "", ApplicationGitIdent
             #try:
             #    Explore.Append(f"{LibLocation}{Slash}{ApplicationPublisher}{Slash}{SplitApplicationName[0]}.{Fl}", Auto=True, AutoValue=f"class {SplitApplicationName[1]}:\n    ")
             #except:
-            #    pass
\ No newline at end of file
+            #    pass
+
+def Locate(ApplicationPublisher = "", ApplicationName = "", ApplicationGitUrl = Null):
+    """Foundation.Locate()
+    
+    Return the Git repository URL a package is installed from, and the directory it is installed to.
+    Riverside Valley packages are published by RiversideValley on GitHub, but are installed under Riverside.
+    """
+    
+    GitPublisher = ApplicationPublisher
+
+    if ApplicationPublisher == "RiversideValley":
+        ApplicationPublisher = "Riverside"
+
+    elif ApplicationPublisher == "Riverside":
+        GitPublisher = "RiversideValley"
+        # raise RuntimeError("Illegal Fluid Foundation publisher; github publisher 43607 ('Riverside') is blocked.")
+
+    # TODO: Implement ability to install non-GitHub sourced Foundation packages.
+    GitRepoUrl = f"https://github.com/{GitPublisher}/{ApplicationName}.git" # In order to implement the 'Install from non-GitHub repos' task, this url must be edited.
+
+    if ApplicationGitUrl is not Null:
+        GitRepoUrl = ApplicationGitUrl
+
+    return GitRepoUrl, f"{LibLocation}{Branding.Slash}{ApplicationPublisher}{Branding.Slash}{ApplicationName}"
+
+def InstallMany(Packages = [], MaximumWorkers: int = 4, ProgressFile = Null, Resume: bool = True):
+    """Foundation.InstallMany()
+    
+    Install a batch of Foundation packages at once on a bounded pool of workers.
+    Each package is either a tuple or a dictionary of the arguments accepted by Foundation.Install().
+    Progress is recorded on disk after every package, keyed by the commit each package resolved to, so an interrupted run picks up where it left off when Resume is True.
+    The progress file is removed once every package has been installed.
+    Returns a dictionary mapping each package to the wall-clock time (in seconds) its installation took.
+    """
+    
+    if ProgressFile is Null:
+        ProgressFile = f"{LibLocation}{Branding.Slash}.FoundationProgress.json"
+
+    Progress = {}
+    ProgressLock = Legacy._threading.Lock()
+
+    if Resume is True:
+        try:
+            Progress = Legacy._json.loads(Explore(ProgressFile, True).Read())
+
+        except (FileNotFoundError, ValueError):
+            Progress = {}
+
+    def Arguments(Package):
+        if isinstance(Package, dict):
+            return Package
+
+        return dict(zip(("ApplicationPublisher", "ApplicationName", "ApplicationGitIdentifier", "ApplicationHasSubmodules"), Package))
+
+    def PackageName(Package):
+        Package = Arguments(Package)
+
+        return f"{Package.get('ApplicationPublisher', '')}/{Package.get('ApplicationName', '')}@{Package.get('ApplicationGitIdentifier', 'main')}"
+
+    def PackageKey(Package):
+        # Key on the commit rather than the identifier, so a branch that has moved since is installed again.
+        Package = Arguments(Package)
+        Url, _ = Locate(Package.get("ApplicationPublisher", ""), Package.get("ApplicationName", ""), Package.get("ApplicationGitUrl", Null))
+
+        return f"{Package.get('ApplicationPublisher', '')}/{Package.get('ApplicationName', '')}@{Store.Resolve(Url, Package.get('ApplicationGitIdentifier', 'main'))}"
+
+    def PackageLocation(Package):
+        Package = Arguments(Package)
+        _, Location = Locate(Package.get("ApplicationPublisher", ""), Package.get("ApplicationName", ""), Package.get("ApplicationGitUrl", Null))
+
+        return Location
+
+    def Record(Key, State, Duration):
+        with ProgressLock:
+            Progress[Key] = {"State": State, "Duration": Duration}
+            Explore(ProgressFile, True, Legacy._json.dumps(Progress, indent=4)).Write()
+
+    def Worker(Package):
+        Start = Legacy._time.perf_counter()
+        Key = PackageName(Package)
+
+        try:
+            Key = PackageKey(Package)
+
+            Location = PackageLocation(Package)
+
+            if Progress.get(Key, {}).get("State") == "Installed" and Legacy._os.path.isdir(Location):
+                # Already installed during a previous (interrupted) run.
+                return Progress[Key]["Duration"]
+
+            if Legacy._os.path.isdir(Location):
+                # Left behind by an interrupted install, or an older commit of a branch that has moved since.
+                Console.Log(f"Removing stale {Location} before installing {Key}")
+                Legacy._shutil.rmtree(Location)
+
+            if isinstance(Package, dict):
+                Install(**Package)
+            else:
+                Install(*Package)
+
+        except:
+            Record(Key, "Failed", Legacy._time.perf_counter() - Start)
+            raise
+
+        Duration = Legacy._time.perf_counter() - Start
+        Record(Key, "Installed", Duration)
+        Console.Log(f"Installed {Key} in {Duration:.2f}s")
+
+        return Duration
+
+    Timings = {}
+    Failures = []
+
+    with Legacy._futures.ThreadPoolExecutor(max_workers=MaximumWorkers) as Pool:
+        Pending = {Pool.submit(Worker, Package): PackageName(Package) for Package in Packages}
+
+        for Future in Legacy._futures.as_completed(Pending):
+            Name = Pending[Future]
+
+            try:
+                Timings[Name] = Future.result()
+
+            except:
+                # Recorded as failed by the worker; the other packages carry on.
+                Failures.append(Name)
+
+    if Failures:
+        raise Exception.FoundationCloneError(f"There was a problem cloning the following Foundation packages: {', '.join(Failures)}")
+
+    try:
+        # Every package succeeded, nothing is left to resume.
+        Legacy._os.remove(ProgressFile)
+
+    except FileNotFoundError:
+        pass
+
+    return Timings
+
+Manifest = "Foundation.json" # Declares a package's dependencies, see Foundation.Resolve().
+LockFile = "Foundation.lock"
+
+def Resolve(Packages = [], LockFileLocation = LockFile):
+    """Foundation.Resolve()
+    
+    Build the full dependency graph of the given packages once and pin every package to a commit in a lockfile.
+    Packages take the same tuples or dictionaries as Foundation.InstallMany().
+    Dependencies are declared in a Foundation.json manifest at the root of each package, for example:
+    
+        {"Dependencies": [{"Publisher": "RiversideValley", "Name": "Fluid.Core", "Identifier": "main", "Submodules": false}]}
+    
+    Returns the lockfile contents, with packages listed in installation order.
+    """
+    
+    Pending = []
+
+    for Package in Packages:
+        if isinstance(Package, dict):
+            Arguments = Package
+        else:
+            Arguments = dict(zip(("ApplicationPublisher", "ApplicationName", "ApplicationGitIdentifier", "ApplicationHasSubmodules"), Package))
+
+        Dependency = {
+            "Publisher": Arguments.get("ApplicationPublisher", ""),
+            "Name": Arguments.get("ApplicationName", ""),
+            "Identifier": Arguments.get("ApplicationGitIdentifier", "main"),
+            "Submodules": Arguments.get("ApplicationHasSubmodules", False),
+        }
+
+        if Arguments.get("ApplicationGitUrl", Null) is not Null:
+            Dependency["Url"] = Arguments["ApplicationGitUrl"]
+
+        Pending.append(Dependency)
+
+    Locked = {}
+    Graph = {}
+
+    while Pending:
+        Dependency = Pending.pop()
+        Key = f"{Dependency['Publisher']}/{Dependency['Name']}"
+        Url, _ = Locate(Dependency["Publisher"], Dependency["Name"], Dependency.get("Url", Null))
+        Commit = Store.Resolve(Url, Dependency.get("Identifier", "main"))
+
+        if Key in Locked:
+            if Locked[Key]["Commit"] != Commit:
+                raise Exception.FoundationDependencyError(f"{Key} is required at both {Locked[Key]['Commit']} and {Commit}")
+            
+            continue
+        
+        # Fetching into the store is needed to read the manifest, and makes the later install a local link.
+        Entry = Store.Fetch(Url, Commit, Dependency.get("Submodules", False))
+
+        try:
+            Dependencies = Legacy._json.loads(Explore(Legacy._os.path.join(Entry, Manifest), True).Read()).get("Dependencies", [])
+            
+        except FileNotFoundError:
+            Dependencies = []
+
+        finally:
+            Store.Release(Entry)
+
+        Locked[Key] = {
+            "Publisher": Dependency["Publisher"],
+            "Name": Dependency["Name"],
+            "Url": Url,
+            "Commit": Commit,
+            "Submodules": Dependency.get("Submodules", False),
+            "Dependencies": [f"{Required['Publisher']}/{Required['Name']}" for Required in Dependencies],
+        }
+        Graph[Key] = Locked[Key]["Dependencies"]
+        Pending.extend(Dependencies)
+
+    try:
+        Order = list(Legacy._graph.TopologicalSorter(Graph).static_order())
+        
+    except Legacy._graph.CycleError as Error:
+        raise Exception.FoundationDependencyError(f"Dependency cycle between {' -> '.join(Error.args[1])}") from Error
+
+    Lock = {"Packages": {Key: Locked[Key] for Key in Order}}
+
+    if LockFileLocation is not Null:
+        Explore(LockFileLocation, True, Legacy._json.dumps(Lock, indent=4)).Write()
+
+    return Lock
+
+def InstallFromLock(LockFileLocation = LockFile, MaximumWorkers: int = 4):
+    """Foundation.InstallFromLock()
+    
+    Install every package pinned in a lockfile written by Foundation.Resolve(), without resolving anything again.
+    A package is installed as soon as all of its dependencies are, so independent branches of the graph are fetched concurrently.
+    Returns a dictionary mapping each package to the wall-clock time (in seconds) its installation took.
+    """
+    
+    Packages = Legacy._json.loads(Explore(LockFileLocation, True).Read())["Packages"]
+    Sorter = Legacy._graph.TopologicalSorter({Key: Package["Dependencies"] for Key, Package in Packages.items()})
+    Sorter.prepare()
+
+    def Worker(Package):
+        Start = Legacy._time.perf_counter()
+        Install(Package["Publisher"], Package["Name"], Package["Commit"], Package["Submodules"], ApplicationGitUrl = Package["Url"])
+
+        return Legacy._time.perf_counter() - Start
+
+    Timings = {}
+
+    with Legacy._futures.ThreadPoolExecutor(max_workers=MaximumWorkers) as Pool:
+        Running = {}
+
+        while Sorter.is_active():
+            for Key in Sorter.get_ready():
+                Running[Pool.submit(Worker, Packages[Key])] = Key
+
+            Done, _ = Legacy._futures.wait(Running, return_when=Legacy._futures.FIRST_COMPLETED)
+
+            for Future in Done:
+                Key = Running.pop(Future)
+                # Raises if the package failed, leaving its dependents uninstalled.
+                Timings[Key] = Future.result()
+                Sorter.done(Key)
+
+    return Timings
+
+class Store:
+    """Foundation.Store
+    
+    Content-addressed cache of Foundation packages shared by every Fluid environment on the computer.
+    Each entry is keyed by the repository URL and the commit it was resolved to, so identical trees are only ever downloaded once.
+    Installs copy files out of the store, so editing an installed package never alters the store, and evicting an entry never breaks an installed package.
+    """
+
+    Location = Legacy._os.environ.get("FLUID_FOUNDATION_STORE", Legacy._os.path.join(Legacy._os.path.expanduser("~"), ".fluid", "Foundation"))
+    Capacity = 2 * 1024 ** 3 # Bytes; least recently used entries are evicted above this size.
+    _Lock = Legacy._thread.allocate_lock() # _thread rather than threading, which importing Foundation should not load.
+    _InUse = {} # Entry: number of holders, see Hold(); Evict() skips these.
+
+    def Git(*Arguments, Directory = Null):
+        """Foundation.Store.Git()
+        
+        Run a git command and return its output.
+        """
+        try:
+            Task = Processing.Task(["git", *Arguments], Directory = Directory)
+            
+        except OSError as Error:
+            raise Exception.FoundationCloneError(f"git {' '.join(Arguments)} failed") from Error
+
+        if Task.Wait() != 0:
+            raise Exception.FoundationCloneError(f"git {' '.join(Arguments)} failed: {Task.Errors.strip()}")
+        
+        return Task.Output
+
+    def Resolve(Url: str, Identifier: str = "main"):
+        """Foundation.Store.Resolve()
+        
+        Resolve a branch, tag or commit to the full commit hash it currently points at.
+        Abbreviated commits are resolved by fetching the history of the repository, as servers only advertise branches and tags.
+        """
+        if len(Identifier) == 40 and all(Character in "0123456789abcdef" for Character in Identifier.lower()):
+            return Identifier.lower()
+        
+        Commit = Null
+
+        for Line in Store.Git("ls-remote", Url, Identifier, f"{Identifier}^{{}}").splitlines():
+            Hash, Reference = Line.split("\t", 1)
+            
+            if Commit is Null or Reference.endswith("^{}"):
+                # Peeled tags point at the commit itself rather than the tag object.
+                Commit = Hash
+
+        if Commit is Null and 4 <= len(Identifier) < 40 and all(Character in "0123456789abcdef" for Character in Identifier.lower()):
+            Legacy._os.makedirs(Store.Location, exist_ok = True)
+            Temporary = Legacy._os.path.join(Store.Location, f"resolve.{Legacy._os.getpid()}.{Legacy._threading.get_ident()}.partial")
+
+            try:
+                Store.Git("init", "-q", "--bare", Temporary)
+                Store.Git("fetch", "-q", "--filter=blob:none", Url, "+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*", Directory = Temporary)
+                Commit = Store.Git("rev-parse", "--verify", "-q", f"{Identifier}^{{commit}}", Directory = Temporary).strip()
+
+            except Exception.FoundationCloneError:
+                Commit = Null
+
+            finally:
+                Legacy._shutil.rmtree(Temporary, ignore_errors = True)
+
+        if Commit is Null:
+            raise Exception.FoundationCloneError(f"Could not resolve '{Identifier}' in {Url}")
+        
+        return Commit
+
+    def Key(Url: str, Commit: str):
+        """Foundation.Store.Key()"""
+        return Legacy._hash.sha256(f"{Url}@{Commit}".encode("utf-8")).hexdigest()
+
+    def Fetch(Url: str, Identifier: str = "main", Submodules: bool = False, Shallow: bool = True, Partial: bool = False):
+        """Foundation.Store.Fetch()
+        
+        Return the store entry for Url at Identifier, downloading it first if it is not already cached.
+        Shallow fetches only the resolved commit; Partial additionally defers downloading file contents git does not need for the checkout.
+        The entry is returned held (see Foundation.Store.Hold()), and must be released with Foundation.Store.Release() once it has been used.
+        """
+        Commit = Store.Resolve(Url, Identifier)
+        Entry = Legacy._os.path.join(Store.Location, Store.Key(Url, Commit))
+        # Held before checking for it, so that no Evict() can remove it from here on.
+        Store.Hold(Entry)
+
+        try:
+            if Legacy._os.path.isdir(Entry):
+                # Mark as recently used for eviction.
+                Legacy._os.utime(Entry)
+                return Entry
+            
+            Legacy._os.makedirs(Store.Location, exist_ok = True)
+            Temporary = f"{Entry}.{Legacy._os.getpid()}.{Legacy._threading.get_ident()}.partial"
+            
+            try:
+                Store.Git("init", "-q", Temporary)
+                Store.Git("remote", "add", "origin", Url, Directory = Temporary)
+                
+                FetchArguments = ["fetch", "-q"]
+                
+                if Shallow is True:
+                    FetchArguments.append("--depth=1")
+                    
+                if Partial is True:
+                    FetchArguments.append("--filter=blob:none")
+                    
+                Store.Git(*FetchArguments, "origin", Commit, Directory = Temporary)
+                Store.Git("checkout", "-q", "FETCH_HEAD", Directory = Temporary)
+
+                if Submodules is True:
+                    Store.Git("submodule", "update", "-q", "--init", "--recursive", *(["--depth=1"] if Shallow is True else []), Directory = Temporary)
+
+                try:
+                    Legacy._os.rename(Temporary, Entry)
+                    
+                except OSError:
+                    # Another install stored the same commit first.
+                    if not Legacy._os.path.isdir(Entry):
+                        raise
+                    
+            finally:
+                Legacy._shutil.rmtree(Temporary, ignore_errors = True)
+                
+            Store.Evict()
+
+        except:
+            Store.Release(Entry)
+            raise
+        
+        return Entry
+
+    def Hold(Entry: str):
+        """Foundation.Store.Hold()
+        
+        Keep Foundation.Store.Evict() from removing Entry until it is released with Foundation.Store.Release().
+        Holds are counted, so an entry can be held by several installs at once.
+        """
+        with Store._Lock:
+            Store._InUse[Entry] = Store._InUse.get(Entry, 0) + 1
+
+    def Release(Entry: str):
+        """Foundation.Store.Release()"""
+        with Store._Lock:
+            Store._InUse[Entry] -= 1
+
+            if Store._InUse[Entry] == 0:
+                del Store._InUse[Entry]
+
+    def Materialize(Entry: str, Destination: str):
+        """Foundation.Store.Materialize()
+        
+        Copy the working tree of a store entry into Destination.
+        The entry is held meanwhile, so that Foundation.Store.Evict() does not remove it.
+        """
+        Store.Hold(Entry)
+
+        try:
+            Legacy._shutil.copytree(Entry, Destination, symlinks = True, ignore = Legacy._shutil.ignore_patterns(".git"))
+
+        finally:
+            Store.Release(Entry)
+
+    def Size(Entry: str):
+        """Foundation.Store.Size()"""
+        Total = 0
+        
+        for Directory, _, Files in Legacy._os.walk(Entry):
+            for File in Files:
+                try:
+                    Total += Legacy._os.lstat(Legacy._os.path.join(Directory, File)).st_size
+                    
+                except OSError:
+                    pass
+                
+        return Total
+
+    def Evict(Capacity = Null):
+        """Foundation.Store.Evict()
+        
+        Remove the least recently used entries until the store fits within Capacity bytes.
+        Held entries, such as those being copied by Foundation.Store.Materialize(), are kept.
+        """
+        if Capacity is Null:
+            Capacity = Store.Capacity
+            
+        try:
+            Entries = [Legacy._os.path.join(Store.Location, Name) for Name in Legacy._os.listdir(Store.Location) if not Name.endswith(".partial")]
+            
+        except FileNotFoundError:
+            return
+        
+        Entries.sort(key = Legacy._os.path.getmtime)
+        Sizes = {Entry: Store.Size(Entry) for Entry in Entries}
+        Total = sum(Sizes.values())
+
+        with Store._Lock:
+            for Entry in Entries:
+                if Total <= Capacity:
+                    break
+
+                if Entry in Store._InUse:
+                    continue
+                
+                Legacy._shutil.rmtree(Entry, ignore_errors = True)
+                Total -= Sizes[Entry]
@@ -24,211 +24,61 @@
 # - Foundation (😕) 
 # - PyObjCTools
 
-class Legacy:
-    """System.Legacy
-    
-    Foundation class for the purpose of providing legacy Python modules for more.. refined use."""
-    
-    class _stat:
-        """Constants/functions for interpreting results of os.stat() and os.lstat().
-
-        Suggested usage: from stat import *
-        """
-
-        # Indices for stat struct members in the tuple returned by os.stat()
+import sys as _sys;
 
-        ST_MODE  = 0
-        ST_INO   = 1
-        ST_DEV   = 2
-        ST_NLINK = 3
-        ST_UID   = 4
-        ST_GID   = 5
-        ST_SIZE  = 6
-        ST_ATIME = 7
-        ST_MTIME = 8
-        ST_CTIME = 9
-
-        # Extract bits from the mode
+class _Loader(type):
+    """System._Loader
+    
+    Imports the modules listed in a class's _Modules the first time they are used, instead of when System is imported."""
 
-        def S_IMODE(mode):
-            """Return the portion of the file's mode that can be set b`y
-            os.chmod().
-            """
-            return mode & 0o7777
+    def __getattr__(Class, Name):
+        try:
+            Module = Class._Modules[Name]
+            
+        except KeyError:
+            raise AttributeError(f"type object '{Class.__name__}' has no attribute '{Name}'") from None
+        
+        __import__(Module)
+        Loaded = _sys.modules[Module]
+        setattr(Class, Name, Loaded)
+        
+        return Loaded
 
-        def S_IFMT(mode):
-            """Return the portion of the file's mode that describes the
-            file type.
-            """
-            return mode & 0o170000
-
-        # Constants used as S_IFMT() for various file types
-        # (not all are implemented on all systems)
-
-        S_IFDIR  = 0o040000  # directory
-        S_IFCHR  = 0o020000  # character device
-        S_IFBLK  = 0o060000  # block device
-        S_IFREG  = 0o100000  # regular file
-        S_IFIFO  = 0o010000  # fifo (named pipe)
-        S_IFLNK  = 0o120000  # symbolic link
-        S_IFSOCK = 0o140000  # socket file
-        # Fallbacks for uncommon platform-specific constants
-        S_IFDOOR = 0
-        S_IFPORT = 0
-        S_IFWHT = 0
-
-        # Functions to test for each file type
-
-        def S_ISDIR(mode):
-            """Return True if mode is from a directory."""
-            return S_IFMT(mode) == S_IFDIR
-
-        def S_ISCHR(mode):
-            """Return True if mode is from a character special device file."""
-            return S_IFMT(mode) == S_IFCHR
-
-        def S_ISBLK(mode):
-            """Return True if mode is from a block special device file."""
-            return S_IFMT(mode) == S_IFBLK
-
-        def S_ISREG(mode):
-            """Return True if mode is from a regular file."""
-            return S_IFMT(mode) == S_IFREG
-
-        def S_ISFIFO(mode):
-            """Return True if mode is from a FIFO (named pipe)."""
-            return S_IFMT(mode) == S_IFIFO
-
-        def S_ISLNK(mode):
-            """Return True if mode is from a symbolic link."""
-            return S_IFMT(mode) == S_IFLNK
-
-        def S_ISSOCK(mode):
-            """Return True if mode is from a socket."""
-            return S_IFMT(mode) == S_IFSOCK
-
-        def S_ISDOOR(mode):
-            """Return True if mode is from a door."""
-            return False
-
-        def S_ISPORT(mode):
-            """Return True if mode is from an event port."""
-            return False
-
-        def S_ISWHT(mode):
-            """Return True if mode is from a whiteout."""
-            return False
-
-        # Names for permission bits
-
-        S_ISUID = 0o4000  # set UID bit
-        S_ISGID = 0o2000  # set GID bit
-        S_ENFMT = S_ISGID # file locking enforcement
-        S_ISVTX = 0o1000  # sticky bit
-        S_IREAD = 0o0400  # Unix V7 synonym for S_IRUSR
-        S_IWRITE = 0o0200 # Unix V7 synonym for S_IWUSR
-        S_IEXEC = 0o0100  # Unix V7 synonym for S_IXUSR
-        S_IRWXU = 0o0700  # mask for owner permissions
-        S_IRUSR = 0o0400  # read by owner
-        S_IWUSR = 0o0200  # write by owner
-        S_IXUSR = 0o0100  # execute by owner
-        S_IRWXG = 0o0070  # mask for group permissions
-        S_IRGRP = 0o0040  # read by group
-        S_IWGRP = 0o0020  # write by group
-        S_IXGRP = 0o0010  # execute by group
-        S_IRWXO = 0o0007  # mask for others (not in group) permissions
-        S_IROTH = 0o0004  # read by others
-        S_IWOTH = 0o0002  # write by others
-        S_IXOTH = 0o0001  # execute by others
-
-        # Names for file flags
-
-        UF_NODUMP    = 0x00000001  # do not dump file
-        UF_IMMUTABLE = 0x00000002  # file may not be changed
-        UF_APPEND    = 0x00000004  # file may only be appended to
-        UF_OPAQUE    = 0x00000008  # directory is opaque when viewed through a union stack
-        UF_NOUNLINK  = 0x00000010  # file may not be renamed or deleted
-        UF_COMPRESSED = 0x00000020 # OS X: file is hfs-compressed
-        UF_HIDDEN    = 0x00008000  # OS X: file should not be displayed
-        SF_ARCHIVED  = 0x00010000  # file may be archived
-        SF_IMMUTABLE = 0x00020000  # file may not be changed
-        SF_APPEND    = 0x00040000  # file may only be appended to
-        SF_NOUNLINK  = 0x00100000  # file may not be renamed or deleted
-        SF_SNAPSHOT  = 0x00200000  # file is a snapshot file
-
-
-        _filemode_table = (
-            ((S_IFLNK,         "l"),
-             (S_IFSOCK,        "s"),  # Must appear before IFREG and IFDIR as IFSOCK == IFREG | IFDIR
-             (S_IFREG,         "-"),
-             (S_IFBLK,         "b"),
-             (S_IFDIR,         "d"),
-             (S_IFCHR,         "c"),
-             (S_IFIFO,         "p")),
-        
-            ((S_IRUSR,         "r"),),
-            ((S_IWUSR,         "w"),),
-            ((S_IXUSR|S_ISUID, "s"),
-             (S_ISUID,         "S"),
-             (S_IXUSR,         "x")),
-
-            ((S_IRGRP,         "r"),),
-            ((S_IWGRP,         "w"),),
-            ((S_IXGRP|S_ISGID, "s"),
-             (S_ISGID,         "S"),
-             (S_IXGRP,         "x")),
-        
-            ((S_IROTH,         "r"),),
-            ((S_IWOTH,         "w"),),
-            ((S_IXOTH|S_ISVTX, "t"),
-             (S_ISVTX,         "T"),
-             (S_IXOTH,         "x"))
-        )
-
-        def filemode(mode):
-            """Convert a file's mode to a string of the form '-rwxrwxrwx'."""
-            perm = []
-            for table in _filemode_table:
-                for bit, char in table:
-                    if mode & bit == bit:
-                        perm.append(char)
-                        break
-                else:
-                    perm.append("-")
-            return "".join(perm)
-
-
-        # Windows FILE_ATTRIBUTE constants for interpreting os.stat()'s
-        # "st_file_attributes" member
-
-        FILE_ATTRIBUTE_ARCHIVE = 32
-        FILE_ATTRIBUTE_COMPRESSED = 2048
-        FILE_ATTRIBUTE_DEVICE = 64
-        FILE_ATTRIBUTE_DIRECTORY = 16
-        FILE_ATTRIBUTE_ENCRYPTED = 16384
-        FILE_ATTRIBUTE_HIDDEN = 2
-        FILE_ATTRIBUTE_INTEGRITY_STREAM = 32768
-        FILE_ATTRIBUTE_NORMAL = 128
-        FILE_ATTRIBUTE_NOT_CONTENT_INDEXED = 8192
-        FILE_ATTRIBUTE_NO_SCRUB_DATA = 131072
-        FILE_ATTRIBUTE_OFFLINE = 4096
-        FILE_ATTRIBUTE_READONLY = 1
-        FILE_ATTRIBUTE_REPARSE_POINT = 1024
-        FILE_ATTRIBUTE_SPARSE_FILE = 512
-        FILE_ATTRIBUTE_SYSTEM = 4
-        FILE_ATTRIBUTE_TEMPORARY = 256
-        FILE_ATTRIBUTE_VIRTUAL = 65536
-            
-    import sys as _sys;
-#    from Legacy import pathlib as _path;
-#    from Legacy import zipimport as _zip;
-#    from Legacy import csv as _csv;
-#    from Legacy import turtle as _turtle;
-#    from Legacy import socket as _socket;
-#    from Legacy import random as _random;
-    from Legacy import subprocess as _process;
-    import time as _time;
+class Legacy(metaclass=_Loader):
+    """System.Legacy
     
+    Foundation class for the purpose of providing legacy Python modules for more.. refined use.
+    The modules are only imported once they are first used, keeping System quick to import."""
+
+    _Modules = {
+        "_sys": "sys",
+        "_stat": "stat",
+        "_process": "subprocess",
+        "_time": "time",
+        "_json": "json",
+        "_thread": "_thread",
+        "_threading": "threading",
+        "_futures": "concurrent.futures",
+        "_os": "os",
+        "_shutil": "shutil",
+        "_hash": "hashlib",
+        "_graph": "graphlib",
+        "_shlex": "shlex",
+        "_queue": "queue",
+        "_weakref": "weakref",
+        "_marshal": "marshal",
+        "_atexit": "atexit",
+        "_mmap": "mmap",
+        "_fnmatch": "fnmatch",
+        "_io": "io",
+#       "_path": "pathlib",
+#       "_zip": "zipimport",
+#       "_csv": "csv",
+#       "_turtle": "turtle",
+#       "_socket": "socket",
+#       "_random": "random",
+    }
+
 import Fluid;
 
 GenericAlias = type(list[int])
@@ -400,25 +250,26 @@ class Processing:
     
     Foundation class for the purpose of spawning, viewing and managing processes on the user's computer."""
 
-    def Execute(ExecuteScript, ScriptTimeOut = Null, Language: str = "fl", IncludeFoundation = []):
+    def Execute(ExecuteScript, ScriptTimeOut = Null, Language: str = "fl", IncludeFoundation = [], CacheProfile: str = ""):
         """System.Processing.Execute()
     
-        Foundation method for the purpose of executing Python code from a string."""
+        Foundation method for the purpose of executing Python code from a string.
+        Fluid code is compiled once and then reused from Processing.CodeCache; see there for CacheProfile."""
         if Language == "fl":
+            Code = Processing.CodeCache.Compile(str(ExecuteScript), CacheProfile)
+            
             if IncludeFoundation is not Null:
 #               try:
-                return exec(str(ExecuteScript), IncludeFoundation)
+                return exec(Code, IncludeFoundation)
 #               except NameError: # NameError is for when the person includes a Foundation module such as 'System' without using the 'IncludeFoundation' parameter.
 #                   if Variables.Search(ExecuteScript, "System") is True:
 #                       return exec(ExecuteScript, {"System.Console":Console})
             else:
-                return exec(str(ExecuteScript))
+                return exec(Code)
             
         elif Language == "shell":
-            if ScriptTimeOut is not Null:
-                return Legacy._process.call(ExecuteScript, timeout = ScriptTimeOut)
-            else:
-                return Legacy._process.call(ExecuteScript)
+            # The console keeps receiving the output, as it did with subprocess.call().
+            return Processing.Task(ExecuteScript, ScriptTimeOut, Capture = False).Wait()
         
         else:
             raise NotImplementedError
@@ -427,9 +278,459 @@ def Halt(HaltTime: float): # type: ignore
         """System.Processing.Halt"""
         Legacy._time.sleep(HaltTime)
 
-    #class Task(Object):
-        #if Branding.Computer.Interpreter is 
-        #def __init__(This, Task: str, Task):
+    class CodeCache:
+        """System.Processing.CodeCache
+        
+        Least recently used cache of the code objects compiled by Processing.Execute().
+        Code objects do not depend on the globals they are run with, so entries are keyed by the source and a profile label; use different profiles to keep groups of snippets from evicting each other.
+        When Directory is set, compiled code is also marshalled to disk so that later processes skip tokenizing, parsing and compiling entirely.
+        """
+        
+        Size = 256
+        Directory = Null
+        Hits = 0
+        Misses = 0
+        DiskHits = 0
+        _Entries = {} # Insertion ordered, least recently used first.
+        _Lock = Legacy._thread.allocate_lock()
+
+        def Compile(Source: str, Profile: str = ""):
+            """System.Processing.CodeCache.Compile()
+            
+            Return the code object for Source, compiling it only if it is not cached.
+            """
+            Cache = Processing.CodeCache
+            Key = (Source, Profile)
+            
+            with Cache._Lock:
+                Code = Cache._Entries.pop(Key, None)
+                
+                if Code is not None:
+                    Cache._Entries[Key] = Code
+                    Cache.Hits += 1
+                    return Code
+                
+                Cache.Misses += 1
+
+            Code = Null
+            
+            if Cache.Directory is not Null:
+                Digest = Legacy._hash.sha256(f"{Profile}\0{Source}".encode("utf-8", "surrogatepass")).hexdigest()
+                File = Legacy._os.path.join(Cache.Directory, f"{Digest}.{Legacy._sys.implementation.cache_tag}.flc")
+                
+                try:
+                    with open(File, "rb") as Data:
+                        Code = Legacy._marshal.load(Data)
+                    
+                    Cache.DiskHits += 1
+                        
+                except (OSError, EOFError, ValueError, TypeError):
+                    Code = Null
+
+            if Code is Null:
+                Code = compile(Source, "<string>", "exec")
+                
+                if Cache.Directory is not Null:
+                    try:
+                        Legacy._os.makedirs(Cache.Directory, exist_ok = True)
+                        Temporary = f"{File}.{Legacy._os.getpid()}.{Legacy._threading.get_ident()}"
+                        
+                        with open(Temporary, "wb") as Data:
+                            Legacy._marshal.dump(Code, Data)
+                            
+                        Legacy._os.replace(Temporary, File)
+                        
+                    except OSError:
+                        pass # The disk cache is only an optimization.
+
+            with Cache._Lock:
+                Cache._Entries[Key] = Code
+                
+                while len(Cache._Entries) > Cache.Size:
+                    del Cache._Entries[next(iter(Cache._Entries))]
+                    
+            return Code
+
+        def Resize(Size: int):
+            """System.Processing.CodeCache.Resize()"""
+            Cache = Processing.CodeCache
+            
+            with Cache._Lock:
+                Cache.Size = Size
+                
+                while len(Cache._Entries) > Size:
+                    del Cache._Entries[next(iter(Cache._Entries))]
+
+        def Clear():
+            """System.Processing.CodeCache.Clear()
+            
+            Empty the in-memory cache and reset the counters; the disk cache is left alone.
+            """
+            Cache = Processing.CodeCache
+            
+            with Cache._Lock:
+                Cache._Entries.clear()
+                Cache.Hits = Cache.Misses = Cache.DiskHits = 0
+
+        def Statistics():
+            """System.Processing.CodeCache.Statistics()"""
+            Cache = Processing.CodeCache
+            
+            return {"Hits": Cache.Hits, "Misses": Cache.Misses, "DiskHits": Cache.DiskHits, "Entries": len(Cache._Entries), "Size": Cache.Size}
+
+    def Concurrency(Maximum: int):
+        """System.Processing.Concurrency()
+        
+        Set how many Processing.Task and Processing.AsyncTask children may run at once; further tasks wait for a free slot before starting.
+        Tasks which are already running keep the slot they were started with.
+        """
+        with Processing.Task._SlotsLock:
+            Processing.Task.Limit = Maximum
+            Processing.Task.Slots = Null
+            Processing.AsyncTask.Limit = Maximum
+            Processing.AsyncTask.Slots = Null
+
+    class Task(Object):
+        """System.Processing.Task
+        
+        A handle on a child process whose output is streamed back while it runs.
+        Arguments is a list of arguments, or a command line which is split like a shell would (no shell is spawned).
+        """
+        
+        Limit = 8
+        Slots = Null # Made on first use.
+        _SlotsLock = Legacy._thread.allocate_lock()
+
+        def __init__(self, Arguments, TimeOut = Null, Directory = Null, Environment = Null, Capture: bool = True, Encoding = "utf-8"):
+            if isinstance(Arguments, str):
+                Arguments = Legacy._shlex.split(Arguments, posix = Branding.Computer.Interpreter != Branding.Windows)
+                
+            self.Arguments = Arguments
+            self.TimeOut = TimeOut
+            self.ReturnCode = Null
+            self.Cancelled = False
+            self.TimedOut = False
+            
+            with Processing.Task._SlotsLock:
+                if Processing.Task.Slots is Null:
+                    Processing.Task.Slots = Legacy._threading.BoundedSemaphore(Processing.Task.Limit)
+                    
+                self._Slot = Processing.Task.Slots
+            self._Streams = {"stdout": [], "stderr": []}
+            self._Ended = {"stdout": False, "stderr": False}
+            self._Changed = Legacy._threading.Condition() # Notified when a line is read or a stream ends.
+            self._Readers = []
+            self._Timer = Null
+            
+            self._Slot.acquire()
+            
+            try:
+                self.Process = Legacy._process.Popen(
+                    Arguments,
+                    cwd = None if Directory is Null else Directory,
+                    env = None if Environment is Null else Environment,
+                    stdout = Legacy._process.PIPE if Capture else None,
+                    stderr = Legacy._process.PIPE if Capture else None,
+                    encoding = Encoding if Capture else None,
+                    errors = "replace" if Capture else None,
+                )
+                
+            except:
+                self._Slot.release()
+                raise
+
+            if Capture:
+                for Stream, Pipe in (("stdout", self.Process.stdout), ("stderr", self.Process.stderr)):
+                    Reader = Legacy._threading.Thread(target = self._Read, args = (Stream, Pipe), daemon = True)
+                    Reader.start()
+                    self._Readers.append(Reader)
+
+            if TimeOut is not Null:
+                self._Timer = Legacy._threading.Timer(TimeOut, self._Expire)
+                self._Timer.daemon = True
+                self._Timer.start()
+
+            # Hand the slot over as soon as the child exits, even if nobody is waiting on it yet.
+            self._Watcher = Legacy._threading.Thread(target = self._Watch, daemon = True)
+            self._Watcher.start()
+
+        def _Watch(self):
+            self.Process.wait()
+            
+            if self._Timer is not Null:
+                self._Timer.cancel()
+                
+            self._Slot.release()
+
+        def _Read(self, Stream, Pipe):
+            with Pipe:
+                for Line in Pipe:
+                    with self._Changed:
+                        self._Streams[Stream].append(Line)
+                        self._Changed.notify_all()
+                    
+            with self._Changed:
+                self._Ended[Stream] = True
+                self._Changed.notify_all()
+
+        def _Expire(self):
+            if self.Process.poll() is None:
+                self.TimedOut = True
+                self.Cancel()
+
+        def Lines(self, Stream = "stdout"):
+            """System.Processing.Task.Lines()
+            
+            Yield the lines of "stdout" or "stderr" as the child writes them, starting with those already written.
+            """
+            if not self._Readers:
+                raise Fluid.Exception.ArgumentError("The task's output is not being captured.")
+            
+            Lines = self._Streams[Stream]
+            Index = 0
+
+            while True:
+                with self._Changed:
+                    while Index == len(Lines) and not self._Ended[Stream]:
+                        self._Changed.wait()
+
+                    if Index == len(Lines):
+                        return
+                    
+                    Line = Lines[Index]
+
+                Index += 1
+                yield Line
+
+        @property
+        def Output(self):
+            return "".join(self._Streams["stdout"])
+
+        @property
+        def Errors(self):
+            return "".join(self._Streams["stderr"])
+
+        @property
+        def Running(self):
+            return self.Process.poll() is None
+
+        def Wait(self, TimeOut = Null):
+            """System.Processing.Task.Wait()
+            
+            Wait for the child to exit and return its exit code.
+            Raises subprocess.TimeoutExpired if the task's TimeOut was reached.
+            """
+            self.ReturnCode = self.Process.wait(None if TimeOut is Null else TimeOut)
+            self._Watcher.join()
+            
+            for Reader in self._Readers:
+                Reader.join()
+
+            if self.TimedOut:
+                raise Legacy._process.TimeoutExpired(self.Arguments, self.TimeOut, self.Output, self.Errors)
+            
+            return self.ReturnCode
+
+        def Cancel(self, GracePeriod: float = 5):
+            """System.Processing.Task.Cancel()
+            
+            Ask the child to terminate, and kill it if it is still running after GracePeriod seconds.
+            """
+            self.Cancelled = True
+            
+            try:
+                self.Process.terminate()
+                self.Process.wait(GracePeriod)
+                
+            except Legacy._process.TimeoutExpired:
+                self.Process.kill()
+                
+            except ProcessLookupError:
+                pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *Details):
+            if self.Running:
+                self.Cancel()
+                
+            self.Wait()
+
+    class AsyncTask(Object):
+        """System.Processing.AsyncTask
+        
+        The asyncio counterpart of Processing.Task, built on asyncio.create_subprocess_exec().
+        Use as "Handle = await Processing.AsyncTask([...]).Start()".
+        """
+        
+        Limit = 8
+        Slots = Null # An asyncio.Semaphore per event loop, made on first use.
+
+        def __init__(self, Arguments, TimeOut = Null, Directory = Null, Environment = Null, Encoding = "utf-8"):
+            import asyncio;
+            
+            if isinstance(Arguments, str):
+                Arguments = Legacy._shlex.split(Arguments, posix = Branding.Computer.Interpreter != Branding.Windows)
+                
+            self.Arguments = Arguments
+            self.TimeOut = TimeOut
+            self.Directory = Directory
+            self.Environment = Environment
+            self.Encoding = Encoding
+            self.ReturnCode = Null
+            self.Cancelled = False
+            self.TimedOut = False
+            self.Process = Null
+            self._Slot = Null
+            self._Streams = {"stdout": [], "stderr": []}
+            self._Ended = {"stdout": False, "stderr": False}
+            self._Changed = asyncio.Condition() # Notified when a line is read or a stream ends.
+            self._Readers = []
+
+        async def Start(self):
+            """System.Processing.AsyncTask.Start()
+            
+            Wait for a free slot, then spawn the child.
+            """
+            import asyncio;
+            
+            Loop = asyncio.get_running_loop()
+            
+            with Processing.Task._SlotsLock:
+                if Processing.AsyncTask.Slots is Null:
+                    Processing.AsyncTask.Slots = Legacy._weakref.WeakKeyDictionary()
+                    
+                Slots = Processing.AsyncTask.Slots
+            
+                if Loop not in Slots:
+                    Slots[Loop] = asyncio.Semaphore(Processing.AsyncTask.Limit)
+                
+            self._Slot = Slots[Loop]
+            await self._Slot.acquire()
+
+            try:
+                self.Process = await asyncio.create_subprocess_exec(
+                    *self.Arguments,
+                    cwd = None if self.Directory is Null else self.Directory,
+                    env = None if self.Environment is Null else self.Environment,
+                    stdout = asyncio.subprocess.PIPE,
+                    stderr = asyncio.subprocess.PIPE,
+                )
+                
+            except:
+                self._Slot.release()
+                raise
+
+            for Stream, Pipe in (("stdout", self.Process.stdout), ("stderr", self.Process.stderr)):
+                self._Readers.append(asyncio.create_task(self._Read(Stream, Pipe)))
+
+            # Hand the slot over as soon as the child exits, even if nobody is waiting on it yet.
+            self._Watcher = asyncio.create_task(self._Watch())
+
+            return self
+
+        async def _Watch(self):
+            try:
+                await self.Process.wait()
+                
+            finally:
+                self._Slot.release()
+
+        async def _Read(self, Stream, Pipe):
+            while Line := await Pipe.readline():
+                Line = Line.decode(self.Encoding, "replace")
+                
+                async with self._Changed:
+                    self._Streams[Stream].append(Line)
+                    self._Changed.notify_all()
+                
+            async with self._Changed:
+                self._Ended[Stream] = True
+                self._Changed.notify_all()
+
+        async def Lines(self, Stream = "stdout"):
+            """System.Processing.AsyncTask.Lines()
+            
+            Asynchronously yield the lines of "stdout" or "stderr" as the child writes them, starting with those already written.
+            May be called before Start(), in which case it waits for the child.
+            """
+            Lines = self._Streams[Stream]
+            Index = 0
+
+            while True:
+                async with self._Changed:
+                    await self._Changed.wait_for(lambda: Index < len(Lines) or self._Ended[Stream])
+
+                    if Index == len(Lines):
+                        return
+                    
+                    Line = Lines[Index]
+
+                Index += 1
+                yield Line
+
+        @property
+        def Output(self):
+            return "".join(self._Streams["stdout"])
+
+        @property
+        def Errors(self):
+            return "".join(self._Streams["stderr"])
+
+        async def Wait(self):
+            """System.Processing.AsyncTask.Wait()
+            
+            Wait for the child to exit and return its exit code.
+            Raises TimeoutError (and cancels the child) if the task's TimeOut is reached.
+            The child is killed if the wait itself is cancelled.
+            """
+            import asyncio;
+            
+            try:
+                self.ReturnCode = await asyncio.wait_for(self.Process.wait(), None if self.TimeOut is Null else self.TimeOut)
+                
+            except asyncio.TimeoutError:
+                self.TimedOut = True
+                await self.Cancel()
+                raise TimeoutError(f"{self.Arguments[0]} timed out after {self.TimeOut} seconds")
+
+            except asyncio.CancelledError:
+                self.Cancelled = True
+                
+                try:
+                    self.Process.kill()
+                    
+                except ProcessLookupError:
+                    pass
+                
+                raise
+            
+            finally:
+                if self.Process.returncode is not None:
+                    await asyncio.gather(self._Watcher, *self._Readers)
+                    
+            return self.ReturnCode
+
+        async def Cancel(self, GracePeriod: float = 5):
+            """System.Processing.AsyncTask.Cancel()
+            
+            Ask the child to terminate, and kill it if it is still running after GracePeriod seconds.
+            """
+            import asyncio;
+            
+            self.Cancelled = True
+            
+            try:
+                self.Process.terminate()
+                await asyncio.wait_for(self.Process.wait(), GracePeriod)
+                
+            except asyncio.TimeoutError:
+                self.Process.kill()
+                await self.Process.wait()
+                
+            except ProcessLookupError:
+                pass
 
 class Chronology:
     """System.Chronology
@@ -533,6 +834,98 @@ def Minute(self, WithSeconds = False):
             
             else:
                 raise NotImplementedError("The specified time zone is not supported.")
+
+    class Formatter(Object):
+        """System.Chronology.Formatter
+        
+        Reusable, fast ISO 8601 formatter for epoch seconds (as returned by time.time()).
+        The date is only worked out once per day and the full text once per second, so formatting many timestamps costs little more than a lookup.
+        Form should be either "Date" or "DateTime"; unlike System.Chronology.Time, fields are zero-padded.
+        """
+        
+        _Clock = Null # ("HH:MM:" for every minute of the day, "SS" for every second of a minute), made on first use.
+
+        def __init__(self, TimeZone = "Local", Form: str = "DateTime"):
+            if TimeZone not in ("Local", "UCT"):
+                raise NotImplementedError("The specified time zone is not supported.")
+            
+            if Form not in ("Date", "DateTime"):
+                raise Fluid.Exception.ArgumentError("The specified format is not supported.")
+            
+            self.TimeZone = TimeZone
+            self.Form = Form
+            self._Suffix = "Z" if TimeZone == "UCT" else ""
+            # Each cache is one tuple so that threads sharing a formatter never see half an update.
+            self._Second = (Null, Null)
+            self._Day = (Null, Null)
+            self._Offset = (Null, 0)
+
+            if Chronology.Formatter._Clock is Null:
+                Chronology.Formatter._Clock = (
+                    [f"{Minute // 60:02}:{Minute % 60:02}:" for Minute in range(1440)],
+                    [f"{Second:02}" for Second in range(60)],
+                )
+
+        def _Local(self, Second: int):
+            # UTC offsets only change on quarter-hour boundaries, so one localtime() call covers 15 minutes.
+            if self.TimeZone == "UCT":
+                return Second
+            
+            Block, Offset = self._Offset
+            
+            if Block != Second // 900:
+                Offset = Legacy._time.localtime(Second).tm_gmtoff
+                self._Offset = (Second // 900, Offset)
+                
+            return Second + Offset
+
+        def _Date(self, Day: int):
+            Cached, Prefix = self._Day
+            
+            if Cached != Day:
+                Date = Legacy._time.gmtime(Day * 86400)
+                Prefix = f"{Date.tm_year:04}-{Date.tm_mon:02}-{Date.tm_mday:02}"
+                self._Day = (Day, Prefix)
+                
+            return Prefix
+
+        def Format(self, Seconds = Null):
+            """System.Chronology.Formatter.Format()
+            
+            Format Seconds since the epoch, or the current time if it is not given.
+            """
+            Second = int((Legacy._time.time() if Seconds is Null else Seconds) // 1)
+            Cached, Text = self._Second
+            
+            if Cached == Second:
+                return Text
+            
+            Day, Time = divmod(self._Local(Second), 86400)
+            Text = self._Date(Day)
+            
+            if self.Form == "DateTime":
+                MinutesText, SecondsText = Chronology.Formatter._Clock
+                Text = f"{Text}T{MinutesText[Time // 60]}{SecondsText[Time % 60]}{self._Suffix}"
+                
+            self._Second = (Second, Text)
+            
+            return Text
+
+        def FormatMany(self, Seconds):
+            """System.Chronology.Formatter.FormatMany()
+            
+            Format a whole sequence (list, array.array, ...) of epoch seconds in one call, returning a list of strings.
+            """
+            Format = self.Format
+            
+            return [Format(Second) for Second in Seconds]
+
+    def Format(Seconds, TimeZone = "Local", Form: str = "DateTime"):
+        """System.Chronology.Format()
+        
+        Convert a sequence of epoch seconds to ISO 8601 strings in one call, without making a System.Chronology.Time for each of them.
+        """
+        return Chronology.Formatter(TimeZone, Form).FormatMany(Seconds)
             
 class Console:
     """System.Console
@@ -542,41 +935,259 @@ class Console:
     Not recommended for actual text display as part of a GUI application; use only for logging purposes.
     """
 
+    Levels = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3, "FATAL": 4}
+    Threshold = "DEBUG" # Logs below this level are dropped before any formatting happens.
+    Format = "Text" # Or "JSON", see System.Console.Structured().
+    _Sink = Null
+    _Stamps = {} # Time zone -> (second, formatted timestamp)
+
     def WriteLine(Text: any): # type: ignore
         return print(Text)
 
     def Write(Text: any): # type: ignore
         return print(Text, end="")
+
+    def Buffered(Size: int = 10000, Batch: int = 512, Stream = Null, Block: bool = True):
+        """System.Console.Buffered()
+        
+        Send System.Console.Log() output through a Console.Sink instead of printing every log synchronously.
+        Returns the sink; call System.Console.Unbuffered() to go back to printing.
+        """
+        Console.Unbuffered()
+        Console._Sink = Console.Sink(Size, Batch, Stream, Block)
+        
+        return Console._Sink
+
+    def Structured(Descriptor: int = 1, Size: int = 10000, Batch: int = 4096, Block: bool = True):
+        """System.Console.Structured()
+        
+        Write logs as newline-delimited JSON, for log shippers, straight to the file descriptor Descriptor (standard output by default) in large batches.
+        Each record holds "time", "level" and "message", plus the fields of the System.Console.Logger it came from.
+        Returns the sink; call System.Console.Unbuffered() to go back to plain text.
+        """
+        Console.Unbuffered()
+        Console._Sink = Console.Sink(Size, Batch, Block = Block, Descriptor = Descriptor)
+        Console.Format = "JSON"
+        
+        return Console._Sink
+
+    def Unbuffered():
+        """System.Console.Unbuffered()"""
+        Console.Format = "Text"
+        
+        if Console._Sink is not Null:
+            Console._Sink.Close()
+            Console._Sink = Null
+
+    def Flush():
+        """System.Console.Flush()
+        
+        Wait until every buffered log has been written.
+        """
+        if Console._Sink is not Null:
+            Console._Sink.Flush()
+
+    def _Stamp(TimeZone):
+        # Formatting the time is the bulk of a log's cost, so it is only done once a second.
+        Second = int(Legacy._time.time())
+        Cached = Console._Stamps.get(TimeZone)
+        
+        if Cached is None or Cached[0] != Second:
+            Cached = Console._Stamps[TimeZone] = (Second, str(Chronology.Time(TimeZone, "DateTime")))
+            
+        return Cached[1]
+
+    class Sink(Object):
+        """System.Console.Sink
+        
+        A bounded queue of log lines drained by a background thread, which writes them to Stream (the console by default) in batches.
+        With a Descriptor, batches are encoded once and written to that file descriptor directly, bypassing Python's text streams.
+        When the queue is full, Put() waits for room if Block is True and otherwise drops the line and counts it in Dropped.
+        Once the sink is closed, Put() writes lines synchronously.
+        """
+        
+        def __init__(self, Size: int = 10000, Batch: int = 512, Stream = Null, Block: bool = True, Descriptor = Null):
+            self.Batch = Batch
+            self.Stream = Stream
+            self.Descriptor = Descriptor
+            self.Block = Block
+            self.Dropped = 0
+            self._Queue = Legacy._queue.Queue(Size)
+            self._Closed = False
+            self._Lock = Legacy._threading.Lock() # Keeps Put() from queueing lines behind the sentinel of Close().
+            self._Thread = Legacy._threading.Thread(target = self._Drain, name = "System.Console.Sink", daemon = True)
+            self._Thread.start()
+            Legacy._atexit.register(self.Close)
+
+        def Put(self, Line: str):
+            """System.Console.Sink.Put()"""
+            with self._Lock:
+                if self._Closed:
+                    self._Write([Line])
+                    return
+                
+                try:
+                    self._Queue.put(Line, self.Block)
+                    
+                except Legacy._queue.Full:
+                    self.Dropped += 1
+
+        def _Write(self, Lines):
+            try:
+                if self.Descriptor is not Null:
+                    Data = memoryview(("\n".join(Lines) + "\n").encode("utf-8", "backslashreplace"))
+                    
+                    while Data:
+                        Data = Data[Legacy._os.write(self.Descriptor, Data):]
+                
+                else:
+                    Stream = Legacy._sys.stdout if self.Stream is Null else self.Stream
+                    Stream.write("\n".join(Lines) + "\n")
+                    Stream.flush()
+                
+            except (OSError, ValueError):
+                pass # The console went away; there is nowhere left to log to.
+
+        def _Drain(self):
+            while True:
+                Lines = [self._Queue.get()]
+
+                while len(Lines) < self.Batch:
+                    try:
+                        Lines.append(self._Queue.get_nowait())
+                        
+                    except Legacy._queue.Empty:
+                        break
+
+                # Close() queues the sentinel under the lock, so nothing is ever queued after it.
+                Stop = Lines[-1] is Null
+                
+                if Stop:
+                    Lines.pop()
+
+                if Lines:
+                    self._Write(Lines)
+
+                for _ in range(len(Lines) + Stop):
+                    self._Queue.task_done()
+
+                if Stop:
+                    return
+
+        def Flush(self):
+            """System.Console.Sink.Flush()"""
+            self._Queue.join()
+
+        def Close(self):
+            """System.Console.Sink.Close()
+            
+            Write out the remaining logs and stop the background thread.
+            """
+            with self._Lock:
+                if self._Closed:
+                    return
+                
+                self._Closed = True
+                
+            self._Queue.put(Null)
+            self._Thread.join()
+            Legacy._atexit.unregister(self.Close)
     
     class Log():
         """System.Console.Log
         
         Very advanced version of System.Console.WriteLine() that formats logs neatly in the console.
+        Logs below System.Console.Threshold are skipped without being formatted; see System.Console.Buffered() to write logs in the background.
         """
         
+        ValidLogTypes = ["INFO", "WARNING", "ERROR", "DEBUG", "FATAL"]
+        
         def __init__(self, Log: str = "", LogType: str = "INFO", LogTimeZone: str = "Local"):
             
-            self.Log = Log
-            self.LogType = LogType
+            self.LogType = LogType.upper()
             self.LogTimeZone = LogTimeZone
+            
+            Level = Console.Levels.get(self.LogType)
+            
+            if Level is None:
+                raise Fluid.Exception.ArgumentError("The specified log type is not supported.")
+            
+            if Level < Console.Levels[Console.Threshold]:
+                self.Log = ""
+                return
 
-            self.LogDate = Chronology.Time(self.LogTimeZone, "DateTime")
+            if Console.Format == "JSON":
+                self.LogDate = Console._Stamp(self.LogTimeZone)
+                self.Log = f'{{"time":"{self.LogDate}","level":"{self.LogType}","message":{Legacy._json.dumps(str(Log), ensure_ascii = False)}}}'
+                
+            else:
+                self.LogDate = f"[{Console._Stamp(self.LogTimeZone)}]"
+                self.Log = f"{self.LogDate} |{self.LogType[0:1]}| {Log}"
+            
+            if Console._Sink is not Null:
+                Console._Sink.Put(self.Log)
+                
+            else:
+                print(self.Log)
+            
+        def __str__(self):
+            return self.Log
 
-            self.LogType = self.LogType.upper()
+    class Logger(Object):
+        """System.Console.Logger
+        
+        A named logger whose fields are attached to every structured log it writes.
+        The fields are serialized once, when the logger is made, so a log only has to format its time, level and message.
+        In text mode logs are passed on to System.Console.Log().
+        Fields cannot be named after the keys every record has: "logger", "time", "level" and "message".
+        """
+        
+        Reserved = frozenset(("logger", "time", "level", "message"))
+        
+        def __init__(self, Name: str, TimeZone: str = "Local", **Fields):
+            if not Console.Logger.Reserved.isdisjoint(Fields):
+                raise Fluid.Exception.ArgumentError(f"Logger fields cannot be named {', '.join(sorted(Console.Logger.Reserved.intersection(Fields)))}.")
+            
+            self.Name = Name
+            self.TimeZone = TimeZone
+            self.Fields = Fields
+            # '{"logger":"Name",...,' ready for the per-log fields to follow.
+            self._Head = Legacy._json.dumps({"logger": Name, **Fields}, ensure_ascii = False, separators = (",", ":"))[:-1] + ","
 
-            self.LogDate = f"[{self.LogDate}]"
+        def Log(self, Log: str = "", LogType: str = "INFO", **Extra):
+            """System.Console.Logger.Log()
+            
+            Extra keyword arguments are added to this log's record only.
+            """
+            if Extra and not Console.Logger.Reserved.isdisjoint(Extra):
+                raise Fluid.Exception.ArgumentError(f"Log fields cannot be named {', '.join(sorted(Console.Logger.Reserved.intersection(Extra)))}.")
             
-            self.ValidLogTypes = ["INFO", "WARNING", "ERROR", "DEBUG", "FATAL"]
+            LogType = LogType.upper()
+            Level = Console.Levels.get(LogType)
             
-            if self.LogType not in self.ValidLogTypes:
+            if Level is None:
                 raise Fluid.Exception.ArgumentError("The specified log type is not supported.")
             
-            self.Log = f"{self.LogDate} |{self.LogType[0:1]}| {self.Log}"
+            if Level < Console.Levels[Console.Threshold]:
+                return
             
-            print(self.Log)
+            if Console.Format != "JSON":
+                Console.Log(Log, LogType, self.TimeZone)
+                return
             
-        def __str__(self):
-            return self.Log
+            Dumps = Legacy._json.dumps
+            
+            if Extra:
+                Record = f'{self._Head}{Dumps(Extra, ensure_ascii = False, separators = (",", ":"))[1:-1]},"time":"{Console._Stamp(self.TimeZone)}","level":"{LogType}","message":{Dumps(str(Log), ensure_ascii = False)}}}'
+                
+            else:
+                Record = f'{self._Head}"time":"{Console._Stamp(self.TimeZone)}","level":"{LogType}","message":{Dumps(str(Log), ensure_ascii = False)}}}'
+
+            if Console._Sink is not Null:
+                Console._Sink.Put(Record)
+                
+            else:
+                print(Record)
 
 class Explore:
     """System.Explore
@@ -584,51 +1195,466 @@ class Explore:
     Foundation class for the purpose of allowing the developer to read, write and make new files on the end-user's computer.
     """
     
-    def __init__(self, FileName: str, Auto: bool = True, AutoValue: str = "", FileEncoding = "utf-8"):
+    def __init__(self, FileName: str, Auto: bool = True, AutoValue: str = "", FileEncoding = "utf-8", Binary: bool = False):
+        """System.Explore.__init__
+        
+        📝 With Binary the file is opened in binary mode: reads return bytes and AutoValue must be bytes.
+        """
         self.FileName = FileName
         self.Auto = Auto
         self.AutoValue = AutoValue
         self.FileEncoding = FileEncoding
+        self.Binary = Binary
         self.GetWorkingDirectory = Fluid.Location
         
     def __str__(self):
         raise Fluid.Exception.ArgumentError("You must use a function inside the System.Explore class in order to explore your computer.")
+
+    def Open(self, Mode: str = "r", Buffering: int = -1): # type: ignore
+        """System.Explore.Open()
+        
+        Open the file in Mode, honouring the Binary and FileEncoding options; the caller is responsible for closing it.
+        """
+        if self.Binary:
+            return open(self.FileName, f"{Mode}b", buffering = Buffering)
+        else:
+            return open(self.FileName, Mode, buffering = Buffering, encoding = self.FileEncoding)
     
+    def Stat(self): # type: ignore
+        """System.Explore.Stat()
+        
+        Return the os.stat() result of the file, or Null if it does not exist; interpret st_mode with System.Legacy._stat.
+        """
+        try:
+            return Legacy._os.stat(self.FileName)
+        
+        except (FileNotFoundError, NotADirectoryError):
+            return Null
+
+    def Exists(self):
+        """System.Explore.Exists()
+
+        Check whether anything (file, directory, device...) exists at the path, without opening it.
+        """
+        return self.Stat() is not Null
+
     def IsFile(self):
         """System.Explore.IsFile()
 
         Foundation method for the purpose of a allowing the developer to check if a file exists on the end-user's computer.
+        Only regular files count; directories and other special files return False.
         """
+        Stat = self.Stat()
         
-        try:
-            open(self.FileName, "r", encoding = self.FileEncoding)
+        return Stat is not Null and Legacy._stat.S_ISREG(Stat.st_mode)
+
+    def IsDirectory(self):
+        """System.Explore.IsDirectory()"""
+        Stat = self.Stat()
+        
+        return Stat is not Null and Legacy._stat.S_ISDIR(Stat.st_mode)
+
+    def Scan(self, Pattern = Null, MinimumSize = Null, MaximumSize = Null, ModifiedAfter = Null, ModifiedBefore = Null, Recursive: bool = True, Directories: bool = False, Threads: int = 1): # type: ignore
+        """System.Explore.Scan()
+
+        Lazily walk the directory tree rooted at FileName, yielding an os.DirEntry for every file that passes the filters.
+        Pattern is a shell-style pattern (such as "*.csv") matched against the name; sizes are in bytes and times in seconds since the epoch.
+        Entries are only stat'ed when a size or time filter needs it, and the result is cached on the DirEntry for the caller to reuse.
+        Directories also yields the directories themselves. Threads > 1 scans several directories at once, which helps on network filesystems.
+        """
+        NeedsStat = MinimumSize is not Null or MaximumSize is not Null or ModifiedAfter is not Null or ModifiedBefore is not Null
+
+        def Matches(Entry):
+            if Pattern is not Null and not Legacy._fnmatch.fnmatch(Entry.name, Pattern):
+                return False
+            
+            if NeedsStat:
+                Stat = Entry.stat(follow_symlinks = False)
+                
+                if MinimumSize is not Null and Stat.st_size < MinimumSize:
+                    return False
+                
+                if MaximumSize is not Null and Stat.st_size > MaximumSize:
+                    return False
+                
+                if ModifiedAfter is not Null and Stat.st_mtime < ModifiedAfter:
+                    return False
+                
+                if ModifiedBefore is not Null and Stat.st_mtime > ModifiedBefore:
+                    return False
+                
             return True
+
+        def Visit(Directory):
+            Found = []
+            Children = []
+            
+            try:
+                with Legacy._os.scandir(Directory) as Entries:
+                    for Entry in Entries:
+                        try:
+                            if Entry.is_dir(follow_symlinks = False):
+                                if Recursive:
+                                    Children.append(Entry.path)
+                                    
+                                if Directories and Matches(Entry):
+                                    Found.append(Entry)
+                                    
+                            elif Entry.is_file(follow_symlinks = False) and Matches(Entry):
+                                Found.append(Entry)
+                                
+                        except OSError:
+                            pass # Vanished or unreadable while scanning.
+                        
+            except (PermissionError, FileNotFoundError, NotADirectoryError):
+                pass
+            
+            return Found, Children
+
+        if Threads <= 1:
+            Pending = [self.FileName]
             
-        except FileNotFoundError:
-            return False
+            while Pending:
+                Found, Children = Visit(Pending.pop())
+                yield from Found
+                Pending.extend(reversed(Children))
+                
+            return
+
+        Pool = Legacy._futures.ThreadPoolExecutor(max_workers = Threads)
         
-        except:
-            raise RuntimeError("An unknown error has occurred.")
+        try:
+            Pending = {Pool.submit(Visit, self.FileName)}
+            
+            while Pending:
+                Done, Pending = Legacy._futures.wait(Pending, return_when = Legacy._futures.FIRST_COMPLETED)
+                
+                for Future in Done:
+                    Found, Children = Future.result()
+                    Pending.update(Pool.submit(Visit, Child) for Child in Children)
+                    yield from Found
+                    
+        finally:
+            Pool.shutdown(wait = False, cancel_futures = True)
 
     def Read(self): # type: ignore
         """System.Explore.Read()
 
         Foundation method for the purpose of a allowing the developer to read files on the end-user's computer.
+        For large files, use System.Explore.Chunks(), System.Explore.Lines() or System.Explore.Map() instead of reading everything at once.
         """
         if self.Auto is not False:
-            return str(open(self.FileName, "r", encoding = self.FileEncoding).read())
+            with self.Open("r") as File:
+                return File.read()
         else:
-            return open(self.FileName, "r", encoding = self.FileEncoding)
+            return self.Open("r")
+
+    def Chunks(self, Size: int = 1024 * 1024): # type: ignore
+        """System.Explore.Chunks()
+
+        Lazily read the file Size characters (or bytes, with Binary) at a time.
+        The file is closed as soon as it is exhausted or the iteration is abandoned.
+        """
+        with self.Open("r") as File:
+            while Chunk := File.read(Size):
+                yield Chunk
+
+    def Lines(self): # type: ignore
+        """System.Explore.Lines()
+
+        Lazily read the file line by line, closing it once iteration finishes.
+        """
+        with self.Open("r") as File:
+            yield from File
+
+    def Map(self, Writable: bool = False): # type: ignore
+        """System.Explore.Map()
+
+        Memory-map the file and return a zero-copy, bytes-like view of it; use it in a "with" block so the mapping is released deterministically.
+        Slicing the view, or wrapping it in a memoryview, does not copy the file's contents. Writable maps write changes through to the file.
+        """
+        with open(self.FileName, "r+b" if Writable else "rb") as File:
+            if Legacy._os.fstat(File.fileno()).st_size == 0:
+                # Empty files cannot be mapped.
+                return memoryview(b"")
+            
+            # The map keeps its own handle, so the file can be closed straight away.
+            return Legacy._mmap.mmap(File.fileno(), 0, access = Legacy._mmap.ACCESS_WRITE if Writable else Legacy._mmap.ACCESS_READ)
 
-    def Write(self): # type: ignore   
+    def Write(self, Atomic: bool = False, Sync: bool = False): # type: ignore   
         """System.Explore.Write()
 
         Foundation method for the purpose of a allowing the developer to write files on the end-user's computer.
+        With Atomic the contents go to a temporary file which is synced and then renamed over the file, so readers never see a torn file.
+        With Sync the data is flushed to disk before returning.
+        Without Auto a file object is returned either way; with Atomic or Sync, closing it syncs the data and puts the file in place.
+        With Auto the number of bytes written is returned, whatever the options.
         """
         if self.Auto == False:
-            return open(self.FileName, "w", encoding = self.FileEncoding)
+            if Atomic or Sync:
+                File = Legacy._io.BufferedWriter(Explore._SyncedFile(self.FileName, Atomic, Sync))
+                
+                return File if self.Binary else Legacy._io.TextIOWrapper(File, encoding = self.FileEncoding)
+            
+            return self.Open("w")
+        
+        elif Atomic or Sync:
+            with self.Writer(Atomic = Atomic, Sync = Sync) as Writer:
+                return Writer.Write(self.AutoValue)
+            
         else:
-            return open(self.FileName, "w", encoding = self.FileEncoding).write(self.AutoValue)
+            with self.Open("w") as File:
+                Written = File.write(self.AutoValue)
+                
+                if self.Binary:
+                    return Written
+                
+                # Text files count characters; the file was empty, so its position is the number of bytes.
+                File.flush()
+                return File.buffer.tell()
+
+    def Writer(self, BufferSize: int = 64 * 1024, Atomic: bool = False, Sync: bool = False, Append: bool = False): # type: ignore
+        """System.Explore.Writer()
+
+        Return a System.Explore.BufferedWriter for the file; use it in a "with" block.
+        """
+        return Explore.BufferedWriter(self.FileName, BufferSize, Atomic, Sync, Append, Null if self.Binary else self.FileEncoding)
+
+    class BufferedWriter(Object):
+        """System.Explore.BufferedWriter
+
+        Collects small writes in memory and hands them to the operating system BufferSize bytes at a time.
+        With Atomic the data goes to a temporary file next to the target, which is synced and renamed over it when the writer is closed, or removed if the "with" block fails.
+        Text is encoded with Encoding (Null for bytes only) and newlines are written as they are.
+        """
+        
+        def __init__(self, FileName: str, BufferSize: int = 64 * 1024, Atomic: bool = False, Sync: bool = False, Append: bool = False, Encoding = "utf-8"):
+            if Atomic and Append:
+                raise Fluid.Exception.ArgumentError("Appending to a file cannot be atomic.")
+            
+            self.FileName = FileName
+            self.BufferSize = BufferSize
+            self.Atomic = Atomic
+            self.Sync = Sync
+            self.Encoding = Encoding
+            self.Closed = False
+            self._Pending = []
+            self._Size = 0
+            self._Target = FileName
+            
+            Flags = Legacy._os.O_WRONLY | Legacy._os.O_CREAT | getattr(Legacy._os, "O_BINARY", 0)
+            
+            if Atomic:
+                Directory, Name = Legacy._os.path.split(Legacy._os.path.abspath(FileName))
+                self._Target = Legacy._os.path.join(Directory, f".{Name}.{Legacy._os.getpid()}.{Legacy._threading.get_ident()}.tmp")
+                Flags |= Legacy._os.O_EXCL
+                
+            else:
+                Flags |= Legacy._os.O_APPEND if Append else Legacy._os.O_TRUNC
+                
+            self._Descriptor = Legacy._os.open(self._Target, Flags, 0o666)
+
+            if Atomic:
+                try:
+                    # Keep the permissions of the file being replaced.
+                    Legacy._os.chmod(self._Target, Legacy._stat.S_IMODE(Legacy._os.stat(FileName).st_mode))
+                    
+                except FileNotFoundError:
+                    pass
+
+        def Write(self, Data): # type: ignore
+            """System.Explore.BufferedWriter.Write()"""
+            if isinstance(Data, str):
+                if self.Encoding is Null:
+                    raise Fluid.Exception.ArgumentError("This writer only accepts bytes.")
+                
+                Data = Data.encode(self.Encoding)
+                
+            self._Pending.append(Data)
+            self._Size += len(Data)
+            
+            if self._Size >= self.BufferSize:
+                self.Flush()
+                
+            return len(Data)
+
+        def Flush(self): # type: ignore
+            """System.Explore.BufferedWriter.Flush()"""
+            if self._Pending:
+                Data = memoryview(b"".join(self._Pending))
+                self._Pending.clear()
+                self._Size = 0
+                
+                while Data:
+                    Data = Data[Legacy._os.write(self._Descriptor, Data):]
+
+        def Close(self): # type: ignore
+            """System.Explore.BufferedWriter.Close()
+            
+            Write out what is left and, with Atomic, put the file in place.
+            """
+            if self.Closed:
+                return
+            
+            try:
+                self.Flush()
+                
+                if self.Sync or self.Atomic:
+                    Legacy._os.fsync(self._Descriptor)
+                    
+            except:
+                self.Abort()
+                raise
+                
+            self.Closed = True
+            Legacy._os.close(self._Descriptor)
+            
+            if self.Atomic:
+                Legacy._os.replace(self._Target, self.FileName)
+                
+            if self.Sync:
+                Explore._SyncDirectory(Legacy._os.path.dirname(Legacy._os.path.abspath(self.FileName)))
+
+        def Abort(self): # type: ignore
+            """System.Explore.BufferedWriter.Abort()
+            
+            Close the writer without putting an atomic file in place.
+            """
+            if self.Closed:
+                return
+            
+            self.Closed = True
+            Legacy._os.close(self._Descriptor)
+            
+            if self.Atomic:
+                Legacy._os.unlink(self._Target)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, Type, *Details):
+            if Type is not None and self.Atomic:
+                self.Abort()
+            else:
+                self.Close()
+
+    class _SyncedFile(Legacy._io.FileIO):
+        # The raw file under the file objects System.Explore.Write() returns with Atomic or Sync.
+        
+        def __init__(self, FileName: str, Atomic: bool, Sync: bool):
+            self.FileName = FileName
+            self.Atomic = Atomic
+            self.Sync = Sync
+            Target = FileName
+            
+            if Atomic:
+                Directory, Name = Legacy._os.path.split(Legacy._os.path.abspath(FileName))
+                Target = Legacy._os.path.join(Directory, f".{Name}.{Legacy._os.getpid()}.{Legacy._threading.get_ident()}.tmp")
+                
+            super().__init__(Target, "x" if Atomic else "w")
+
+            if Atomic:
+                try:
+                    # Keep the permissions of the file being replaced.
+                    Legacy._os.chmod(Target, Legacy._stat.S_IMODE(Legacy._os.stat(FileName).st_mode))
+                    
+                except FileNotFoundError:
+                    pass
+
+        def close(self):
+            if self.closed:
+                return
+            
+            try:
+                Legacy._os.fsync(self.fileno())
+                
+            except:
+                super().close()
+                
+                if self.Atomic:
+                    Legacy._os.unlink(self.name)
+                    
+                raise
+            
+            super().close()
+            
+            if self.Atomic:
+                Legacy._os.replace(self.name, self.FileName)
+                
+            if self.Sync:
+                Explore._SyncDirectory(Legacy._os.path.dirname(Legacy._os.path.abspath(self.FileName)))
+
+    def _SyncDirectory(Directory: str):
+        # Makes renames and new files in Directory durable; directories cannot be opened for this on Windows.
+        if Legacy._os.name == "nt":
+            return
+        
+        Descriptor = Legacy._os.open(Directory, Legacy._os.O_RDONLY)
+        
+        try:
+            Legacy._os.fsync(Descriptor)
+            
+        finally:
+            Legacy._os.close(Descriptor)
+
+    def Batch(Files: dict, Atomic: bool = False, Sync: bool = False, FileEncoding = "utf-8"): # type: ignore
+        """System.Explore.Batch()
+
+        Write many small files at once; Files maps each file name to its contents (text or bytes).
+        Files are written with a bare open, write and close each, parent directories are made once, and with Sync or Atomic each file is synced before the (atomic) renames, and its directory after them.
+        Returns the number of files written.
+        """
+        Made = set()
+        Written = []
+        Flags = Legacy._os.O_WRONLY | Legacy._os.O_CREAT | Legacy._os.O_TRUNC | getattr(Legacy._os, "O_BINARY", 0)
+        
+        try:
+            for FileName, Data in Files.items():
+                Directory = Legacy._os.path.dirname(FileName)
+                
+                if Directory and Directory not in Made:
+                    Legacy._os.makedirs(Directory, exist_ok = True)
+                    Made.add(Directory)
+                    
+                if isinstance(Data, str):
+                    Data = Data.encode(FileEncoding)
+                    
+                Target = f"{FileName}.{Legacy._os.getpid()}.{Legacy._threading.get_ident()}.tmp" if Atomic else FileName
+                Descriptor = Legacy._os.open(Target, Flags, 0o666)
+                Written.append((Target, FileName))
+                
+                try:
+                    Data = memoryview(Data)
+                    
+                    while Data:
+                        Data = Data[Legacy._os.write(Descriptor, Data):]
+                        
+                    if Sync or Atomic:
+                        Legacy._os.fsync(Descriptor)
+                        
+                finally:
+                    Legacy._os.close(Descriptor)
+
+        except:
+            if Atomic:
+                for Target, _ in Written:
+                    try:
+                        Legacy._os.unlink(Target)
+                        
+                    except OSError:
+                        pass
+                    
+            raise
+
+        if Atomic:
+            for Target, FileName in Written:
+                Legacy._os.replace(Target, FileName)
+
+        if Sync or Atomic:
+            for Directory in {Legacy._os.path.dirname(Legacy._os.path.abspath(FileName)) for _, FileName in Written}:
+                Explore._SyncDirectory(Directory)
+                
+        return len(Written)
 
     def Append(self): # type: ignore
         """System.Explore.Append()
@@ -636,23 +1662,24 @@ def Append(self): # type: ignore
         Foundation method for the purpose of a allowing the developer to append to files on the end-user's computer.
         """
         if self.Auto == False:
-            return open(self.FileName, "a", encoding = self.FileEncoding)
+            return self.Open("a")
         else:
-            return open(self.FileName, "a", encoding = self.FileEncoding).write(self.AutoValue)
+            with self.Open("a") as File:
+                return File.write(self.AutoValue)
 
     def Create(self): # type: ignore
         """System.Explore.Create()
 
         Foundation method for the purpose of a allowing the developer to create files on the end-user's computer.
         """
-        return open(self.FileName, "x", encoding = self.FileEncoding)
+        return self.Open("x")
 
     def Access(self): # type: ignore
         """System.Explore.Access()
 
         Foundation method for the purpose of a allowing the developer to access files completely on the end-user's computer.
         """
-        return open(self.FileName, "r+", encoding = self.FileEncoding)
+        return self.Open("r+")
 
 class Packaging:
     """System.Packaging
@@ -666,10 +1693,14 @@ class License():
         Foundation class object which defines a license and its metadata.
         """
         
-        def __init__(self, Name: str, CopyrightHolder: str, Contents: str = "", Year = Chronology.Time().Year):
+        def __init__(self, Name: str, CopyrightHolder: str, Contents: str = "", Year = Null):
+            """System.Packaging.License.__init__
+            
+            📝 Year defaults to the current year.
+            """
             self.Name = Name
             self.CopyrightHolder = CopyrightHolder
-            self.Year = Year
+            self.Year = Chronology.Time().Year if Year is Null else Year
             
             if Contents != Null:
                 self.Contents = Contents
@@ -10,15 +10,20 @@
 from .events import *
 from .exceptions import *
 from .futures import *
+from .instrumentation import *
 from .locks import *
 from .protocols import *
 from .runners import *
+from .pools import *
 from .queues import *
+from .resolvers import *
 from .streams import *
 from .subprocess import *
+from .supervisor import *
 from .tasks import *
 from .taskgroups import *
 from .timeouts import *
+from .timerwheel import *
 from .threads import *
 from .transports import *
 
@@ -27,15 +32,20 @@
            events.__all__ +
            exceptions.__all__ +
            futures.__all__ +
+           instrumentation.__all__ +
            locks.__all__ +
            protocols.__all__ +
            runners.__all__ +
+           pools.__all__ +
            queues.__all__ +
+           resolvers.__all__ +
            streams.__all__ +
            subprocess.__all__ +
+           supervisor.__all__ +
            tasks.__all__ +
            threads.__all__ +
            timeouts.__all__ +
+           timerwheel.__all__ +
            transports.__all__)
 
 if sys.platform == 'win32':  # pragma: no cover
@@ -40,10 +40,12 @@
 from . import events
 from . import exceptions
 from . import futures
+from . import instrumentation
 from . import protocols
 from . import sslproto
 from . import staggered
 from . import tasks
+from . import timerwheel
 from . import transports
 from . import trsock
 from .log import logger
@@ -278,6 +280,7 @@ def __init__(self, loop, sockets, protocol_factory, ssl_context, backlog,
         self._loop = loop
         self._sockets = sockets
         self._active_count = 0
+        self._accepted_count = 0
         self._waiters = []
         self._protocol_factory = protocol_factory
         self._backlog = backlog
@@ -293,6 +296,7 @@ def __repr__(self):
     def _attach(self):
         assert self._sockets is not None
         self._active_count += 1
+        self._accepted_count += 1
 
     def _detach(self):
         assert self._active_count > 0
@@ -392,6 +396,9 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        self._timer_wheel = None
+        self._resolver = None
+        self._instrument = None
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -677,6 +684,8 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.clear()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
@@ -744,7 +753,10 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is None:
+            heapq.heappush(self._scheduled, timer)
+        else:
+            self._timer_wheel.add(timer, self.time())
         timer._scheduled = True
         return timer
 
@@ -859,6 +871,11 @@ def _getaddrinfo_debug(self, host, port, family, type, proto, flags):
 
     async def getaddrinfo(self, host, port, *,
                           family=0, type=0, proto=0, flags=0):
+        if self._resolver is not None:
+            return await self._resolver.getaddrinfo(
+                host, port, family=family, type=type, proto=proto,
+                flags=flags)
+
         if self._debug:
             getaddr_func = self._getaddrinfo_debug
         else:
@@ -867,6 +884,30 @@ async def getaddrinfo(self, host, port, *,
         return await self.run_in_executor(
             None, getaddr_func, host, port, family, type, proto, flags)
 
+    def get_resolver(self):
+        """Return the resolver used by getaddrinfo().
+
+        Return None if getaddrinfo() calls socket.getaddrinfo() in the
+        default executor (the default).
+        """
+        return self._resolver
+
+    def set_resolver(self, resolver):
+        """Resolve host names with resolver in getaddrinfo().
+
+        resolver must have a getaddrinfo() coroutine method accepting
+        the arguments of loop.getaddrinfo(), see for example
+        asyncio.CachingResolver.  getaddrinfo() is used by all the
+        methods of the loop that resolve host names.
+
+        If resolver is None, switch back to the default behavior.
+        """
+        if (resolver is not None and
+                not callable(getattr(resolver, 'getaddrinfo', None))):
+            raise TypeError('resolver must have a getaddrinfo() method '
+                            'or be None')
+        self._resolver = resolver
+
     async def getnameinfo(self, sockaddr, flags=0):
         return await self.run_in_executor(
             None, socket.getnameinfo, sockaddr, flags)
@@ -1837,10 +1878,70 @@ def _add_callback_signalsafe(self, handle):
         self._add_callback(handle)
         self._write_to_self()
 
+    def get_timer_wheel(self):
+        """Return the TimerWheel used to schedule timed callbacks.
+
+        Return None if timed callbacks are kept in a heap (the default).
+        """
+        return self._timer_wheel
+
+    def set_timer_wheel(self, wheel):
+        """Schedule timed callbacks with a TimerWheel instead of a heap.
+
+        A timer wheel makes scheduling and cancelling timed callbacks
+        O(1), at the cost of firing them up to one wheel tick late.  It
+        suits loops with a very large number of frequently rescheduled
+        timeouts.  Already scheduled callbacks are moved over.
+
+        If wheel is None, switch back to the default heap.
+        """
+        if wheel is not None and not isinstance(wheel, timerwheel.TimerWheel):
+            raise TypeError('wheel must be a TimerWheel or None')
+        self._check_closed()
+        if wheel is self._timer_wheel:
+            return
+        if self._timer_wheel is None:
+            handles = [handle for handle in self._scheduled
+                       if not handle._cancelled]
+            self._scheduled = []
+            self._timer_cancelled_count = 0
+        else:
+            handles = self._timer_wheel.handles()
+            self._timer_wheel.clear()
+        self._timer_wheel = wheel
+        if wheel is None:
+            heapq.heapify(handles)
+            self._scheduled = handles
+        else:
+            now = self.time()
+            for handle in handles:
+                wheel.add(handle, now)
+        for handle in handles:
+            handle._scheduled = True
+
+    def get_instrument(self):
+        """Return the LoopInstrument attached to the loop, or None."""
+        return self._instrument
+
+    def set_instrument(self, instrument):
+        """Report the activity of the loop to a LoopInstrument.
+
+        The instrument is told about every iteration of the loop and,
+        if it samples callbacks, about the time sampled callbacks take.
+        If instrument is None, stop reporting.
+        """
+        if (instrument is not None and
+                not isinstance(instrument, instrumentation.LoopInstrument)):
+            raise TypeError('instrument must be a LoopInstrument or None')
+        self._instrument = instrument
+
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            if self._timer_wheel is None:
+                self._timer_cancelled_count += 1
+            elif self._timer_wheel.remove(handle):
+                handle._scheduled = False
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1849,6 +1950,9 @@ def _run_once(self):
         schedules the resulting callbacks, and finally schedules
         'call_later' callbacks.
         """
+        instrument = self._instrument
+        if instrument is not None:
+            t0 = time.perf_counter()
 
         sched_count = len(self._scheduled)
         if (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
@@ -1873,6 +1977,9 @@ def _run_once(self):
                 handle = heapq.heappop(self._scheduled)
                 handle._scheduled = False
 
+        # A timer wheel removes cancelled handles immediately.
+        wheel = self._timer_wheel
+
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
@@ -1880,14 +1987,26 @@ def _run_once(self):
             # Compute the desired timeout.
             when = self._scheduled[0]._when
             timeout = min(max(0, when - self.time()), MAXIMUM_SELECT_TIMEOUT)
-
-        event_list = self._selector.select(timeout)
+        elif wheel is not None:
+            when = wheel.next_deadline()
+            if when is not None:
+                timeout = min(max(0, when - self.time()),
+                              MAXIMUM_SELECT_TIMEOUT)
+
+        if instrument is not None:
+            t1 = time.perf_counter()
+            event_list = self._selector.select(timeout)
+            select_time = time.perf_counter() - t1
+        else:
+            event_list = self._selector.select(timeout)
         self._process_events(event_list)
         # Needed to break cycles when an exception occurs.
         event_list = None
 
         # Handle 'later' callbacks that are ready.
         end_time = self.time() + self._clock_resolution
+        if wheel is not None:
+            self._ready.extend(wheel.pop_expired(end_time))
         while self._scheduled:
             handle = self._scheduled[0]
             if handle._when >= end_time:
@@ -1903,25 +2022,72 @@ def _run_once(self):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
         ntodo = len(self._ready)
+        if instrument is not None:
+            t2 = time.perf_counter()
+            ready_count = ntodo
+            if instrument._task_sample_interval:
+                self._run_ready_sampled(ntodo, instrument)
+                ntodo = 0
         for i in range(ntodo):
             handle = self._ready.popleft()
             if handle._cancelled:
                 continue
             if self._debug:
-                try:
-                    self._current_handle = handle
-                    t0 = self.time()
-                    handle._run()
-                    dt = self.time() - t0
-                    if dt >= self.slow_callback_duration:
-                        logger.warning('Executing %s took %.3f seconds',
-                                       _format_handle(handle), dt)
-                finally:
-                    self._current_handle = None
+                self._run_handle_debug(handle)
             else:
                 handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
 
+        if instrument is not None:
+            t3 = time.perf_counter()
+            instrument.iteration_done(t3 - t0, select_time, t3 - t2,
+                                      ready_count)
+
+    def _run_handle_debug(self, handle):
+        try:
+            self._current_handle = handle
+            t0 = self.time()
+            handle._run()
+            dt = self.time() - t0
+            if dt >= self.slow_callback_duration:
+                logger.warning('Executing %s took %.3f seconds',
+                               _format_handle(handle), dt)
+        finally:
+            self._current_handle = None
+
+    def _run_ready_sampled(self, ntodo, instrument):
+        # Run ntodo ready callbacks like _run_once() does, timing every
+        # task_sample_interval-th one for the instrument.
+        countdown = instrument._sample_countdown
+        try:
+            for i in range(ntodo):
+                handle = self._ready.popleft()
+                if handle._cancelled:
+                    continue
+                countdown -= 1
+                if countdown:
+                    if self._debug:
+                        self._run_handle_debug(handle)
+                    else:
+                        handle._run()
+                    continue
+                countdown = instrument._task_sample_interval
+                task = getattr(handle._callback, '__self__', None)
+                if not isinstance(task, tasks.Task):
+                    task = None
+                c0 = time.thread_time()
+                t0 = time.perf_counter()
+                if self._debug:
+                    self._run_handle_debug(handle)
+                else:
+                    handle._run()
+                wall_time = time.perf_counter() - t0
+                instrument.callback_sampled(handle, task,
+                                            time.thread_time() - c0,
+                                            wall_time)
+        finally:
+            instrument._sample_countdown = countdown
+
     def _set_coroutine_origin_tracking(self, enabled):
         if bool(enabled) == bool(self._coroutine_origin_tracking_enabled):
             return
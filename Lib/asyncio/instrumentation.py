@@ -0,0 +1,155 @@
+"""Low-overhead instrumentation of the event loop."""
+
+__all__ = ('LoopInstrument', 'Histogram')
+
+
+# Number of buckets of a Histogram; the last one also counts the values
+# beyond its upper bound.
+_BUCKETS = 64
+
+
+class Histogram:
+    """A histogram with power-of-two buckets.
+
+    Values are counted in buckets whose upper bounds are unit, 2*unit,
+    4*unit, ...; the first bucket holds the values below unit.  The
+    default unit suits durations in seconds.
+    """
+
+    def __init__(self, unit=1e-6):
+        if unit <= 0:
+            raise ValueError('unit must be greater than zero')
+        self._unit = unit
+        self._scale = 1 / unit
+        self._buckets = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def __repr__(self):
+        if not self.count:
+            return f'<{self.__class__.__name__} count=0>'
+        return (f'<{self.__class__.__name__} count={self.count} '
+                f'mean={self.mean():.6g} p99={self.percentile(99):.6g} '
+                f'max={self.max:.6g}>')
+
+    def add(self, value):
+        """Count value."""
+        index = int(value * self._scale).bit_length()
+        if index >= _BUCKETS:
+            index = _BUCKETS - 1
+        self._buckets[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def mean(self):
+        """Return the mean of the values, or 0 if there are none."""
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, p):
+        """Return an upper bound of the p-th percentile of the values.
+
+        The bound is the upper bound of the bucket holding the
+        percentile, but never more than the largest value.
+        """
+        if not 0 <= p <= 100:
+            raise ValueError('p must be between 0 and 100')
+        rank = self.count * p / 100
+        seen = 0
+        for index, n in enumerate(self._buckets):
+            seen += n
+            if n and seen >= rank:
+                return min(self._unit * (1 << index), self.max)
+        return self.max
+
+    def buckets(self):
+        """Return a list of (upper bound, count) pairs.
+
+        The list ends with the bucket of the largest value.
+        """
+        used = len(self._buckets)
+        while used and not self._buckets[used - 1]:
+            used -= 1
+        return [(self._unit * (1 << index), self._buckets[index])
+                for index in range(used)]
+
+    def clear(self):
+        """Forget all values."""
+        self._buckets = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+
+class LoopInstrument:
+    """Collect statistics about the iterations of an event loop.
+
+    Use loop.set_instrument() to attach an instrument to a loop.  For
+    every iteration, the loop calls iteration_done() with the duration of
+    the iteration, the time spent waiting for I/O in the selector, the
+    time spent running callbacks and the number of callbacks that were
+    ready.  By default they are counted in the iteration_time,
+    select_time, callback_time and ready_count histograms.
+
+    If task_sample_interval is a positive integer N, every N-th callback
+    is timed and callback_sampled() is called with the handle, the task
+    it belongs to (or None) and the CPU and wall-clock times it took.  By
+    default the CPU time is counted in the cpu_time dict, mapping the
+    qualified name of the task's coroutine, or of the callback, to a
+    histogram: the names with the largest totals are the coroutines that
+    block the loop.
+
+    Subclasses may override iteration_done() and callback_sampled() to
+    export the measurements elsewhere.
+    """
+
+    def __init__(self, *, task_sample_interval=0):
+        if task_sample_interval < 0:
+            raise ValueError('task_sample_interval must not be negative')
+        self._task_sample_interval = task_sample_interval
+        # Callbacks left to run before the next sample.
+        self._sample_countdown = task_sample_interval
+        self.iteration_time = Histogram()
+        self.select_time = Histogram()
+        self.callback_time = Histogram()
+        self.ready_count = Histogram(unit=1)
+        self.cpu_time = {}
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} '
+                f'iterations={self.iteration_time.count} '
+                f'task_sample_interval={self._task_sample_interval}>')
+
+    @property
+    def task_sample_interval(self):
+        return self._task_sample_interval
+
+    def iteration_done(self, iteration_time, select_time, callback_time,
+                       ready_count):
+        """Called by the loop at the end of every iteration."""
+        self.iteration_time.add(iteration_time)
+        self.select_time.add(select_time)
+        self.callback_time.add(callback_time)
+        self.ready_count.add(ready_count)
+
+    def callback_sampled(self, handle, task, cpu_time, wall_time):
+        """Called by the loop after running a sampled callback."""
+        if task is not None:
+            coro = task.get_coro()
+            name = getattr(coro, '__qualname__', None) or repr(coro)
+        else:
+            callback = handle._callback
+            name = getattr(callback, '__qualname__', None) or repr(callback)
+        histogram = self.cpu_time.get(name)
+        if histogram is None:
+            histogram = self.cpu_time[name] = Histogram()
+        histogram.add(cpu_time)
+
+    def clear(self):
+        """Forget all measurements."""
+        for histogram in (self.iteration_time, self.select_time,
+                          self.callback_time, self.ready_count):
+            histogram.clear()
+        self.cpu_time.clear()
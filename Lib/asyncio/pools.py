@@ -0,0 +1,329 @@
+"""A pool of reusable stream connections."""
+
+__all__ = ('ConnectionPool', 'PooledConnection')
+
+import collections
+import inspect
+
+from . import mixins
+from . import streams
+
+
+class PooledConnection:
+    """A connection checked out of a ConnectionPool.
+
+    reader and writer are the StreamReader and StreamWriter of the
+    connection, and key is the (host, port, ssl) tuple it was opened for.
+    """
+
+    def __init__(self, pool, key, reader, writer):
+        self._pool = pool
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        self._idle_since = None
+        self._in_use = True
+
+    def __repr__(self):
+        state = 'in use' if self._in_use else 'idle'
+        return f'<{self.__class__.__name__} key={self.key!r} {state}>'
+
+
+class _Key:
+    # Per (host, port, ssl) state of a ConnectionPool.
+
+    def __init__(self):
+        # Idle connections, the most recently released last.
+        self.idle = collections.deque()
+        # Futures of the acquire() calls waiting for a connection.
+        self.waiters = collections.deque()
+        # Open connections, including the ones being opened.
+        self.count = 0
+
+
+class _ConnectionContextManager:
+
+    def __init__(self, pool, host, port, ssl):
+        self._pool = pool
+        self._args = (host, port, ssl)
+        self._conn = None
+
+    async def __aenter__(self):
+        host, port, ssl = self._args
+        self._conn = await self._pool.acquire(host, port, ssl=ssl)
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # The state of the protocol is unknown after an error.
+        self._pool.release(self._conn, discard=exc_type is not None)
+        self._conn = None
+
+
+class ConnectionPool(mixins._LoopBoundMixin):
+    """A pool of stream connections keyed by (host, port, ssl).
+
+    At most limit_per_key connections are open for each key; acquire()
+    calls beyond that wait for a connection to be released, and are
+    served in the order they started waiting.  Released connections are
+    kept idle for reuse and closed after idle_timeout seconds.
+
+    Before an idle connection is handed out, it is checked: connections
+    closed or with unread data are discarded.  health_check, if given, is
+    then called with the PooledConnection; it may be a coroutine
+    function, and must return a false value for connections that should
+    be discarded.
+
+    Other keyword arguments are passed to open_connection().
+    """
+
+    def __init__(self, *, limit_per_key=10, idle_timeout=60.0,
+                 health_check=None, **connect_kwargs):
+        if limit_per_key < 1:
+            raise ValueError('limit_per_key must be at least 1')
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError('idle_timeout must not be negative')
+        self._limit_per_key = limit_per_key
+        self._idle_timeout = idle_timeout
+        self._health_check = health_check
+        self._connect_kwargs = connect_kwargs
+        self._keys = {}
+        self._sweep_handle = None
+        self._closed = False
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+
+    def __repr__(self):
+        info = [f'limit_per_key={self._limit_per_key}',
+                f'idle_timeout={self._idle_timeout}']
+        if self._closed:
+            info.append('closed')
+        else:
+            info.append(f'keys={len(self._keys)}')
+        return f'<{self.__class__.__name__} {" ".join(info)}>'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def statistics(self):
+        """Return a dict with the pool statistics.
+
+        connections is the number of open connections, idle how many of
+        them are idle, waiting the number of acquire() calls waiting for a
+        connection, created the number of connections opened, reused the
+        number of idle connections handed out again and discarded the
+        number of connections closed by the pool.
+        """
+        return {
+            'connections': sum(state.count for state in self._keys.values()),
+            'idle': sum(len(state.idle) for state in self._keys.values()),
+            'waiting': sum(len(state.waiters)
+                           for state in self._keys.values()),
+            'created': self._created,
+            'reused': self._reused,
+            'discarded': self._discarded,
+        }
+
+    def connection(self, host, port, *, ssl=None):
+        """Return an asynchronous context manager for a connection.
+
+        The connection is acquired on entry and released on exit.  It is
+        discarded instead if the block raises an exception.
+        """
+        return _ConnectionContextManager(self, host, port, ssl)
+
+    async def acquire(self, host, port, *, ssl=None):
+        """Return a PooledConnection to host and port.
+
+        Reuse an idle connection if a healthy one is available, else open
+        a new connection, waiting first if limit_per_key connections to
+        host and port are already open.  The connection must be given
+        back with release().
+        """
+        self._check_closed()
+        key = (host, port, ssl or None)
+        state = self._keys.get(key)
+        if state is None:
+            state = self._keys[key] = _Key()
+
+        if state.idle:
+            conn = state.idle.pop()
+            if await self._checkout(conn):
+                return conn
+            # Open a new connection in place of the discarded one.
+            return await self._open(key, state)
+
+        if state.count < self._limit_per_key:
+            state.count += 1
+            return await self._open(key, state)
+
+        waiter = self._get_loop().create_future()
+        state.waiters.append(waiter)
+        try:
+            conn = await waiter
+        except:
+            if (waiter.done() and not waiter.cancelled() and
+                    waiter.exception() is None):
+                # A connection or a slot was handed over to us but we
+                # were cancelled: pass it on.
+                self._hand_over(state, waiter.result())
+            else:
+                try:
+                    state.waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+        if conn is not None and await self._checkout(conn):
+            return conn
+        return await self._open(key, state)
+
+    def release(self, conn, *, discard=False):
+        """Give a connection back to the pool.
+
+        The connection is kept for reuse unless discard is true, the
+        connection is closed or has unread data, or the pool is closed.
+        """
+        if conn._pool is not self:
+            raise ValueError(f'{conn!r} does not belong to this pool')
+        if not conn._in_use:
+            raise RuntimeError(f'{conn!r} was already released')
+        conn._in_use = False
+        state = self._keys[conn.key]
+        if discard or self._closed or not self._is_reusable(conn):
+            self._discard(conn)
+            self._hand_over(state, None)
+        else:
+            self._hand_over(state, conn)
+
+    async def close(self):
+        """Close the idle connections and refuse new acquire() calls.
+
+        Waiting acquire() calls raise RuntimeError.  Connections in use
+        are closed when they are released.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._sweep_handle is not None:
+            self._sweep_handle.cancel()
+            self._sweep_handle = None
+        writers = []
+        for state in self._keys.values():
+            while state.waiters:
+                waiter = state.waiters.popleft()
+                if not waiter.done():
+                    waiter.set_exception(
+                        RuntimeError('ConnectionPool is closed'))
+            while state.idle:
+                conn = state.idle.popleft()
+                self._discard(conn)
+                state.count -= 1
+                writers.append(conn.writer)
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def _check_closed(self):
+        if self._closed:
+            raise RuntimeError('ConnectionPool is closed')
+
+    async def _open(self, key, state):
+        # Open a connection for a slot already counted in state.count.
+        host, port, ssl = key
+        try:
+            reader, writer = await streams.open_connection(
+                host, port, ssl=ssl, **self._connect_kwargs)
+        except:
+            self._hand_over(state, None)
+            raise
+        self._created += 1
+        if self._closed:
+            writer.close()
+            state.count -= 1
+            self._check_closed()
+        return PooledConnection(self, key, reader, writer)
+
+    async def _checkout(self, conn):
+        # Mark an idle connection in use and check it, discarding it if
+        # it is unhealthy.  Its slot stays counted in any case.
+        conn._in_use = True
+        conn._idle_since = None
+        healthy = self._is_reusable(conn)
+        if healthy and self._health_check is not None:
+            try:
+                healthy = self._health_check(conn)
+                if inspect.isawaitable(healthy):
+                    healthy = await healthy
+            except:
+                self._discard(conn)
+                self._hand_over(self._keys[conn.key], None)
+                raise
+        if healthy:
+            self._reused += 1
+            return True
+        self._discard(conn)
+        return False
+
+    def _is_reusable(self, conn):
+        reader = conn.reader
+        return not (conn.writer.is_closing() or reader._eof or
+                    reader.exception() is not None or
+                    _has_unread_data(reader))
+
+    def _discard(self, conn):
+        conn._in_use = False
+        conn.writer.close()
+        self._discarded += 1
+
+    def _hand_over(self, state, conn):
+        # Give conn, or its slot if conn is None, to the first waiter.
+        # Without waiters, keep conn idle or free the slot.
+        while state.waiters:
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(conn)
+                return
+        if conn is None or self._closed:
+            if conn is not None:
+                self._discard(conn)
+            state.count -= 1
+        else:
+            conn._idle_since = self._get_loop().time()
+            state.idle.append(conn)
+            self._schedule_sweep()
+
+    def _schedule_sweep(self):
+        if self._sweep_handle is None and self._idle_timeout is not None:
+            self._sweep_handle = self._get_loop().call_later(
+                self._idle_timeout, self._sweep)
+
+    def _sweep(self):
+        # Close the connections idle for idle_timeout seconds.
+        self._sweep_handle = None
+        deadline = self._get_loop().time() - self._idle_timeout
+        oldest = None
+        for key, state in list(self._keys.items()):
+            idle = state.idle
+            while idle and idle[0]._idle_since <= deadline:
+                self._discard(idle.popleft())
+                state.count -= 1
+            if idle:
+                since = idle[0]._idle_since
+                if oldest is None or since < oldest:
+                    oldest = since
+            elif not state.count and not state.waiters:
+                del self._keys[key]
+        if oldest is not None:
+            self._sweep_handle = self._get_loop().call_at(
+                oldest + self._idle_timeout, self._sweep)
+
+
+def _has_unread_data(reader):
+    if isinstance(reader, streams.BufferedStreamReader):
+        return reader._end > reader._start
+    return bool(reader._buffer)
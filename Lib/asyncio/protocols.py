@@ -167,6 +167,17 @@ class DatagramProtocol(BaseProtocol):
     def datagram_received(self, data, addr):
         """Called when some datagram is received."""
 
+    def datagrams_received(self, datagrams):
+        """Called when several datagrams are received at once.
+
+        datagrams is a list of (data, addr) tuples.  This is only called
+        by transports reading datagrams in batches, see
+        DatagramTransport.set_read_batch_size().  The default
+        implementation calls datagram_received() for each datagram.
+        """
+        for data, addr in datagrams:
+            self.datagram_received(data, addr)
+
     def error_received(self, exc):
         """Called when a send or receive operation raises an OSError.
 
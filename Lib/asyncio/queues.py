@@ -2,10 +2,12 @@
 
 import collections
 import heapq
+import math
 from types import GenericAlias
 
 from . import locks
 from . import mixins
+from .tasks import _release_waiter
 
 
 class QueueEmpty(Exception):
@@ -63,6 +65,14 @@ def _wakeup_next(self, waiters):
                 waiter.set_result(None)
                 break
 
+    def _wakeup_many(self, waiters, count):
+        # Wake up the next count waiters (if any) that aren't cancelled.
+        while count and waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
     def __repr__(self):
         return f'<{type(self).__name__} at {id(self):#x} {self._format()}>'
 
@@ -107,6 +117,26 @@ def full(self):
         else:
             return self.qsize() >= self._maxsize
 
+    async def _wait_for_free_slot(self):
+        putter = self._get_loop().create_future()
+        self._putters.append(putter)
+        try:
+            await putter
+        except:
+            putter.cancel()  # Just in case putter is not done yet.
+            try:
+                # Clean self._putters from canceled putters.
+                self._putters.remove(putter)
+            except ValueError:
+                # The putter could be removed from self._putters by a
+                # previous get_nowait call.
+                pass
+            if not self.full() and not putter.cancelled():
+                # We were woken up by get_nowait(), but can't take
+                # the call.  Wake up the next in line.
+                self._wakeup_next(self._putters)
+            raise
+
     async def put(self, item):
         """Put an item into the queue.
 
@@ -114,24 +144,7 @@ async def put(self, item):
         slot is available before adding item.
         """
         while self.full():
-            putter = self._get_loop().create_future()
-            self._putters.append(putter)
-            try:
-                await putter
-            except:
-                putter.cancel()  # Just in case putter is not done yet.
-                try:
-                    # Clean self._putters from canceled putters.
-                    self._putters.remove(putter)
-                except ValueError:
-                    # The putter could be removed from self._putters by a
-                    # previous get_nowait call.
-                    pass
-                if not self.full() and not putter.cancelled():
-                    # We were woken up by get_nowait(), but can't take
-                    # the call.  Wake up the next in line.
-                    self._wakeup_next(self._putters)
-                raise
+            await self._wait_for_free_slot()
         return self.put_nowait(item)
 
     def put_nowait(self, item):
@@ -146,30 +159,76 @@ def put_nowait(self, item):
         self._finished.clear()
         self._wakeup_next(self._getters)
 
+    async def put_many(self, items):
+        """Put all items of an iterable into the queue, in order.
+
+        Items are added in batches as large as the free space allows, and
+        each batch wakes up at most as many getters as it has items.  If
+        the queue becomes full, wait until free slots are available before
+        adding the remaining items.  If put_many() is cancelled while
+        waiting, the items added so far stay in the queue.
+        """
+        items = list(items)
+        count = len(items)
+        start = 0
+        while start < count:
+            while self.full():
+                await self._wait_for_free_slot()
+            if self._maxsize <= 0:
+                stop = count
+            else:
+                # maxsize may be a float; full() admits items while
+                # qsize() < maxsize, so round the free space up.
+                free = math.ceil(self._maxsize - self.qsize())
+                stop = min(count, start + free)
+            put = self._put
+            for i in range(start, stop):
+                put(items[i])
+            added = stop - start
+            start = stop
+            self._unfinished_tasks += added
+            self._finished.clear()
+            self._wakeup_many(self._getters, added)
+
+    async def _wait_for_item(self, deadline=None):
+        loop = self._get_loop()
+        getter = loop.create_future()
+        self._getters.append(getter)
+        if deadline is not None:
+            timeout_handle = loop.call_at(deadline, _release_waiter, getter)
+        try:
+            await getter
+        except:
+            getter.cancel()  # Just in case getter is not done yet.
+            try:
+                # Clean self._getters from canceled getters.
+                self._getters.remove(getter)
+            except ValueError:
+                # The getter could be removed from self._getters by a
+                # previous put_nowait call.
+                pass
+            if not self.empty() and not getter.cancelled():
+                # We were woken up by put_nowait(), but can't take
+                # the call.  Wake up the next in line.
+                self._wakeup_next(self._getters)
+            raise
+        finally:
+            if deadline is not None:
+                timeout_handle.cancel()
+        if deadline is not None and self.empty():
+            try:
+                # Released by the timeout: clean self._getters.
+                self._getters.remove(getter)
+            except ValueError:
+                pass
+
     async def get(self):
         """Remove and return an item from the queue.
 
         If queue is empty, wait until an item is available.
         """
         while self.empty():
-            getter = self._get_loop().create_future()
-            self._getters.append(getter)
-            try:
-                await getter
-            except:
-                getter.cancel()  # Just in case getter is not done yet.
-                try:
-                    # Clean self._getters from canceled getters.
-                    self._getters.remove(getter)
-                except ValueError:
-                    # The getter could be removed from self._getters by a
-                    # previous put_nowait call.
-                    pass
-                if not self.empty() and not getter.cancelled():
-                    # We were woken up by put_nowait(), but can't take
-                    # the call.  Wake up the next in line.
-                    self._wakeup_next(self._getters)
-                raise
+            await self._wait_for_item()
         return self.get_nowait()
 
     def get_nowait(self):
@@ -183,6 +242,37 @@ def get_nowait(self):
         self._wakeup_next(self._putters)
         return item
 
+    async def get_many(self, max_items=None, timeout=None):
+        """Remove and return a list of items from the queue.
+
+        Return up to max_items items (all available items if max_items is
+        None) as soon as at least one item is available, and wake up at
+        most as many putters as items were removed.  If the queue is empty,
+        wait until an item is available, or until timeout seconds have
+        passed; on timeout, return an empty list.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError('max_items must be at least 1')
+        if self.empty():
+            if timeout is None:
+                deadline = None
+            elif timeout <= 0:
+                return []
+            else:
+                deadline = self._get_loop().time() + timeout
+            while self.empty():
+                await self._wait_for_item(deadline)
+                if (self.empty() and deadline is not None and
+                        self._get_loop().time() >= deadline):
+                    return []
+        count = self.qsize()
+        if max_items is not None and max_items < count:
+            count = max_items
+        get = self._get
+        items = [get() for _ in range(count)]
+        self._wakeup_many(self._putters, count)
+        return items
+
     def task_done(self):
         """Indicate that a formerly enqueued task is complete.
 
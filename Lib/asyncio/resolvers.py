@@ -0,0 +1,218 @@
+"""Pluggable host name resolvers for the event loop."""
+
+__all__ = ('ThreadedResolver', 'HostsResolver', 'CachingResolver')
+
+import collections
+import socket
+
+from . import events
+from . import tasks
+
+
+class ThreadedResolver:
+    """Resolver calling socket.getaddrinfo() in the default executor.
+
+    This is what the event loop does when no resolver is set.
+    """
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}>'
+
+    async def getaddrinfo(self, host, port, *,
+                          family=0, type=0, proto=0, flags=0):
+        loop = events.get_running_loop()
+        return await loop.run_in_executor(
+            None, socket.getaddrinfo, host, port, family, type, proto, flags)
+
+
+class HostsResolver:
+    """Resolver answering from a static table, like /etc/hosts.
+
+    hosts maps host names to lists of IP addresses.  Use from_file() or
+    from_text() to build the table from hosts(5) formatted data.  Unknown
+    names raise socket.gaierror with EAI_NONAME; no query ever leaves the
+    process, which makes this resolver suitable for tests and for static
+    overrides.  The queries attribute counts the lookups answered.
+    """
+
+    def __init__(self, hosts):
+        self._hosts = {name.lower(): list(addresses)
+                       for name, addresses in hosts.items()}
+        self.queries = 0
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} hosts={len(self._hosts)}>'
+
+    @classmethod
+    def from_text(cls, text):
+        """Build a resolver from the contents of a hosts(5) file."""
+        hosts = {}
+        for line in text.splitlines():
+            fields = line.split('#', 1)[0].split()
+            if len(fields) < 2:
+                continue
+            address, *names = fields
+            for name in names:
+                hosts.setdefault(name.lower(), []).append(address)
+        return cls(hosts)
+
+    @classmethod
+    def from_file(cls, path='/etc/hosts'):
+        """Build a resolver from a hosts(5) file."""
+        with open(path, encoding='utf-8') as f:
+            return cls.from_text(f.read())
+
+    async def getaddrinfo(self, host, port, *,
+                          family=0, type=0, proto=0, flags=0):
+        self.queries += 1
+        if isinstance(host, bytes):
+            host = host.decode('idna')
+        addresses = self._hosts.get(host.lower()) if host else None
+        if not addresses:
+            raise socket.gaierror(socket.EAI_NONAME,
+                                  'Name or service not known')
+        infos = []
+        for address in addresses:
+            try:
+                infos.extend(socket.getaddrinfo(
+                    address, port, family, type, proto,
+                    flags | socket.AI_NUMERICHOST))
+            except socket.gaierror:
+                # The address does not match the requested family.
+                continue
+        if not infos:
+            raise socket.gaierror(socket.EAI_NONAME,
+                                  'Name or service not known')
+        return infos
+
+
+class CachingResolver:
+    """Resolver caching the answers of another resolver.
+
+    Successful lookups are cached for ttl seconds and failed lookups
+    (socket.gaierror) for negative_ttl seconds; a negative_ttl of 0
+    disables negative caching.  At most maxsize answers are kept, the
+    least recently used being evicted first.  Concurrent lookups of the
+    same query share a single call to the underlying resolver, which
+    defaults to a ThreadedResolver.  The cache may be shared by several
+    event loops; lookups are only coalesced within a loop.
+
+    Use loop.set_resolver() to make an event loop use a resolver.
+    """
+
+    def __init__(self, resolver=None, *, ttl=60.0, negative_ttl=5.0,
+                 maxsize=1024):
+        if ttl < 0 or negative_ttl < 0:
+            raise ValueError('ttl and negative_ttl must not be negative')
+        if maxsize <= 0:
+            raise ValueError('maxsize must be greater than zero')
+        if resolver is None:
+            resolver = ThreadedResolver()
+        self._resolver = resolver
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._maxsize = maxsize
+        # Maps a query to (expiry time, addresses, None) or, for a failed
+        # lookup, to (expiry time, None, socket.gaierror arguments).
+        self._cache = collections.OrderedDict()
+        # Maps (loop, query) to the task looking the query up in the loop.
+        self._pending = {}
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} resolver={self._resolver!r} '
+                f'ttl={self._ttl} negative_ttl={self._negative_ttl} '
+                f'entries={len(self._cache)}>')
+
+    @property
+    def resolver(self):
+        return self._resolver
+
+    def statistics(self):
+        """Return a dict with the cache statistics.
+
+        hits and negative_hits count the lookups answered from the cache,
+        misses the queries sent to the underlying resolver, coalesced the
+        lookups that waited for a query already in flight, evictions the
+        answers dropped because the cache was full, and entries the
+        number of cached answers.
+        """
+        return {
+            'hits': self._hits,
+            'negative_hits': self._negative_hits,
+            'misses': self._misses,
+            'coalesced': self._coalesced,
+            'evictions': self._evictions,
+            'entries': len(self._cache),
+        }
+
+    def clear(self, host=None):
+        """Forget cached answers for host, or all answers if host is None."""
+        if host is None:
+            self._cache.clear()
+        else:
+            for key in [key for key in self._cache if key[0] == host]:
+                del self._cache[key]
+
+    async def getaddrinfo(self, host, port, *,
+                          family=0, type=0, proto=0, flags=0):
+        loop = events.get_running_loop()
+        key = (host, port, family, type, proto, flags)
+        entry = self._cache.get(key)
+        if entry is not None:
+            expiry, result, error = entry
+            if expiry > loop.time():
+                self._cache.move_to_end(key)
+                if error is not None:
+                    self._negative_hits += 1
+                    # Raise a new exception each time: reraising a single
+                    # one would accumulate the tracebacks of every caller.
+                    raise socket.gaierror(*error)
+                self._hits += 1
+                return list(result)
+            del self._cache[key]
+
+        task = self._pending.get((loop, key))
+        if task is None:
+            self._misses += 1
+            task = loop.create_task(self._lookup(key, loop))
+            self._pending[loop, key] = task
+        else:
+            self._coalesced += 1
+        # Shield the lookup: other callers may wait for it too.
+        try:
+            result = await tasks.shield(task)
+        except socket.gaierror as exc:
+            # As for negative hits, give each caller its own exception.
+            raise socket.gaierror(*exc.args) from exc
+        return list(result)
+
+    async def _lookup(self, key, loop):
+        host, port, family, type, proto, flags = key
+        try:
+            result = await self._resolver.getaddrinfo(
+                host, port, family=family, type=type, proto=proto,
+                flags=flags)
+        except socket.gaierror as exc:
+            if self._negative_ttl:
+                self._store(key, loop.time() + self._negative_ttl,
+                            None, exc.args)
+            raise
+        else:
+            if self._ttl:
+                self._store(key, loop.time() + self._ttl, result, None)
+            return result
+        finally:
+            del self._pending[loop, key]
+
+    def _store(self, key, expiry, result, error):
+        cache = self._cache
+        cache[key] = (expiry, result, error)
+        cache.move_to_end(key)
+        while len(cache) > self._maxsize:
+            cache.popitem(last=False)
+            self._evictions += 1
@@ -9,6 +9,8 @@
 import collections
 import errno
 import functools
+import itertools
+import os
 import selectors
 import socket
 import warnings
@@ -28,6 +30,17 @@
 from . import trsock
 from .log import logger
 
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+if _HAS_SENDMSG:
+    try:
+        SC_IOV_MAX = os.sysconf('SC_IOV_MAX')
+    except OSError:
+        SC_IOV_MAX = -1
+    if SC_IOV_MAX <= 0:
+        # Fall back to send() if the limit is unknown.
+        _HAS_SENDMSG = False
+
 
 def _test_selector_event(selector, fd, event):
     # Test if the selector is monitoring 'event' events
@@ -898,6 +911,11 @@ class _SelectorSocketTransport(_SelectorTransport):
     _start_tls_compatible = True
     _sendfile_compatible = constants._SendfileMode.TRY_NATIVE
 
+    # Pending writes are kept as a deque of byte memoryviews, so that
+    # fragments are never copied into one contiguous buffer; they are
+    # flushed with a single sendmsg() call (vectored I/O) when available.
+    _buffer_factory = collections.deque
+
     def __init__(self, loop, sock, protocol, waiter=None,
                  extra=None, server=None):
 
@@ -906,6 +924,11 @@ def __init__(self, loop, sock, protocol, waiter=None,
         self._eof = False
         self._paused = False
         self._empty_waiter = None
+        self._buffer_size = 0
+        if _HAS_SENDMSG:
+            self._write_ready = self._write_sendmsg
+        else:
+            self._write_ready = self._write_send
 
         # Disable the Nagle algorithm -- small writes will be
         # sent without waiting for the TCP ACK.  This generally
@@ -1034,6 +1057,20 @@ def _read_ready__on_eof(self):
         else:
             self.close()
 
+    def get_write_buffer_size(self):
+        return self._buffer_size if self._buffer else 0
+
+    def _buffer_append(self, data):
+        view = memoryview(data)
+        if not isinstance(view.obj, bytes) or not view.c_contiguous:
+            # The caller may reuse a mutable buffer as soon as write()
+            # returns, so only immutable bytes can be queued without a copy.
+            view = memoryview(view.tobytes())
+        elif view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        self._buffer.append(view)
+        self._buffer_size += view.nbytes
+
     def write(self, data):
         if not isinstance(data, (bytes, bytearray, memoryview)):
             raise TypeError(f'data argument must be a bytes-like object, '
@@ -1063,45 +1100,111 @@ def write(self, data):
                 self._fatal_error(exc, 'Fatal write error on socket transport')
                 return
             else:
-                data = data[n:]
-                if not data:
-                    return
+                if n:
+                    data = memoryview(data).cast('B')[n:]
+                    if not data:
+                        return
             # Not all was written; register write handler.
             self._loop._add_writer(self._sock_fd, self._write_ready)
 
         # Add it to the buffer.
-        self._buffer.extend(data)
+        self._buffer_append(data)
         self._maybe_pause_protocol()
 
-    def _write_ready(self):
+    def writelines(self, list_of_data):
+        if self._eof:
+            raise RuntimeError('Cannot call writelines() after write_eof()')
+        if self._empty_waiter is not None:
+            raise RuntimeError('unable to writelines; sendfile is in progress')
+
+        list_of_data = list(list_of_data)
+        for data in list_of_data:
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise TypeError(f'data argument must be a bytes-like object, '
+                                f'not {type(data).__name__!r}')
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        was_empty = not self._buffer
+        for data in list_of_data:
+            if data:
+                self._buffer_append(data)
+        if not self._buffer:
+            return
+
+        if was_empty:
+            # Optimization: try to send everything now, in one call.
+            self._write_ready()
+            if self._buffer and not self._conn_lost:
+                self._loop._add_writer(self._sock_fd, self._write_ready)
+        self._maybe_pause_protocol()
+
+    def _adjust_leftover_buffer(self, nbytes):
+        self._buffer_size -= nbytes
+        buffer = self._buffer
+        while nbytes:
+            view = buffer.popleft()
+            if len(view) <= nbytes:
+                nbytes -= len(view)
+            else:
+                buffer.appendleft(view[nbytes:])
+                break
+
+    def _write_sendmsg(self):
+        assert self._buffer, 'Data should not be empty'
+
+        if self._conn_lost:
+            return
+        try:
+            n = self._sock.sendmsg(itertools.islice(self._buffer, SC_IOV_MAX))
+        except (BlockingIOError, InterruptedError):
+            pass
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as exc:
+            self._write_error(exc)
+        else:
+            self._adjust_leftover_buffer(n)
+            self._write_done()
+
+    def _write_send(self):
         assert self._buffer, 'Data should not be empty'
 
         if self._conn_lost:
             return
         try:
-            n = self._sock.send(self._buffer)
+            n = self._sock.send(self._buffer[0])
         except (BlockingIOError, InterruptedError):
             pass
         except (SystemExit, KeyboardInterrupt):
             raise
         except BaseException as exc:
+            self._write_error(exc)
+        else:
+            self._adjust_leftover_buffer(n)
+            self._write_done()
+
+    def _write_error(self, exc):
+        self._loop._remove_writer(self._sock_fd)
+        self._buffer.clear()
+        self._fatal_error(exc, 'Fatal write error on socket transport')
+        if self._empty_waiter is not None:
+            self._empty_waiter.set_exception(exc)
+
+    def _write_done(self):
+        self._maybe_resume_protocol()  # May append to buffer.
+        if not self._buffer:
             self._loop._remove_writer(self._sock_fd)
-            self._buffer.clear()
-            self._fatal_error(exc, 'Fatal write error on socket transport')
             if self._empty_waiter is not None:
-                self._empty_waiter.set_exception(exc)
-        else:
-            if n:
-                del self._buffer[:n]
-            self._maybe_resume_protocol()  # May append to buffer.
-            if not self._buffer:
-                self._loop._remove_writer(self._sock_fd)
-                if self._empty_waiter is not None:
-                    self._empty_waiter.set_result(None)
-                if self._closing:
-                    self._call_connection_lost(None)
-                elif self._eof:
-                    self._sock.shutdown(socket.SHUT_WR)
+                self._empty_waiter.set_result(None)
+            if self._closing:
+                self._call_connection_lost(None)
+            elif self._eof:
+                self._sock.shutdown(socket.SHUT_WR)
 
     def write_eof(self):
         if self._closing or self._eof:
@@ -1140,6 +1243,8 @@ def __init__(self, loop, sock, protocol, address=None,
         super().__init__(loop, sock, protocol, extra)
         self._address = address
         self._buffer_size = 0
+        self._read_batch_size = 1
+        self._recv_buffer = None
         self._loop.call_soon(self._protocol.connection_made, self)
         # only start reading when connection_made() has been called
         self._loop.call_soon(self._add_reader,
@@ -1152,9 +1257,22 @@ def __init__(self, loop, sock, protocol, address=None,
     def get_write_buffer_size(self):
         return self._buffer_size
 
+    def get_read_batch_size(self):
+        return self._read_batch_size
+
+    def set_read_batch_size(self, size):
+        if size < 1:
+            raise ValueError(f'size must be at least 1, got {size!r}')
+        self._read_batch_size = size
+        if size > 1 and self._recv_buffer is None:
+            self._recv_buffer = memoryview(bytearray(self.max_size))
+
     def _read_ready(self):
         if self._conn_lost:
             return
+        if self._read_batch_size > 1:
+            self._read_ready_batch()
+            return
         try:
             data, addr = self._sock.recvfrom(self.max_size)
         except (BlockingIOError, InterruptedError):
@@ -1168,6 +1286,41 @@ def _read_ready(self):
         else:
             self._protocol.datagram_received(data, addr)
 
+    def _read_ready_batch(self):
+        # Python exposes no recvmmsg(): drain the socket with
+        # recvfrom_into() calls into a preallocated buffer, so that a
+        # burst of datagrams costs one loop iteration and one protocol
+        # call instead of one each per datagram.
+        recvfrom_into = self._sock.recvfrom_into
+        buffer = self._recv_buffer
+        datagrams = []
+        error = None
+        for _ in range(self._read_batch_size):
+            try:
+                nbytes, addr = recvfrom_into(buffer)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as exc:
+                error = exc
+                break
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self._fatal_error(exc,
+                                  'Fatal read error on datagram transport')
+                return
+            datagrams.append((bytes(buffer[:nbytes]), addr))
+        if datagrams:
+            datagrams_received = getattr(self._protocol,
+                                         'datagrams_received', None)
+            if datagrams_received is not None:
+                datagrams_received(datagrams)
+            else:
+                for data, addr in datagrams:
+                    self._protocol.datagram_received(data, addr)
+        if error is not None and not self._conn_lost:
+            self._protocol.error_received(error)
+
     def sendto(self, data, addr=None):
         if not isinstance(data, (bytes, bytearray, memoryview)):
             raise TypeError(f'data argument must be a bytes-like object, '
@@ -1213,27 +1366,41 @@ def sendto(self, data, addr=None):
         self._maybe_pause_protocol()
 
     def _sendto_ready(self):
-        while self._buffer:
-            data, addr = self._buffer.popleft()
-            self._buffer_size -= len(data)
-            try:
-                if self._extra['peername']:
-                    self._sock.send(data)
+        # Flush as much of the buffer as the socket accepts in one go.
+        # The datagram at the head of the buffer is only removed once it
+        # is sent, and the buffer size is updated once for the batch.
+        buffer = self._buffer
+        connected = bool(self._extra['peername'])
+        send = self._sock.send
+        sendto = self._sock.sendto
+        sent = 0
+        try:
+            while buffer:
+                data, addr = buffer[0]
+                if connected:
+                    send(data)
                 else:
-                    self._sock.sendto(data, addr)
-            except (BlockingIOError, InterruptedError):
-                self._buffer.appendleft((data, addr))  # Try again later.
-                self._buffer_size += len(data)
-                break
-            except OSError as exc:
-                self._protocol.error_received(exc)
-                return
-            except (SystemExit, KeyboardInterrupt):
-                raise
-            except BaseException as exc:
-                self._fatal_error(
-                    exc, 'Fatal write error on datagram transport')
-                return
+                    sendto(data, addr)
+                buffer.popleft()
+                sent += len(data)
+        except (BlockingIOError, InterruptedError):
+            pass  # Try again later.
+        except OSError as exc:
+            # The datagram is dropped, like in sendto().
+            buffer.popleft()
+            self._buffer_size -= sent + len(data)
+            self._protocol.error_received(exc)
+            return
+        except (SystemExit, KeyboardInterrupt):
+            self._buffer_size -= sent
+            raise
+        except BaseException as exc:
+            buffer.popleft()
+            self._buffer_size -= sent + len(data)
+            self._fatal_error(
+                exc, 'Fatal write error on datagram transport')
+            return
+        self._buffer_size -= sent
 
         self._maybe_resume_protocol()  # May append to buffer.
         if not self._buffer:
@@ -1,5 +1,6 @@
 __all__ = (
     'StreamReader', 'StreamWriter', 'StreamReaderProtocol',
+    'BufferedStreamReader', 'BufferedStreamReaderProtocol',
     'open_connection', 'start_server')
 
 import collections
@@ -21,10 +22,23 @@
 
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_MIN_RECV_SIZE = 2 ** 12  # 4 KiB
+
+
+def _make_reader_protocol(limit, loop, buffered, client_connected_cb=None):
+    if buffered:
+        reader = BufferedStreamReader(limit=limit, loop=loop)
+        protocol = BufferedStreamReaderProtocol(reader, client_connected_cb,
+                                                loop=loop)
+    else:
+        reader = StreamReader(limit=limit, loop=loop)
+        protocol = StreamReaderProtocol(reader, client_connected_cb,
+                                        loop=loop)
+    return reader, protocol
 
 
 async def open_connection(host=None, port=None, *,
-                          limit=_DEFAULT_LIMIT, **kwds):
+                          limit=_DEFAULT_LIMIT, buffered=False, **kwds):
     """A wrapper for create_connection() returning a (reader, writer) pair.
 
     The reader returned is a StreamReader instance; the writer is a
@@ -35,16 +49,16 @@ async def open_connection(host=None, port=None, *,
     with various optional keyword arguments following.
 
     Additional optional keyword arguments are loop (to set the event loop
-    instance to use) and limit (to set the buffer limit passed to the
-    StreamReader).
+    instance to use), limit (to set the buffer limit passed to the
+    StreamReader) and buffered (to return a BufferedStreamReader, which
+    receives data directly into its buffer).
 
     (If you want to customize the StreamReader and/or
     StreamReaderProtocol classes, just copy the code -- there's
     really nothing special here except some convenience.)
     """
     loop = events.get_running_loop()
-    reader = StreamReader(limit=limit, loop=loop)
-    protocol = StreamReaderProtocol(reader, loop=loop)
+    reader, protocol = _make_reader_protocol(limit, loop, buffered)
     transport, _ = await loop.create_connection(
         lambda: protocol, host, port, **kwds)
     writer = StreamWriter(transport, protocol, reader, loop)
@@ -52,7 +66,7 @@ async def open_connection(host=None, port=None, *,
 
 
 async def start_server(client_connected_cb, host=None, port=None, *,
-                       limit=_DEFAULT_LIMIT, **kwds):
+                       limit=_DEFAULT_LIMIT, buffered=False, **kwds):
     """Start a socket server, call back for each client connected.
 
     The first parameter, `client_connected_cb`, takes two parameters:
@@ -68,8 +82,9 @@ async def start_server(client_connected_cb, host=None, port=None, *,
     following.  The return value is the same as loop.create_server().
 
     Additional optional keyword arguments are loop (to set the event loop
-    instance to use) and limit (to set the buffer limit passed to the
-    StreamReader).
+    instance to use), limit (to set the buffer limit passed to the
+    StreamReader) and buffered (to pass BufferedStreamReader objects to
+    the callback).
 
     The return value is the same as loop.create_server(), i.e. a
     Server object which can be used to stop the service.
@@ -77,9 +92,8 @@ async def start_server(client_connected_cb, host=None, port=None, *,
     loop = events.get_running_loop()
 
     def factory():
-        reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                        loop=loop)
+        reader, protocol = _make_reader_protocol(limit, loop, buffered,
+                                                 client_connected_cb)
         return protocol
 
     return await loop.create_server(factory, host, port, **kwds)
@@ -89,26 +103,26 @@ def factory():
     # UNIX Domain Sockets are supported on this platform
 
     async def open_unix_connection(path=None, *,
-                                   limit=_DEFAULT_LIMIT, **kwds):
+                                   limit=_DEFAULT_LIMIT, buffered=False,
+                                   **kwds):
         """Similar to `open_connection` but works with UNIX Domain Sockets."""
         loop = events.get_running_loop()
 
-        reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, loop=loop)
+        reader, protocol = _make_reader_protocol(limit, loop, buffered)
         transport, _ = await loop.create_unix_connection(
             lambda: protocol, path, **kwds)
         writer = StreamWriter(transport, protocol, reader, loop)
         return reader, writer
 
     async def start_unix_server(client_connected_cb, path=None, *,
-                                limit=_DEFAULT_LIMIT, **kwds):
+                                limit=_DEFAULT_LIMIT, buffered=False,
+                                **kwds):
         """Similar to `start_server` but works with UNIX Domain Sockets."""
         loop = events.get_running_loop()
 
         def factory():
-            reader = StreamReader(limit=limit, loop=loop)
-            protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                            loop=loop)
+            reader, protocol = _make_reader_protocol(limit, loop, buffered,
+                                                     client_connected_cb)
             return protocol
 
         return await loop.create_unix_server(factory, path, **kwds)
@@ -298,6 +312,32 @@ def __del__(self):
                 closed.exception()
 
 
+class BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                   protocols.BufferedProtocol):
+    """StreamReaderProtocol feeding a BufferedStreamReader.
+
+    Transports supporting BufferedProtocol receive data directly into
+    the free space of the reader's buffer instead of creating a new
+    bytes object for every chunk.
+    """
+
+    _scratch = None
+
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is None:
+            # Nobody will read the data any more; receive and drop it.
+            if self._scratch is None:
+                self._scratch = bytearray(_MIN_RECV_SIZE)
+            return self._scratch
+        return reader._get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        reader = self._stream_reader
+        if reader is not None:
+            reader._buffer_updated(nbytes)
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -745,3 +785,337 @@ async def __anext__(self):
         if val == b'':
             raise StopAsyncIteration
         return val
+
+
+class BufferedStreamReader(StreamReader):
+    """StreamReader receiving data directly into a reusable buffer.
+
+    Used with BufferedStreamReaderProtocol, the transport writes incoming
+    data straight into the free space at the end of a preallocated
+    bytearray; consumed space at its front is reclaimed when the reader
+    waits for more data.  Besides the StreamReader API, the reader
+    offers readinto() and readexactly_into(), which copy data into a
+    caller supplied buffer, and read_view(), readuntil_view() and
+    readexactly_view(), which return memoryviews of the internal buffer
+    without copying.
+
+    A memoryview returned by a *_view() method is only valid until the
+    next read call on the stream, which may overwrite its content.
+    Convert it with bytes() to keep the data longer.
+    """
+
+    def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
+        super().__init__(limit=limit, loop=loop)
+        # Unread data is self._buffer[self._start:self._end]; new data
+        # is received into self._buffer[self._end:].
+        self._buffer = bytearray(max(limit, _MIN_RECV_SIZE))
+        self._start = 0
+        self._end = 0
+
+    def __repr__(self):
+        info = ['BufferedStreamReader']
+        if self._end > self._start:
+            info.append(f'{self._end - self._start} bytes')
+        if self._eof:
+            info.append('eof')
+        if self._limit != _DEFAULT_LIMIT:
+            info.append(f'limit={self._limit}')
+        if self._waiter:
+            info.append(f'waiter={self._waiter!r}')
+        if self._exception:
+            info.append(f'exception={self._exception!r}')
+        if self._transport:
+            info.append(f'transport={self._transport!r}')
+        if self._paused:
+            info.append('paused')
+        return '<{}>'.format(' '.join(info))
+
+    def _maybe_resume_transport(self):
+        if self._paused and self._end - self._start <= self._limit:
+            self._paused = False
+            self._transport.resume_reading()
+
+    def at_eof(self):
+        """Return True if the buffer is empty and 'feed_eof' was called."""
+        return self._eof and self._start == self._end
+
+    def _reserve(self, size):
+        """Make sure at least `size` bytes are free after the unread data."""
+        buffer = self._buffer
+        if len(buffer) - self._end >= size:
+            return
+        # Views returned by the *_view() methods may still be in use, so
+        # the data is moved into a new buffer instead of being shifted
+        # or resized in place.
+        unread = self._end - self._start
+        capacity = max(len(buffer), 2 * unread, unread + size)
+        new = bytearray(capacity)
+        new[:unread] = memoryview(buffer)[self._start:self._end]
+        self._buffer = new
+        self._start = 0
+        self._end = unread
+
+    def _compact(self):
+        """Reclaim consumed space at the front of the buffer."""
+        start = self._start
+        if not start:
+            return
+        if start == self._end:
+            self._start = self._end = 0
+        elif start >= len(self._buffer) // 2:
+            end = self._end
+            with memoryview(self._buffer) as view:
+                view[:end - start] = view[start:end]
+            self._start = 0
+            self._end = end - start
+
+    def _get_buffer(self, sizehint):
+        self._reserve(max(sizehint, _MIN_RECV_SIZE))
+        return memoryview(self._buffer)[self._end:]
+
+    def _buffer_updated(self, nbytes):
+        assert not self._eof, 'buffer_updated after feed_eof'
+
+        if not nbytes:
+            return
+
+        self._end += nbytes
+        self._wakeup_waiter()
+
+        if (self._transport is not None and
+                not self._paused and
+                self._end - self._start > 2 * self._limit):
+            try:
+                self._transport.pause_reading()
+            except NotImplementedError:
+                # The transport can't be paused.
+                # We'll just have to buffer all data.
+                # Forget the transport so we don't keep trying.
+                self._transport = None
+            else:
+                self._paused = True
+
+    def feed_data(self, data):
+        assert not self._eof, 'feed_data after feed_eof'
+
+        if not data:
+            return
+
+        with memoryview(data) as view, view.cast('B') as data:
+            nbytes = len(data)
+            self._reserve(nbytes)
+            self._buffer[self._end:self._end + nbytes] = data
+        self._buffer_updated(nbytes)
+
+    async def _wait_for_data(self, func_name):
+        # Views returned by earlier read calls are no longer valid.
+        self._compact()
+        await super()._wait_for_data(func_name)
+
+    def _consume(self, n):
+        """Return a view of the next `n` unread bytes and consume them."""
+        start = self._start
+        self._start = start + n
+        return memoryview(self._buffer)[start:start + n]
+
+    def _consume_all(self):
+        data = bytes(self._consume(self._end - self._start))
+        self._start = self._end = 0
+        return data
+
+    async def readline(self):
+        """Read chunk of data from the stream until newline (b'\\n') is found.
+
+        See StreamReader.readline().
+        """
+        sep = b'\n'
+        seplen = len(sep)
+        try:
+            line = await self.readuntil(sep)
+        except exceptions.IncompleteReadError as e:
+            return e.partial
+        except exceptions.LimitOverrunError as e:
+            if self._buffer.startswith(sep, self._start + e.consumed,
+                                       self._end):
+                self._start += e.consumed + seplen
+            else:
+                self._start = self._end
+            self._maybe_resume_transport()
+            raise ValueError(e.args[0])
+        return line
+
+    async def _readuntil(self, separator, func_name):
+        """Wait until `separator` is buffered and return the chunk size."""
+        seplen = len(separator)
+        if seplen == 0:
+            raise ValueError('Separator should be at least one-byte string')
+
+        if self._exception is not None:
+            raise self._exception
+
+        # See StreamReader.readuntil() for the search strategy; `offset`
+        # is relative to the start of the unread data.
+        offset = 0
+
+        while True:
+            buflen = self._end - self._start
+
+            if buflen - offset >= seplen:
+                isep = self._buffer.find(separator, self._start + offset,
+                                         self._end)
+
+                if isep != -1:
+                    isep -= self._start
+                    break
+
+                offset = buflen + 1 - seplen
+                if offset > self._limit:
+                    raise exceptions.LimitOverrunError(
+                        'Separator is not found, and chunk exceed the limit',
+                        offset)
+
+            if self._eof:
+                raise exceptions.IncompleteReadError(self._consume_all(),
+                                                     None)
+
+            await self._wait_for_data(func_name)
+
+        if isep > self._limit:
+            raise exceptions.LimitOverrunError(
+                'Separator is found, but chunk is longer than limit', isep)
+
+        return isep + seplen
+
+    async def readuntil(self, separator=b'\n'):
+        """Read data from the stream until ``separator`` is found.
+
+        See StreamReader.readuntil().
+        """
+        n = await self._readuntil(separator, 'readuntil')
+        data = bytes(self._consume(n))
+        self._maybe_resume_transport()
+        return data
+
+    async def readuntil_view(self, separator=b'\n'):
+        """Like readuntil(), but return a memoryview of the internal buffer.
+
+        The view is only valid until the next read call on the stream.
+        """
+        n = await self._readuntil(separator, 'readuntil_view')
+        view = self._consume(n)
+        self._maybe_resume_transport()
+        return view
+
+    async def _read_available(self, n, func_name):
+        """Wait until data is available and return how much can be read."""
+        if self._exception is not None:
+            raise self._exception
+
+        if self._start == self._end and not self._eof:
+            await self._wait_for_data(func_name)
+
+        return min(n, self._end - self._start)
+
+    async def read(self, n=-1):
+        """Read up to `n` bytes from the stream.
+
+        See StreamReader.read().
+        """
+        if n < 0 or n == 0:
+            return await super().read(n)
+
+        n = await self._read_available(n, 'read')
+        data = bytes(self._consume(n))
+        self._maybe_resume_transport()
+        return data
+
+    async def read_view(self, n):
+        """Like read(), but return a memoryview of the internal buffer.
+
+        `n` must be positive.  The view is only valid until the next read
+        call on the stream.
+        """
+        if n <= 0:
+            raise ValueError('read_view size must be greater than zero')
+
+        n = await self._read_available(n, 'read_view')
+        view = self._consume(n)
+        self._maybe_resume_transport()
+        return view
+
+    async def readinto(self, buf):
+        """Read up to len(buf) bytes from the stream into `buf`.
+
+        Return the number of bytes read, as soon as at least one byte is
+        available.  Zero is returned if EOF was received and the internal
+        buffer is empty, or if `buf` is empty.
+        """
+        with memoryview(buf) as view, view.cast('B') as view:
+            if not view:
+                if self._exception is not None:
+                    raise self._exception
+                return 0
+            n = await self._read_available(len(view), 'readinto')
+            view[:n] = self._consume(n)
+        self._maybe_resume_transport()
+        return n
+
+    async def _readexactly(self, n, func_name):
+        if n < 0:
+            raise ValueError('readexactly size can not be less than zero')
+
+        if self._exception is not None:
+            raise self._exception
+
+        while self._end - self._start < n:
+            if self._eof:
+                raise exceptions.IncompleteReadError(self._consume_all(), n)
+
+            await self._wait_for_data(func_name)
+
+    async def readexactly(self, n):
+        """Read exactly `n` bytes.
+
+        See StreamReader.readexactly().
+        """
+        await self._readexactly(n, 'readexactly')
+        data = bytes(self._consume(n))
+        self._maybe_resume_transport()
+        return data
+
+    async def readexactly_view(self, n):
+        """Like readexactly(), but return a memoryview of the internal buffer.
+
+        The view is only valid until the next read call on the stream.
+        """
+        await self._readexactly(n, 'readexactly_view')
+        view = self._consume(n)
+        self._maybe_resume_transport()
+        return view
+
+    async def readexactly_into(self, buf):
+        """Read exactly len(buf) bytes from the stream into `buf`.
+
+        Data is copied into `buf` as it arrives, so frames larger than the
+        stream limit do not have to be buffered first.  Raise an
+        IncompleteReadError if EOF is reached before `buf` is filled; its
+        partial attribute contains the bytes read so far.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buf) as view, view.cast('B') as view:
+            size = len(view)
+            pos = 0
+            while pos < size:
+                n = min(size - pos, self._end - self._start)
+                if n:
+                    view[pos:pos + n] = self._consume(n)
+                    pos += n
+                    self._maybe_resume_transport()
+                    continue
+                if self._eof:
+                    raise exceptions.IncompleteReadError(bytes(view[:pos]),
+                                                         size)
+                await self._wait_for_data('readexactly_into')
+        return size
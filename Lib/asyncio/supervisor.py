@@ -0,0 +1,430 @@
+"""Run a server in several processes sharing a port with SO_REUSEPORT."""
+
+__all__ = ('ServerSupervisor',)
+
+import os
+import signal
+import socket
+import sys
+import traceback
+
+from . import base_events
+from . import events
+from . import exceptions
+from . import runners
+from . import tasks
+from . import timeouts
+from .log import logger
+
+
+# Seconds to wait for a worker to exit once its drain timeout is over,
+# before killing it.
+_EXIT_GRACE_PERIOD = 5.0
+
+# Seconds to wait before respawning a worker that died before serving.
+_RESPAWN_DELAY = 1.0
+
+
+class _Worker:
+    # A worker process, as seen by the supervisor.
+
+    def __init__(self, process, conn, loop, respawn):
+        self.process = process
+        self.pid = process.pid
+        self.conn = conn
+        # True once the worker serves, False if it died before.
+        self.ready = loop.create_future()
+        # The exit code of the process.
+        self.exited = loop.create_future()
+        self.stats = {}
+        # The exception the worker failed with, as reported by the worker.
+        self.error = None
+        self.stopping = False
+        # Whether to respawn the worker if it dies.
+        self.respawn = respawn
+
+
+class ServerSupervisor:
+    """Run a server in several worker processes sharing a port.
+
+    Each of the workers runs its own event loop, binds a socket to the
+    same address with SO_REUSEPORT, so that the kernel spreads incoming
+    connections over the workers, and calls the server_factory coroutine
+    function with the bound socket.  server_factory must return a Server,
+    for example with asyncio.start_server(client_connected_cb, sock=sock).
+    With the default start method of multiprocessing, server_factory is
+    inherited by the workers; with 'spawn' or 'forkserver', it must be
+    picklable.
+
+    The supervisor keeps a placeholder socket bound to the address, but
+    not listening, so that the port stays reserved across restarts; with
+    port 0, a free port is picked and reported by the sockname attribute.
+
+    Workers dying unexpectedly are respawned.  restart() replaces the
+    workers one at a time, waiting for each new worker to serve before
+    stopping an old one.  A stopped worker drains: it closes its
+    listening socket, then waits up to drain_timeout seconds for its
+    connections to finish.  Workers report statistics to the supervisor
+    every stats_interval seconds, see statistics().
+
+    This requires SO_REUSEPORT, and is only available on Unix.
+    """
+
+    def __init__(self, server_factory, host=None, port=0, *, workers=None,
+                 drain_timeout=30.0, start_timeout=30.0, stats_interval=1.0,
+                 mp_context=None):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+        if not hasattr(socket, 'SO_REUSEPORT'):
+            raise ValueError('reuse_port not supported by socket module')
+        if mp_context is None or isinstance(mp_context, str):
+            import multiprocessing
+            mp_context = multiprocessing.get_context(mp_context)
+        self._server_factory = server_factory
+        self._host = host
+        self._port = port
+        self._num_workers = workers
+        self._drain_timeout = drain_timeout
+        self._start_timeout = start_timeout
+        self._stats_interval = stats_interval
+        self._mp_context = mp_context
+        self._loop = None
+        self._sock = None
+        self._sockname = None
+        self._workers = []
+        self._started = False
+        self._stopping = False
+        self._restarting = False
+        self._respawns = 0
+        self._restarts = 0
+        # Connections accepted by the workers that have exited.
+        self._exited_accepted = 0
+
+    def __repr__(self):
+        info = [f'workers={len(self._workers)}']
+        if self._sockname is not None:
+            info.append(f'sockname={self._sockname!r}')
+        if self._stopping:
+            info.append('stopping')
+        return f'<{self.__class__.__name__} {" ".join(info)}>'
+
+    @property
+    def sockname(self):
+        """The address the workers are bound to, or None if not started."""
+        return self._sockname
+
+    @property
+    def pids(self):
+        """The process ids of the workers."""
+        return [worker.pid for worker in self._workers]
+
+    def statistics(self):
+        """Return a dict with the statistics of the workers.
+
+        workers is the number of workers serving, connections the number
+        of open connections, accepted the number of connections accepted
+        so far, respawns the number of workers respawned after dying
+        unexpectedly and restarts the number of completed restart()
+        calls.  per_worker maps the process id of each worker to the
+        last statistics it reported.
+        """
+        per_worker = {worker.pid: dict(worker.stats)
+                      for worker in self._workers}
+        return {
+            'workers': sum(1 for worker in self._workers
+                           if worker.ready.done() and worker.ready.result()),
+            'connections': sum(stats.get('connections', 0)
+                               for stats in per_worker.values()),
+            'accepted': self._exited_accepted + sum(
+                stats.get('accepted', 0) for stats in per_worker.values()),
+            'respawns': self._respawns,
+            'restarts': self._restarts,
+            'per_worker': per_worker,
+        }
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def start(self):
+        """Start the workers and wait until all of them serve."""
+        if self._started:
+            raise RuntimeError(f'{self!r} was already started')
+        self._started = True
+        self._loop = events.get_running_loop()
+        self._sock = _bind_reuseport(self._host, self._port)
+        self._sockname = self._sock.getsockname()
+        try:
+            workers = [self._spawn() for _ in range(self._num_workers)]
+            await self._wait_ready(workers)
+        except BaseException:
+            await self.stop()
+            raise
+
+    async def restart(self):
+        """Replace the workers one at a time, without downtime.
+
+        Each new worker is started and serving before an old worker is
+        stopped and drained.  If a new worker fails to start, the restart
+        is abandoned and RuntimeError is raised; the remaining old
+        workers keep serving.
+        """
+        self._check_running()
+        if self._restarting:
+            raise RuntimeError('a restart is already in progress')
+        self._restarting = True
+        try:
+            for old in list(self._workers):
+                if old not in self._workers:
+                    # The worker died and was respawned meanwhile.
+                    continue
+                new = self._spawn()
+                await self._wait_ready([new])
+                await self._stop_worker(old)
+            self._restarts += 1
+        finally:
+            self._restarting = False
+
+    async def stop(self):
+        """Drain and stop all the workers."""
+        if self._stopping:
+            return
+        self._stopping = True
+        await tasks.gather(*[self._stop_worker(worker)
+                             for worker in list(self._workers)])
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    async def serve_forever(self):
+        """Start the workers, if needed, and supervise them until stopped.
+
+        SIGHUP triggers a rolling restart; SIGTERM and SIGINT stop the
+        workers and return.
+        """
+        if not self._started:
+            await self.start()
+        self._check_running()
+        loop = self._loop
+        stopped = loop.create_future()
+
+        def restart():
+            if not self._restarting:
+                task = loop.create_task(self.restart())
+                task.add_done_callback(_log_restart_error)
+
+        loop.add_signal_handler(signal.SIGHUP, restart)
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(
+                sig, _set_result_unless_done, stopped, None)
+        try:
+            await stopped
+        finally:
+            for sig in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+                loop.remove_signal_handler(sig)
+            await self.stop()
+
+    def _check_running(self):
+        if not self._started:
+            raise RuntimeError(f'{self!r} was not started')
+        if self._stopping:
+            raise RuntimeError(f'{self!r} is stopped')
+
+    def _spawn(self, respawn=False):
+        reader, writer = self._mp_context.Pipe(duplex=False)
+        process = self._mp_context.Process(
+            target=_worker_main, daemon=True,
+            args=(self._server_factory, self._sock.family, self._sockname,
+                  writer, self._drain_timeout, self._stats_interval))
+        try:
+            process.start()
+        finally:
+            writer.close()
+        worker = _Worker(process, reader, self._loop, respawn)
+        self._workers.append(worker)
+        self._loop.add_reader(reader.fileno(), self._on_message, worker)
+        self._loop.add_reader(process.sentinel, self._on_exit, worker)
+        return worker
+
+    async def _wait_ready(self, workers):
+        for worker in workers:
+            try:
+                async with timeouts.timeout(self._start_timeout):
+                    ready = await tasks.shield(worker.ready)
+            except exceptions.TimeoutError:
+                await self._stop_worker(worker)
+                raise RuntimeError(
+                    f'worker {worker.pid} did not start serving within '
+                    f'{self._start_timeout} seconds') from None
+            if not ready:
+                msg = (f'worker {worker.pid} exited with code '
+                       f'{worker.exited.result()} before serving')
+                if worker.error is not None:
+                    msg = f'{msg}: {worker.error}'
+                raise RuntimeError(msg)
+            worker.respawn = True
+
+    async def _stop_worker(self, worker):
+        worker.stopping = True
+        if not worker.exited.done():
+            worker.process.terminate()
+            try:
+                async with timeouts.timeout(
+                        self._drain_timeout + _EXIT_GRACE_PERIOD):
+                    await tasks.shield(worker.exited)
+            except exceptions.TimeoutError:
+                logger.warning('worker %d did not exit after draining, '
+                               'killing it', worker.pid)
+                worker.process.kill()
+                await tasks.shield(worker.exited)
+
+    def _on_message(self, worker):
+        try:
+            message = worker.conn.recv()
+        except (EOFError, OSError):
+            self._loop.remove_reader(worker.conn.fileno())
+        else:
+            self._handle_message(worker, message)
+
+    def _handle_message(self, worker, message):
+        kind, payload = message
+        if kind == 'ready':
+            _set_result_unless_done(worker.ready, True)
+        elif kind == 'stats':
+            worker.stats = payload
+        elif kind == 'error':
+            worker.error = payload
+
+    def _on_exit(self, worker):
+        loop = self._loop
+        process = worker.process
+        loop.remove_reader(process.sentinel)
+        process.join()
+        exitcode = process.exitcode
+        # Read the last statistics of the worker.
+        conn = worker.conn
+        try:
+            while conn.poll():
+                self._handle_message(worker, conn.recv())
+        except (EOFError, OSError):
+            pass
+        loop.remove_reader(conn.fileno())
+        conn.close()
+        process.close()
+        was_ready = worker.ready.done()
+        _set_result_unless_done(worker.ready, False)
+        _set_result_unless_done(worker.exited, exitcode)
+        self._workers.remove(worker)
+        self._exited_accepted += worker.stats.get('accepted', 0)
+        if worker.stopping or self._stopping or not worker.respawn:
+            return
+        # Do not respawn in a busy loop a worker that fails to start.
+        delay = 0 if was_ready else _RESPAWN_DELAY
+        logger.warning('worker %d exited unexpectedly with code %s (%s), '
+                       'respawning it in %s seconds',
+                       worker.pid, exitcode, worker.error, delay)
+        loop.call_later(delay, self._respawn)
+
+    def _respawn(self):
+        if not self._stopping:
+            self._respawns += 1
+            self._spawn(respawn=True)
+
+
+def _set_result_unless_done(fut, result):
+    if not fut.done():
+        fut.set_result(result)
+
+
+def _log_restart_error(task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error('rolling restart failed', exc_info=task.exception())
+
+
+def _bind_reuseport(host, port, family=socket.AF_UNSPEC):
+    infos = socket.getaddrinfo(host, port, family, socket.SOCK_STREAM,
+                               flags=socket.AI_PASSIVE)
+    family, type, proto, _, address = infos[0]
+    sock = socket.socket(family, type, proto)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        base_events._set_reuseport(sock)
+        sock.bind(address)
+    except:
+        sock.close()
+        raise
+    return sock
+
+
+def _worker_main(server_factory, family, address, conn, drain_timeout,
+                 stats_interval):
+    # A forked worker inherits the signal handling of the supervisor's
+    # event loop: signals must not wake up the supervisor.
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    try:
+        runners.run(_serve(server_factory, family, address, conn,
+                           drain_timeout, stats_interval))
+    except Exception as exc:
+        # Report the error to the supervisor rather than to stderr.
+        try:
+            conn.send(('error', ''.join(
+                traceback.format_exception_only(exc)).strip()))
+        except OSError:
+            pass
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+async def _serve(server_factory, family, address, conn, drain_timeout,
+                 stats_interval):
+    loop = events.get_running_loop()
+    stopped = loop.create_future()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(
+            sig, _set_result_unless_done, stopped, None)
+    supervisor_pid = os.getppid()
+    sock = _bind_reuseport(address[0], address[1], family)
+    server = await server_factory(sock)
+    try:
+        await server.start_serving()
+        conn.send(('ready', None))
+        while not stopped.done():
+            await tasks.wait((stopped,), timeout=stats_interval)
+            if os.getppid() != supervisor_pid:
+                # The supervisor died: nobody reads the statistics anymore.
+                break
+            conn.send(('stats', _server_stats(server)))
+        # Drain: stop accepting connections, then let the open ones end.
+        server.close()
+        if server._waiters is not None:
+            waiter = loop.create_future()
+            server._waiters.append(waiter)
+            try:
+                async with timeouts.timeout(drain_timeout):
+                    await waiter
+            except exceptions.TimeoutError:
+                logger.warning('worker %d closes %d connections still open '
+                               'after draining', os.getpid(),
+                               server._active_count)
+    finally:
+        server.close()
+        try:
+            conn.send(('stats', _server_stats(server)))
+        except OSError:
+            pass
+
+
+def _server_stats(server):
+    return {
+        'connections': server._active_count,
+        'accepted': server._accepted_count,
+    }
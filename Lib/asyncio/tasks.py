@@ -3,12 +3,13 @@
 __all__ = (
     'Task', 'create_task',
     'FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED',
-    'wait', 'wait_for', 'as_completed', 'sleep',
+    'wait', 'wait_for', 'as_completed', 'bounded_map', 'sleep',
     'gather', 'shield', 'ensure_future', 'run_coroutine_threadsafe',
     'current_task', 'all_tasks',
     '_register_task', '_unregister_task', '_enter_task', '_leave_task',
 )
 
+import collections
 import concurrent.futures
 import contextvars
 import functools
@@ -612,6 +613,111 @@ async def _wait_for_one():
         yield _wait_for_one()
 
 
+async def bounded_map(func, iterable, *, limit, ordered=True):
+    """Call the coroutine function func on the items of iterable.
+
+    Return an asynchronous iterator over the results.  iterable may be
+    an asynchronous or a regular iterable; it is consumed lazily, so that
+    at most limit calls are running or waiting for their result to be
+    consumed at any time.  Example use:
+
+        async for page in asyncio.bounded_map(fetch, urls, limit=10):
+            ...
+
+    The results are yielded in the order of the items if ordered is
+    true, or as soon as they are available otherwise.
+
+    If a call raises an exception, the other calls are cancelled.  The
+    results that were already available are yielded first, in the order
+    of the items if ordered is true, then the exception is raised by the
+    iterator.  The calls are also cancelled if the iteration stops early,
+    once the iterator is closed.
+
+    The calls are not run in a TaskGroup: a group kept open across the
+    yields would cancel the consuming task wherever it is when a call
+    fails.  The tasks are owned by the iterator instead, and like in a
+    TaskGroup never outlive it.
+    """
+    if limit < 1:
+        raise ValueError('limit must be at least 1')
+    loop = events.get_running_loop()
+    is_async = hasattr(iterable, '__aiter__')
+    if is_async:
+        next_item = aiter(iterable).__anext__
+    else:
+        next_item = iter(iterable).__next__
+    running = set()
+    # The tasks whose result was not yielded yet: all of them in the order
+    # of the items if ordered is true, the done ones otherwise.
+    results = collections.deque()
+    failed = None
+    waiter = None
+
+    def _on_completion(task):
+        nonlocal failed
+        if not ordered:
+            results.append(task)
+        if (failed is None and not task.cancelled()
+                and task.exception() is not None):
+            failed = task
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(running) < limit:
+                try:
+                    if is_async:
+                        item = await next_item()
+                    else:
+                        item = next_item()
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+                    break
+                task = loop.create_task(func(item))
+                task.add_done_callback(_on_completion)
+                running.add(task)
+                if ordered:
+                    results.append(task)
+            if not running:
+                return
+            while failed is None and not (
+                    results[0].done() if ordered else results):
+                waiter = loop.create_future()
+                try:
+                    await waiter
+                finally:
+                    waiter = None
+            if failed is not None:
+                # Stop the other calls, but first hand out the results
+                # that were available before the failure.
+                for task in running:
+                    task.cancel()
+                while results and results[0] is not failed:
+                    task = results[0]
+                    if (not task.done() or task.cancelled()
+                            or task.exception() is not None):
+                        break
+                    results.popleft()
+                    running.discard(task)
+                    yield task.result()
+                running.discard(failed)
+                failed.result()
+            task = results.popleft()
+            running.discard(task)
+            yield task.result()
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await wait(running)
+            for task in running:
+                # Exceptions after the first one are not reported.
+                if not task.cancelled():
+                    task.exception()
+
+
 @types.coroutine
 def __sleep0():
     """Skip one event loop run cycle.
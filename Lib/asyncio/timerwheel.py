@@ -0,0 +1,259 @@
+"""Hierarchical timer wheel for scheduling timed callbacks."""
+
+__all__ = 'TimerWheel',
+
+import math
+
+
+class TimerWheel:
+    """Hierarchical timer wheel with O(1) insertion and cancellation.
+
+    By default, an event loop keeps TimerHandle objects in a heap, so
+    scheduling costs O(log n) and cancelled handles are only removed
+    lazily or by a periodic O(n) rebuild.  The wheel instead hashes
+    every handle into a slot by its deadline, rounded up to a multiple
+    of *tick* seconds.  A handle can thus fire up to one tick late, but
+    never early.
+
+    The wheel has *levels* levels of 2***bits* slots each; level 0
+    covers the next 2***bits* ticks, and each following level covers
+    2***bits* times the range of the previous one.  Handles on an upper
+    level are moved down ("cascaded") when the wheel reaches their
+    slot.  Deadlines beyond the range of the top level are kept in an
+    overflow slot which is redistributed every time the top level
+    wraps around.
+
+    Use loop.set_timer_wheel() to make an event loop use a wheel.
+    """
+
+    def __init__(self, tick=0.001, *, bits=8, levels=4):
+        if tick <= 0:
+            raise ValueError('tick must be greater than zero')
+        if bits <= 0:
+            raise ValueError('bits must be greater than zero')
+        if levels <= 0:
+            raise ValueError('levels must be greater than zero')
+        self._tick = tick
+        self._bits = bits
+        self._mask = (1 << bits) - 1
+        self._levels = levels
+        # Slots are dicts mapping id(handle) to handle: insertion ordered,
+        # O(1) removal, and independent of TimerHandle.__eq__().
+        self._wheels = [[{} for _ in range(1 << bits)]
+                        for _ in range(levels)]
+        # Bitmaps of non-empty slots, one per level.
+        self._bitmaps = [0] * levels
+        # Handles whose deadline has already been reached.
+        self._due = {}
+        self._overflow = {}
+        # Maps id(handle) to (slot, level, index); level is -1 for the
+        # due and overflow slots, which have no bitmap.
+        self._index = {}
+        # All ticks up to and including _current have been processed.
+        self._current = None
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} tick={self._tick} '
+                f'bits={self._bits} levels={len(self._wheels)} '
+                f'handles={len(self._index)}>')
+
+    @property
+    def tick(self):
+        return self._tick
+
+    def _ticks(self, when):
+        return math.ceil(when / self._tick)
+
+    def _time(self, ticks):
+        # Return the earliest loop time at which pop_expired() processes
+        # the tick, compensating for floating point rounding.
+        when = ticks * self._tick
+        while int(when / self._tick) < ticks:
+            when = math.nextafter(when, math.inf)
+        return when
+
+    def _insert(self, handle, ticks):
+        current = self._current
+        key = id(handle)
+        if ticks <= current:
+            slot = self._due
+            self._index[key] = (slot, -1, 0)
+            slot[key] = handle
+            return
+        # Place the handle on the lowest level at which its tick shares
+        # all higher digits with the current tick.
+        level = ((ticks ^ current).bit_length() - 1) // self._bits
+        if level < self._levels:
+            index = (ticks >> (level * self._bits)) & self._mask
+            slot = self._wheels[level][index]
+            if not slot:
+                self._bitmaps[level] |= 1 << index
+            self._index[key] = (slot, level, index)
+        else:
+            slot = self._overflow
+            self._index[key] = (slot, -1, 0)
+        slot[key] = handle
+
+    def add(self, handle, now):
+        """Schedule the TimerHandle *handle*.
+
+        *now* is the current loop time, used to initialize the wheel.
+        """
+        current = self._current
+        if current is None:
+            current = self._current = int(now / self._tick)
+        # This is _insert(), inlined since it is on the hot path.
+        ticks = math.ceil(handle._when / self._tick)
+        key = id(handle)
+        if ticks <= current:
+            slot = self._due
+            self._index[key] = (slot, -1, 0)
+        else:
+            level = ((ticks ^ current).bit_length() - 1) // self._bits
+            if level < self._levels:
+                index = (ticks >> (level * self._bits)) & self._mask
+                slot = self._wheels[level][index]
+                if not slot:
+                    self._bitmaps[level] |= 1 << index
+                self._index[key] = (slot, level, index)
+            else:
+                slot = self._overflow
+                self._index[key] = (slot, -1, 0)
+        slot[key] = handle
+
+    def remove(self, handle):
+        """Unschedule *handle*; return False if it was not scheduled."""
+        key = id(handle)
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return False
+        slot, level, index = entry
+        del slot[key]
+        if not slot and level >= 0:
+            self._bitmaps[level] &= ~(1 << index)
+        return True
+
+    def clear(self):
+        """Unschedule all handles."""
+        for handle in self.handles():
+            handle._scheduled = False
+        for wheel in self._wheels:
+            for slot in wheel:
+                slot.clear()
+        self._bitmaps = [0] * len(self._wheels)
+        self._due.clear()
+        self._overflow.clear()
+        self._index.clear()
+
+    def handles(self):
+        """Return a list of all scheduled handles, in no particular order."""
+        return [entry[0][key] for key, entry in self._index.items()]
+
+    def _next_tick(self):
+        """Return the next tick at which a slot has to be processed.
+
+        This is the tick of the earliest handle if it is on level 0,
+        otherwise the tick at which the first non-empty slot of a higher
+        level is cascaded.  Return None if only the due slot is in use.
+        """
+        current = self._current
+        bits = self._bits
+        shift = 0
+        for bitmap in self._bitmaps:
+            digit = (current >> shift) & self._mask
+            bitmap >>= digit + 1
+            if bitmap:
+                index = digit + (bitmap & -bitmap).bit_length()
+                upper = (current >> (shift + bits)) << (shift + bits)
+                return upper | (index << shift)
+            shift += bits
+        if self._overflow:
+            # Only the overflow slot is populated: skip to the wrap around
+            # of the top level preceding the earliest deadline.
+            ticks = min(self._ticks(handle._when)
+                        for handle in self._overflow.values())
+            return (ticks >> shift) << shift
+        return None
+
+    def next_deadline(self):
+        """Return the loop time at which pop_expired() has work to do.
+
+        This may be earlier than the earliest deadline, when handles
+        have to be moved down from the upper levels first.  Return None
+        if no handle is scheduled.
+        """
+        if self._due:
+            return 0.0
+        if not self._index:
+            return None
+        return self._time(self._next_tick())
+
+    def _cascade(self, level, index):
+        self._bitmaps[level] &= ~(1 << index)
+        slot = self._wheels[level][index]
+        handles = list(slot.values())
+        slot.clear()
+        for handle in handles:
+            self._insert(handle, self._ticks(handle._when))
+
+    def pop_expired(self, now):
+        """Unschedule and return the handles due at loop time *now*.
+
+        The handles are sorted by deadline.
+        """
+        if self._current is None:
+            return []
+        target = int(now / self._tick)
+        bits = self._bits
+        mask = self._mask
+        levels = len(self._wheels)
+        due = self._due
+        index = self._index
+        while len(index) > len(due):
+            # Jump straight to the next tick with work to do.
+            current = self._next_tick()
+            if current > target:
+                break
+            self._current = current
+            digit = current & mask
+            if not digit:
+                # Entered a new level 0 range: cascade the upper levels,
+                # highest first, down to the slots covering it.
+                top = 1
+                while top < levels and not (current >> (bits * top)) & mask:
+                    top += 1
+                if top == levels:
+                    # The top level wrapped around.
+                    for handle in list(self._overflow.values()):
+                        self.remove(handle)
+                        self._insert(handle, self._ticks(handle._when))
+                for level in range(min(top, levels - 1), 0, -1):
+                    self._cascade(level, (current >> (bits * level)) & mask)
+            slot = self._wheels[0][digit]
+            if slot:
+                self._bitmaps[0] &= ~(1 << digit)
+                entry = (due, -1, 0)
+                for key in slot:
+                    index[key] = entry
+                due.update(slot)
+                slot.clear()
+        if target > self._current:
+            self._current = target
+        return self._pop_due()
+
+    def _pop_due(self):
+        due = self._due
+        if not due:
+            return []
+        handles = list(due.values())
+        index = self._index
+        for key in due:
+            del index[key]
+        due.clear()
+        for handle in handles:
+            handle._scheduled = False
+        handles.sort()
+        return handles
@@ -184,6 +184,21 @@ def sendto(self, data, addr=None):
         """
         raise NotImplementedError
 
+    def set_read_batch_size(self, size):
+        """Set the maximum number of datagrams read per wakeup.
+
+        With a size greater than 1, the transport reads all the datagrams
+        already queued on the socket, up to size, each time it becomes
+        readable, and passes them in a single call to the protocol's
+        datagrams_received() method.  The default is 1: every datagram
+        is passed to datagram_received() on its own.
+        """
+        raise NotImplementedError
+
+    def get_read_batch_size(self):
+        """Get the maximum number of datagrams read per wakeup."""
+        raise NotImplementedError
+
     def abort(self):
         """Close the transport immediately.
 
@@ -168,6 +168,9 @@ def __init__(self, max_size=0, *, ctx, pending_work_items, shutdown_lock,
         super().__init__(max_size, ctx=ctx)
 
     def _on_queue_feeder_error(self, e, obj):
+        from multiprocessing.shared_memory import _OutOfBandPayload
+        if isinstance(obj, _OutOfBandPayload):
+            obj = obj.obj
         if isinstance(obj, _CallItem):
             tb = format_exception(type(e), e, e.__traceback__)
             e.__cause__ = _RemoteTraceback('\n"""\n{}"""'.format(''.join(tb)))
@@ -205,19 +208,40 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_chunk_timed(fn, chunk):
+    """ Processes a chunk like _process_chunk(), and also returns the time
+    it took and the pickled size of a result, for adaptive chunk sizing.
+
+    This function is run in a separate process.
+
+    """
+    return mp.util._timed(_process_chunk, fn, chunk)
+
+
+def _wrap_payload(obj, shared_memory_threshold):
+    """Wrap obj to pickle its large buffers to shared memory, if enabled."""
+    if shared_memory_threshold is None:
+        return obj
+    from multiprocessing.shared_memory import _OutOfBandPayload
+    return _OutOfBandPayload(obj, shared_memory_threshold)
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None,
-                     exit_pid=None):
+                     exit_pid=None, shared_memory_threshold=None):
     """Safely send back the given result or exception"""
     try:
-        result_queue.put(_ResultItem(work_id, result=result,
-                                     exception=exception, exit_pid=exit_pid))
+        result_queue.put(_wrap_payload(
+            _ResultItem(work_id, result=result, exception=exception,
+                        exit_pid=exit_pid),
+            shared_memory_threshold))
     except BaseException as e:
         exc = _ExceptionWithTraceback(e, e.__traceback__)
         result_queue.put(_ResultItem(work_id, exception=exc,
                                      exit_pid=exit_pid))
 
 
-def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None):
+def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None,
+                    shared_memory_threshold=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -229,6 +253,10 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        max_tasks: The maximum number of tasks to execute before exiting,
+            or None
+        shared_memory_threshold: The minimum size of the buffers of the
+            results to send through shared memory, or None
     """
     if initializer is not None:
         try:
@@ -257,10 +285,12 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
         except BaseException as e:
             exc = _ExceptionWithTraceback(e, e.__traceback__)
             _sendback_result(result_queue, call_item.work_id, exception=exc,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid,
+                             shared_memory_threshold=shared_memory_threshold)
         else:
             _sendback_result(result_queue, call_item.work_id, result=r,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid,
+                             shared_memory_threshold=shared_memory_threshold)
             del r
 
         # Liberate the resource as soon as possible, to avoid holding onto
@@ -324,6 +354,10 @@ def weakref_cb(_,
         # exiting safely
         self.max_tasks_per_child = executor._max_tasks_per_child
 
+        # Minimum size of the buffers of the call arguments to send through
+        # shared memory, or None
+        self.shared_memory_threshold = executor._shared_memory_threshold
+
         # A dict mapping work ids to _WorkItems e.g.
         #     {5: <_WorkItem...>, 6: <_WorkItem...>, ...}
         self.pending_work_items = executor._pending_work_items
@@ -389,11 +423,14 @@ def add_call_item_to_queue(self):
                 work_item = self.pending_work_items[work_id]
 
                 if work_item.future.set_running_or_notify_cancel():
-                    self.call_queue.put(_CallItem(work_id,
-                                                  work_item.fn,
-                                                  work_item.args,
-                                                  work_item.kwargs),
-                                        block=True)
+                    call_item = _CallItem(work_id,
+                                          work_item.fn,
+                                          work_item.args,
+                                          work_item.kwargs)
+                    self.call_queue.put(
+                        _wrap_payload(call_item,
+                                      self.shared_memory_threshold),
+                        block=True)
                 else:
                     del self.pending_work_items[work_id]
                     continue
@@ -614,7 +651,8 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 shared_memory_threshold=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -632,6 +670,10 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            shared_memory_threshold: The minimum size in bytes of the buffers
+                of the call arguments and results to send through shared
+                memory rather than through a pipe. The default of None never
+                uses shared memory. Not supported on Windows.
         """
         _check_system_limits()
 
@@ -678,6 +720,9 @@ def __init__(self, max_workers=None, mp_context=None,
                                  " supply a different mp_context.")
         self._max_tasks_per_child = max_tasks_per_child
 
+        mp.util._check_shared_memory_threshold(shared_memory_threshold)
+        self._shared_memory_threshold = shared_memory_threshold
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -760,7 +805,8 @@ def _spawn_process(self):
                   self._result_queue,
                   self._initializer,
                   self._initargs,
-                  self._max_tasks_per_child))
+                  self._max_tasks_per_child,
+                  self._shared_memory_threshold))
         p.start()
         self._processes[p.pid] = p
 
@@ -789,7 +835,7 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -800,6 +846,13 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If set to 'auto', the size of the chunks adapts to the time
+                the items take to process.
+            buffersize: The number of submitted chunks whose results have not
+                yet been yielded. If the buffer is full, iteration over the
+                iterables pauses until a result is yielded from the buffer.
+                If None, all input elements are eagerly collected, and a task
+                is submitted for each chunk.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -810,12 +863,25 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize == 'auto':
+            chunker = mp.util._AdaptiveChunker()
+            if buffersize is None:
+                # Submit the chunks lazily, so that their size can adapt to
+                # the measurements of the previous chunks.
+                buffersize = 2 * self._max_workers
+            results = super().map(partial(_process_chunk_timed, fn),
+                                  chunker.chunks(zip(*iterables)),
+                                  timeout=timeout,
+                                  buffersize=buffersize)
+            return chunker.results(results)
+
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
         results = super().map(partial(_process_chunk, fn),
                               _get_chunks(*iterables, chunksize=chunksize),
-                              timeout=timeout)
+                              timeout=timeout,
+                              buffersize=buffersize)
         return _chain_from_iterable_of_lists(results)
 
     def shutdown(self, wait=True, *, cancel_futures=False):
@@ -50,6 +50,9 @@ def mapstar(args):
 def starmapstar(args):
     return list(itertools.starmap(args[0], args[1]))
 
+def timedmapstar(args):
+    return util._timed(mapstar, args)
+
 #
 # Hack to embed stringification of remote traceback in local traceback
 #
@@ -94,12 +97,24 @@ def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__, self)
 
 
+def _shared_memory_put(put, threshold):
+    '''
+    Return a function which calls `put()` on objects wrapped to send their
+    buffers of at least `threshold` bytes through shared memory.
+    '''
+    from .shared_memory import _OutOfBandPayload
+    def put_payload(obj):
+        put(_OutOfBandPayload(obj, threshold))
+    return put_payload
+
 def worker(inqueue, outqueue, initializer=None, initargs=(), maxtasks=None,
-           wrap_exception=False):
+           wrap_exception=False, shared_memory_threshold=None):
     if (maxtasks is not None) and not (isinstance(maxtasks, int)
                                        and maxtasks >= 1):
         raise AssertionError("Maxtasks {!r} is not valid".format(maxtasks))
     put = outqueue.put
+    if shared_memory_threshold is not None:
+        put = _shared_memory_put(put, shared_memory_threshold)
     get = inqueue.get
     if hasattr(inqueue, '_writer'):
         inqueue._writer.close()
@@ -133,7 +148,7 @@ def worker(inqueue, outqueue, initializer=None, initargs=(), maxtasks=None,
             wrapped = MaybeEncodingError(e, result[1])
             util.debug("Possible encoding error while sending result: %s" % (
                 wrapped))
-            put((job, i, (False, wrapped)))
+            outqueue.put((job, i, (False, wrapped)))
 
         task = job = result = func = args = kwds = None
         completed += 1
@@ -181,14 +196,21 @@ def Process(ctx, *args, **kwds):
         return ctx.Process(*args, **kwds)
 
     def __init__(self, processes=None, initializer=None, initargs=(),
-                 maxtasksperchild=None, context=None):
+                 maxtasksperchild=None, context=None, *,
+                 shared_memory_threshold=None):
         # Attributes initialized early to make sure that they exist in
         # __del__() if __init__() raises an exception
         self._pool = []
         self._state = INIT
 
+        util._check_shared_memory_threshold(shared_memory_threshold)
+        self._shared_memory_threshold = shared_memory_threshold
+
         self._ctx = context or get_context()
         self._setup_queues()
+        if shared_memory_threshold is not None:
+            self._quick_put = _shared_memory_put(self._quick_put,
+                                                 shared_memory_threshold)
         self._taskqueue = queue.SimpleQueue()
         # The _change_notifier queue exist to wake up self._handle_workers()
         # when the cache (self._cache) is empty or when there is a change in
@@ -228,7 +250,8 @@ def __init__(self, processes=None, initializer=None, initargs=(),
             args=(self._cache, self._taskqueue, self._ctx, self.Process,
                   self._processes, self._pool, self._inqueue, self._outqueue,
                   self._initializer, self._initargs, self._maxtasksperchild,
-                  self._wrap_exception, sentinels, self._change_notifier)
+                  self._wrap_exception, sentinels, self._change_notifier,
+                  self._shared_memory_threshold)
             )
         self._worker_handler.daemon = True
         self._worker_handler._state = RUN
@@ -309,12 +332,14 @@ def _repopulate_pool(self):
                                             self._outqueue, self._initializer,
                                             self._initargs,
                                             self._maxtasksperchild,
-                                            self._wrap_exception)
+                                            self._wrap_exception,
+                                            self._shared_memory_threshold)
 
     @staticmethod
     def _repopulate_pool_static(ctx, Process, processes, pool, inqueue,
                                 outqueue, initializer, initargs,
-                                maxtasksperchild, wrap_exception):
+                                maxtasksperchild, wrap_exception,
+                                shared_memory_threshold=None):
         """Bring the number of pool processes up to the specified number,
         for use after reaping workers which have exited.
         """
@@ -323,7 +348,7 @@ def _repopulate_pool_static(ctx, Process, processes, pool, inqueue,
                         args=(inqueue, outqueue,
                               initializer,
                               initargs, maxtasksperchild,
-                              wrap_exception))
+                              wrap_exception, shared_memory_threshold))
             w.name = w.name.replace('Process', 'PoolWorker')
             w.daemon = True
             w.start()
@@ -333,14 +358,15 @@ def _repopulate_pool_static(ctx, Process, processes, pool, inqueue,
     @staticmethod
     def _maintain_pool(ctx, Process, processes, pool, inqueue, outqueue,
                        initializer, initargs, maxtasksperchild,
-                       wrap_exception):
+                       wrap_exception, shared_memory_threshold=None):
         """Clean up any exited workers and start replacements for them.
         """
         if Pool._join_exited_workers(pool):
             Pool._repopulate_pool_static(ctx, Process, processes, pool,
                                          inqueue, outqueue, initializer,
                                          initargs, maxtasksperchild,
-                                         wrap_exception)
+                                         wrap_exception,
+                                         shared_memory_threshold)
 
     def _setup_queues(self):
         self._inqueue = self._ctx.SimpleQueue()
@@ -393,11 +419,29 @@ def _guarded_task_generation(self, result_job, func, iterable):
         except Exception as e:
             yield (result_job, i+1, _helper_reraises_exception, (e,), {})
 
+    def _imap_adaptive(self, func, iterable, result):
+        # The task handler would create all the chunks before any of them
+        # is done: bound the chunks in flight so that their size adapts.
+        chunker = util._AdaptiveChunker(window=2 * self._processes)
+        result._chunker = chunker
+        stopped = lambda: self._state == TERMINATE
+        task_batches = ((func, x) for x in chunker.chunks(iterable, stopped))
+        self._taskqueue.put(
+            (
+                self._guarded_task_generation(result._job,
+                                              timedmapstar,
+                                              task_batches),
+                result._set_length
+            ))
+        return (item for chunk, _, _ in result for item in chunk)
+
     def imap(self, func, iterable, chunksize=1):
         '''
         Equivalent of `map()` -- can be MUCH slower than `Pool.map()`.
         '''
         self._check_running()
+        if chunksize == 'auto':
+            return self._imap_adaptive(func, iterable, IMapIterator(self))
         if chunksize == 1:
             result = IMapIterator(self)
             self._taskqueue.put(
@@ -427,6 +471,9 @@ def imap_unordered(self, func, iterable, chunksize=1):
         Like `imap()` method but ordering of results is arbitrary.
         '''
         self._check_running()
+        if chunksize == 'auto':
+            return self._imap_adaptive(func, iterable,
+                                       IMapUnorderedIterator(self))
         if chunksize == 1:
             result = IMapUnorderedIterator(self)
             self._taskqueue.put(
@@ -507,7 +554,7 @@ def _wait_for_updates(sentinels, change_notifier, timeout=None):
     def _handle_workers(cls, cache, taskqueue, ctx, Process, processes,
                         pool, inqueue, outqueue, initializer, initargs,
                         maxtasksperchild, wrap_exception, sentinels,
-                        change_notifier):
+                        change_notifier, shared_memory_threshold=None):
         thread = threading.current_thread()
 
         # Keep maintaining workers until the cache gets drained, unless the pool
@@ -515,7 +562,8 @@ def _handle_workers(cls, cache, taskqueue, ctx, Process, processes,
         while thread._state == RUN or (cache and thread._state != TERMINATE):
             cls._maintain_pool(ctx, Process, processes, pool, inqueue,
                                outqueue, initializer, initargs,
-                               maxtasksperchild, wrap_exception)
+                               maxtasksperchild, wrap_exception,
+                               shared_memory_threshold)
 
             current_sentinels = [*cls._get_worker_sentinels(pool), *sentinels]
 
@@ -845,6 +893,8 @@ def __init__(self, pool):
         self._index = 0
         self._length = None
         self._unsorted = {}
+        # The _AdaptiveChunker sizing the chunks, with chunksize='auto'
+        self._chunker = None
         self._cache[self._job] = self
 
     def __iter__(self):
@@ -875,6 +925,8 @@ def next(self, timeout=None):
     __next__ = next                    # XXX
 
     def _set(self, i, obj):
+        if self._chunker is not None:
+            self._chunker.chunk_done(*obj)
         with self._cond:
             if self._index == i:
                 self._items.append(obj)
@@ -906,6 +958,8 @@ def _set_length(self, length):
 class IMapUnorderedIterator(IMapIterator):
 
     def _set(self, i, obj):
+        if self._chunker is not None:
+            self._chunker.chunk_done(*obj)
         with self._cond:
             self._items.append(obj)
             self._index += 1
@@ -9,9 +9,11 @@
 
 
 from functools import partial
+import io
 import mmap
 import os
 import errno
+import pickle
 import struct
 import secrets
 import types
@@ -23,6 +25,7 @@
     import _posixshmem
     _USE_POSIX = True
 
+from . import reduction
 from . import resource_tracker
 
 _O_CREX = os.O_CREAT | os.O_EXCL
@@ -244,6 +247,145 @@ def unlink(self):
             resource_tracker.unregister(self._name, "shared_memory")
 
 
+#
+# Transfer of large buffers through shared memory, for the process pools
+#
+
+def _write_segment(data):
+    """Copy the contiguous buffer data to a new shared memory segment and
+    return the name of the segment.
+
+    The segment is registered with the resource tracker until the receiver
+    maps it with _map_segment(), so that it is not leaked if the receiver
+    never gets it.
+    """
+    shm = SharedMemory(create=True, size=data.nbytes)
+    try:
+        shm.buf[:data.nbytes] = data.cast('B')
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return shm.name
+
+
+def _map_segment(name, size):
+    """Map the shared memory segment name and remove it.
+
+    Return a memoryview of its first size bytes.  The mapping lives as long
+    as the memoryview, or the objects built on it.
+    """
+    shm = SharedMemory(name)
+    # Detach the mapping from shm, so that close() does not unmap it.
+    mapping = shm._mmap
+    shm._buf.release()
+    shm._buf = shm._mmap = None
+    shm.close()
+    shm.unlink()
+    return memoryview(mapping)[:size]
+
+
+def _remove_segment(name):
+    try:
+        _map_segment(name, 0).release()
+    except FileNotFoundError:
+        pass
+
+
+class _SharedMemoryPickler(reduction.ForkingPickler):
+    # Place the buffers of at least threshold bytes in shared memory: the
+    # out-of-band buffers of the objects supporting pickle protocol 5, and
+    # the bytes and bytearray objects, which pickle serializes in-band.
+
+    def __init__(self, file, threshold):
+        super().__init__(file, 5, buffer_callback=self._buffer_callback)
+        self._threshold = threshold
+        # (name, size) of the segments of the out-of-band buffers
+        self.buffers = []
+        # (name, size) of the segments of the bytes and bytearray objects
+        self.copied = []
+
+    def _buffer_callback(self, buf):
+        try:
+            data = buf.raw()
+        except BufferError:
+            # Not contiguous: serialize in-band.
+            return True
+        if data.nbytes < self._threshold:
+            return True
+        self.buffers.append((_write_segment(data), data.nbytes))
+        return False
+
+    def persistent_id(self, obj):
+        if type(obj) in (bytes, bytearray) and len(obj) >= self._threshold:
+            with memoryview(obj) as data:
+                self.copied.append((_write_segment(data), len(obj)))
+            return (type(obj), len(self.copied) - 1)
+        return None
+
+
+class _SharedMemoryUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, buffers, copied):
+        super().__init__(file, buffers=buffers)
+        self._copied = copied
+
+    def persistent_load(self, pid):
+        cls, index = pid
+        with self._copied[index] as data:
+            return cls(data)
+
+
+def _load_payload(data, buffers, copied):
+    # Map and remove all the segments first, so that none is leaked if
+    # unpickling fails.
+    mapped = []
+    try:
+        for name, size in buffers + copied:
+            mapped.append(_map_segment(name, size))
+    except BaseException:
+        for name, size in (buffers + copied)[len(mapped) + 1:]:
+            _remove_segment(name)
+        raise
+    unpickler = _SharedMemoryUnpickler(io.BytesIO(data),
+                                       mapped[:len(buffers)],
+                                       mapped[len(buffers):])
+    return unpickler.load()
+
+
+class _OutOfBandPayload:
+    """Wrapper pickling obj with its large buffers in shared memory.
+
+    The buffers of at least threshold bytes are copied to shared memory
+    segments instead of being serialized with the rest of obj.  Unpickling
+    the wrapper returns obj, and removes the segments: the buffers of
+    objects supporting pickle protocol 5, such as arrays, are then used in
+    place, while bytes and bytearray objects are copied out.
+
+    Only supported where shared memory segments outlive their last
+    mapping, that is not on Windows.
+    """
+
+    __slots__ = ('obj', 'threshold')
+
+    def __init__(self, obj, threshold):
+        self.obj = obj
+        self.threshold = threshold
+
+    def __reduce__(self):
+        file = io.BytesIO()
+        pickler = _SharedMemoryPickler(file, self.threshold)
+        try:
+            pickler.dump(self.obj)
+        except BaseException:
+            for name, size in pickler.buffers + pickler.copied:
+                _remove_segment(name)
+            raise
+        return _load_payload, (file.getvalue(), pickler.buffers,
+                               pickler.copied)
+
+
 _encoding = "utf8"
 
 class ShareableList:
@@ -9,7 +9,9 @@
 
 import os
 import itertools
+import pickle
 import sys
+import time
 import weakref
 import atexit
 import threading        # we want threading to install it's
@@ -466,6 +468,151 @@ def close_fds(*fds):
         os.close(fd)
 
 
+#
+# Adaptive chunk sizing for map()-like functions
+#
+
+class _AdaptiveChunker(object):
+    '''
+    Split work items into chunks which take about `target` seconds each.
+
+    The chunks start with a single item and grow, at most doubling, as the
+    measured time per item comes in: tiny items end up in large chunks,
+    which amortize the IPC overhead, and slow items in small chunks, which
+    keeps stragglers short.  The pickled size of the arguments and results
+    of a chunk, estimated from samples, is kept below `max_bytes`.
+
+    If `window` is not None, chunks() does not create a chunk while
+    `window` chunks are in flight, that is until chunk_done() is called
+    for one of them, so that the sizes of the later chunks can adapt.
+    '''
+
+    # Weight of the latest measurement in the moving averages
+    _ALPHA = 0.25
+
+    def __init__(self, target=0.02, max_bytes=1 << 20, window=None):
+        self._target = target
+        self._max_bytes = max_bytes
+        self._window = None if window is None else threading.Semaphore(window)
+        # Moving averages of the time and pickled size of the result of an
+        # item, as reported by the workers through record()
+        self._item_time = None
+        self._item_size = 0
+        # Moving average of the pickled size of the arguments of an item,
+        # sampled by chunks()
+        self._arg_size = None
+        self._largest = 1
+
+    def chunksize(self):
+        if self._item_time is None:
+            return 1
+        size = min(self._target / self._item_time, 2 * self._largest)
+        nbytes = self._item_size + (self._arg_size or 0)
+        if nbytes:
+            size = min(size, self._max_bytes / nbytes)
+        return max(1, int(size))
+
+    def record(self, n, elapsed, nbytes):
+        '''Record that a chunk of n items took elapsed seconds.'''
+        # Work around the resolution of the clock for tiny items.
+        item_time = max(elapsed / n, 1e-7)
+        if self._item_time is None:
+            self._item_time = item_time
+            self._item_size = nbytes
+        else:
+            alpha = self._ALPHA
+            self._item_time += alpha * (item_time - self._item_time)
+            self._item_size += alpha * (nbytes - self._item_size)
+        self._largest = max(self._largest, n)
+
+    def chunk_done(self, success, value):
+        '''
+        Record the outcome of a chunk in flight: value is the tuple returned
+        by _timed() if success is true, and an exception otherwise.
+        '''
+        if success:
+            results, elapsed, nbytes = value
+            if results:
+                self.record(len(results), elapsed, nbytes)
+        if self._window is not None:
+            self._window.release()
+
+    def chunks(self, iterable, stopped=None):
+        '''
+        Yield the items of iterable in tuples of chunksize() items.
+
+        While waiting for a chunk in flight to be done, return early if
+        stopped() is true.
+        '''
+        it = iter(iterable)
+        while 1:
+            if self._window is not None:
+                while not self._window.acquire(timeout=0.1):
+                    if stopped is not None and stopped():
+                        return
+            x = tuple(itertools.islice(it, self.chunksize()))
+            if not x:
+                return
+            arg_size = _pickled_size(x[0])
+            if self._arg_size is None:
+                self._arg_size = arg_size
+            else:
+                self._arg_size += self._ALPHA * (arg_size - self._arg_size)
+            yield x
+
+    def results(self, iterable):
+        '''
+        Yield the results of the items from the (results, elapsed, nbytes)
+        tuples returned by _timed() for each chunk, and record them.
+        '''
+        for chunk, elapsed, nbytes in iterable:
+            if chunk:
+                self.record(len(chunk), elapsed, nbytes)
+            # Careful not to keep references to yielded objects
+            chunk.reverse()
+            while chunk:
+                yield chunk.pop()
+
+
+def _pickled_size(obj):
+    try:
+        return len(pickle.dumps(obj))
+    except Exception:
+        return 0
+
+
+def _timed(func, *args):
+    '''
+    Call func(*args), which returns a list of results for a chunk of
+    items, in a worker.  Return the list with the time the call took and
+    the pickled size of an item, estimated from its first result.
+    '''
+    start = time.perf_counter()
+    results = func(*args)
+    elapsed = time.perf_counter() - start
+    nbytes = _pickled_size(results[0]) if results else 0
+    return results, elapsed, nbytes
+
+
+def _check_shared_memory_threshold(threshold):
+    '''
+    Validate the shared_memory_threshold argument of the process pools,
+    and start the resource tracker if it is not None.
+    '''
+    if threshold is None:
+        return
+    if not isinstance(threshold, int) or isinstance(threshold, bool):
+        raise TypeError("shared_memory_threshold must be an integer or None")
+    if threshold <= 0:
+        raise ValueError("shared_memory_threshold must be >= 1")
+    if sys.platform == 'win32':
+        raise ValueError("shared_memory_threshold is not supported on Windows")
+    # Start the resource tracker before the workers, so that they share it:
+    # a segment registered by the sender is unregistered by the receiver.
+    from . import resource_tracker
+    resource_tracker.ensure_running()
+
+
 def _cleanup_tests():
     """Cleanup multiprocessing resources when multiprocessing tests
     completed."""
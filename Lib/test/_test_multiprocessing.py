@@ -2567,6 +2567,42 @@ def test_imap_unordered(self):
         it = self.pool.imap_unordered(sqr, list(range(1000)), chunksize=100)
         self.assertEqual(sorted(it), list(map(sqr, list(range(1000)))))
 
+    def test_imap_auto_chunksize(self):
+        it = self.pool.imap(sqr, list(range(1000)), chunksize='auto')
+        self.assertEqual(list(it), list(map(sqr, list(range(1000)))))
+
+        it = self.pool.imap_unordered(sqr, list(range(1000)),
+                                      chunksize='auto')
+        self.assertEqual(sorted(it), list(map(sqr, list(range(1000)))))
+
+        it = self.pool.imap(sqr, [], chunksize='auto')
+        self.assertEqual(list(it), [])
+
+    def test_imap_auto_chunksize_handle_exception(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        it = self.pool.imap(sqr, exception_throwing_generator(20, 7),
+                            chunksize='auto')
+        self.assertRaises(SayWhenError, list, it)
+        it = self.pool.imap_unordered(sqr, exception_throwing_generator(20, 7),
+                                      chunksize='auto')
+        self.assertRaises(SayWhenError, list, it)
+        it = self.pool.imap(raise_large_valuerror, [1], chunksize='auto')
+        self.assertRaises(ValueError, list, it)
+
+    def test_imap_auto_chunksize_terminate(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        # The task handler waits for chunks to be done before creating more
+        # from the infinite iterable: it must not block terminate().
+        p = self.Pool(2)
+        it = p.imap(sqr, itertools.count(), chunksize='auto')
+        self.assertEqual(next(it), 0)
+        p.terminate()
+        p.join()
+
     def test_imap_unordered_handle_iterable_exception(self):
         if self.TYPE == 'manager':
             self.skipTest('test not appropriate for {}'.format(self.TYPE))
@@ -4347,6 +4383,78 @@ def test_shared_memory_cleaned_after_process_termination(self):
                     "resource_tracker: There appear to be 1 leaked "
                     "shared_memory objects to clean up at shutdown", err)
 
+    def _assert_segments_removed(self, segments):
+        for name, size in segments:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name)
+
+    def test_shared_memory_payload(self):
+        large = b'x' * 2048
+        array = bytearray(range(256)) * 8
+        obj = [large, bytearray(large), b'small', pickle.PickleBuffer(array)]
+        payload = shared_memory._OutOfBandPayload(obj, 1024)
+        func, (data, buffers, copied) = payload.__reduce__()
+        self.assertLess(len(data), 1024)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(len(copied), 2)
+
+        result = func(data, buffers, copied)
+        self._assert_segments_removed(buffers + copied)
+        self.assertEqual(result[:3], obj[:3])
+        self.assertIs(type(result[0]), bytes)
+        self.assertIs(type(result[1]), bytearray)
+        # The out-of-band buffer is used in place.
+        self.assertIsInstance(result[3], memoryview)
+        self.assertEqual(result[3], array)
+
+        result = pickle.loads(pickle.dumps(payload))
+        self.assertEqual(result[:3], obj[:3])
+
+    def test_shared_memory_payload_threshold(self):
+        obj = [b'x' * 100, bytearray(100),
+               pickle.PickleBuffer(bytearray(100))]
+        payload = shared_memory._OutOfBandPayload(obj, 101)
+        func, (data, buffers, copied) = payload.__reduce__()
+        self.assertEqual(buffers, [])
+        self.assertEqual(copied, [])
+        self.assertEqual(func(data, buffers, copied), obj[:2] + [bytearray(100)])
+
+    def test_shared_memory_payload_pickling_error(self):
+        segments = []
+        write_segment = shared_memory._write_segment
+        def record_segment(data):
+            segments.append(write_segment(data))
+            return segments[-1]
+
+        obj = [b'x' * 2048, threading.Lock()]
+        payload = shared_memory._OutOfBandPayload(obj, 1024)
+        with unittest.mock.patch.object(shared_memory, '_write_segment',
+                                        record_segment):
+            with self.assertRaises(TypeError):
+                pickle.dumps(payload)
+        self.assertEqual(len(segments), 1)
+        self._assert_segments_removed([(name, 0) for name in segments])
+
+    def test_shared_memory_pool(self):
+        large = os.urandom(100_000)
+        with self.Pool(2, shared_memory_threshold=1024) as p:
+            self.assertEqual(p.apply(identity, (large,)), large)
+            self.assertEqual(p.map(len, [large, b'small', bytearray(large)]),
+                             [len(large), 5, len(large)])
+            self.assertEqual(list(p.imap(identity, [bytearray(large)] * 3)),
+                             [bytearray(large)] * 3)
+            # Unpicklable results still raise MaybeEncodingError.
+            with self.assertRaises(multiprocessing.pool.MaybeEncodingError):
+                p.apply(unpickleable_result)
+        p.join()
+
+        for threshold in (0, -1):
+            with self.assertRaises(ValueError):
+                self.Pool(1, shared_memory_threshold=threshold)
+        for threshold in (1.5, True):
+            with self.assertRaises(TypeError):
+                self.Pool(1, shared_memory_threshold=threshold)
+
 #
 # Test to verify that `Finalize` works.
 #
@@ -5074,6 +5182,91 @@ def test_lock(self):
         join_process(p)
         self.assertLessEqual(new_size, old_size)
 
+#
+# Adaptive chunk sizing of Pool.imap() and ProcessPoolExecutor.map()
+#
+
+class TestAdaptiveChunker(unittest.TestCase):
+
+    def test_grow(self):
+        chunker = util._AdaptiveChunker(target=0.02)
+        self.assertEqual(chunker.chunksize(), 1)
+        # 20 items fit in the target, but chunks at most double.
+        sizes = []
+        for _ in range(6):
+            n = chunker.chunksize()
+            sizes.append(n)
+            chunker.record(n, n * 0.001, 0)
+        self.assertEqual(sizes, [1, 2, 4, 8, 16, 20])
+
+    def test_shrink(self):
+        chunker = util._AdaptiveChunker(target=0.02)
+        chunker.record(1, 1e-6, 0)
+        chunker.record(1000, 1000 * 1e-6, 0)
+        self.assertEqual(chunker.chunksize(), 2000)
+        # The items become much slower.
+        for _ in range(20):
+            chunker.record(10, 10 * 0.1, 0)
+        self.assertEqual(chunker.chunksize(), 1)
+
+    def test_max_bytes(self):
+        chunker = util._AdaptiveChunker(target=1.0, max_bytes=1000)
+        chunker.record(1, 1e-6, 100)
+        chunker.record(100, 100 * 1e-6, 100)
+        self.assertEqual(chunker.chunksize(), 10)
+        # The size of the arguments counts too.
+        next(chunker.chunks([b'x' * 300]))
+        self.assertLess(chunker.chunksize(), 4)
+
+    def test_tiny_items(self):
+        chunker = util._AdaptiveChunker(target=0.02)
+        chunker.record(1, 0.0, 0)
+        self.assertEqual(chunker.chunksize(), 2)
+
+    def test_chunks(self):
+        chunker = util._AdaptiveChunker(target=0.02)
+        chunks = chunker.chunks(range(10))
+        self.assertEqual(next(chunks), (0,))
+        chunker.record(1, 0.01, 0)
+        self.assertEqual(next(chunks), (1, 2))
+        self.assertEqual(list(chunks), [(3, 4), (5, 6), (7, 8), (9,)])
+
+    def test_results(self):
+        chunker = util._AdaptiveChunker(target=0.02)
+        results = chunker.results(iter([([1], 0.001, 10),
+                                        ([2, 3], 0.002, 10),
+                                        ([], 0.0, 0)]))
+        self.assertEqual(list(results), [1, 2, 3])
+        self.assertEqual(chunker.chunksize(), 4)
+
+    def test_window(self):
+        chunker = util._AdaptiveChunker(target=0.02, window=1)
+        stop = threading.Event()
+        chunks = chunker.chunks(range(10), stop.is_set)
+        self.assertEqual(next(chunks), (0,))
+        # The next chunk waits for the first one to be done.
+        timer = threading.Timer(0.2, chunker.chunk_done,
+                                (True, ([0], 0.01, 10)))
+        timer.start()
+        start = time.monotonic()
+        self.assertEqual(next(chunks), (1, 2))
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+        timer.join()
+        # Failed chunks are done too, but are not measured.
+        chunker.chunk_done(False, ZeroDivisionError())
+        self.assertEqual(next(chunks), (3, 4))
+        stop.set()
+        self.assertEqual(list(chunks), [])
+
+    def test_timed(self):
+        results, elapsed, nbytes = util._timed(list, 'abc')
+        self.assertEqual(results, ['a', 'b', 'c'])
+        self.assertGreaterEqual(elapsed, 0)
+        self.assertEqual(nbytes, len(pickle.dumps('a')))
+        results, elapsed, nbytes = util._timed(list, '')
+        self.assertEqual((results, nbytes), ([], 0))
+
+
 #
 # Check that non-forked child processes do not inherit unneeded fds/handles
 #
@@ -0,0 +1,192 @@
+"""Tests for asyncio/instrumentation.py"""
+
+import time
+import unittest
+
+import asyncio
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class HistogramTests(unittest.TestCase):
+
+    def test_invalid_unit(self):
+        with self.assertRaises(ValueError):
+            asyncio.Histogram(0)
+
+    def test_empty(self):
+        h = asyncio.Histogram()
+        self.assertEqual(h.count, 0)
+        self.assertEqual(h.mean(), 0)
+        self.assertEqual(h.percentile(99), 0)
+        self.assertEqual(h.buckets(), [])
+        self.assertEqual(repr(h), '<Histogram count=0>')
+
+    def test_add(self):
+        h = asyncio.Histogram(unit=1)
+        for value in (0, 1, 2, 3, 100):
+            h.add(value)
+        self.assertEqual(h.count, 5)
+        self.assertEqual(h.total, 106)
+        self.assertEqual(h.max, 100)
+        self.assertEqual(h.mean(), 106 / 5)
+        self.assertEqual(h.buckets(), [(1, 1), (2, 1), (4, 2), (8, 0),
+                                       (16, 0), (32, 0), (64, 0), (128, 1)])
+
+    def test_percentile(self):
+        h = asyncio.Histogram(unit=1)
+        for value in range(100):
+            h.add(value)
+        self.assertEqual(h.percentile(0), 1)
+        self.assertEqual(h.percentile(50), 64)
+        # The upper bound of the last bucket is capped to the maximum.
+        self.assertEqual(h.percentile(99), 99)
+        self.assertEqual(h.percentile(100), 99)
+        with self.assertRaises(ValueError):
+            h.percentile(101)
+
+    def test_clear(self):
+        h = asyncio.Histogram()
+        h.add(0.5)
+        h.clear()
+        self.assertEqual((h.count, h.total, h.max, h.buckets()),
+                         (0, 0, 0, []))
+
+
+class LoopInstrumentTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        super().tearDown()
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.LoopInstrument(task_sample_interval=-1)
+        with self.assertRaises(TypeError):
+            self.loop.set_instrument(object())
+
+    def test_default(self):
+        self.assertIsNone(self.loop.get_instrument())
+
+    def test_iterations(self):
+        instrument = asyncio.LoopInstrument()
+        self.loop.set_instrument(instrument)
+        self.assertIs(self.loop.get_instrument(), instrument)
+
+        def block():
+            time.sleep(0.01)
+
+        async def main():
+            for _ in range(3):
+                self.loop.call_soon(block)
+            await asyncio.sleep(0.02)
+
+        self.loop.run_until_complete(main())
+        self.loop.set_instrument(None)
+
+        self.assertGreater(instrument.iteration_time.count, 2)
+        self.assertEqual(instrument.select_time.count,
+                         instrument.iteration_time.count)
+        self.assertEqual(instrument.callback_time.count,
+                         instrument.iteration_time.count)
+        self.assertGreaterEqual(instrument.ready_count.max, 3)
+        self.assertGreaterEqual(instrument.callback_time.max, 0.03)
+        # The loop waits in the selector for the end of the sleep.
+        self.assertGreater(instrument.select_time.total, 0)
+        self.assertGreaterEqual(
+            instrument.iteration_time.total,
+            instrument.select_time.total + instrument.callback_time.total)
+        self.assertEqual(instrument.cpu_time, {})
+
+    def test_task_sampling(self):
+        instrument = asyncio.LoopInstrument(task_sample_interval=1)
+        self.loop.set_instrument(instrument)
+
+        async def spin():
+            end = time.thread_time() + 0.02
+            while time.thread_time() < end:
+                pass
+
+        async def idle():
+            await asyncio.sleep(0)
+
+        def callback():
+            pass
+
+        async def main():
+            self.loop.call_soon(callback)
+            await asyncio.gather(spin(), idle())
+
+        self.loop.run_until_complete(main())
+
+        cpu_time = instrument.cpu_time
+        spin_name = spin.__qualname__
+        self.assertIn(spin_name, cpu_time)
+        self.assertIn(idle.__qualname__, cpu_time)
+        self.assertIn(callback.__qualname__, cpu_time)
+        self.assertGreaterEqual(cpu_time[spin_name].total, 0.02)
+        self.assertEqual(max(cpu_time, key=lambda name: cpu_time[name].total),
+                         spin_name)
+
+    def test_sample_interval(self):
+        samples = []
+
+        class Instrument(asyncio.LoopInstrument):
+            def callback_sampled(self, handle, task, cpu_time, wall_time):
+                samples.append((handle._callback, task))
+
+        instrument = Instrument(task_sample_interval=3)
+        self.loop.set_instrument(instrument)
+        calls = []
+        for i in range(7):
+            self.loop.call_soon(calls.append, i)
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+        self.assertEqual(calls, list(range(7)))
+        # The 3rd and 6th callbacks are sampled.
+        self.assertEqual(samples, [(calls.append, None)] * 2)
+        self.assertEqual(instrument._sample_countdown, 1)
+
+    def test_cancelled_handles_not_sampled(self):
+        instrument = asyncio.LoopInstrument(task_sample_interval=1)
+        self.loop.set_instrument(instrument)
+        self.loop.call_soon(print).cancel()
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.assertNotIn(print.__qualname__, instrument.cpu_time)
+
+    def test_debug(self):
+        instrument = asyncio.LoopInstrument(task_sample_interval=1)
+        self.loop.set_instrument(instrument)
+        self.loop.set_debug(True)
+        self.loop.slow_callback_duration = 0.0
+
+        async def main():
+            pass
+
+        with self.assertLogs('asyncio', 'WARNING') as cm:
+            self.loop.run_until_complete(main())
+        self.assertIn(main.__qualname__, instrument.cpu_time)
+        self.assertTrue(any('Executing' in line for line in cm.output))
+
+    def test_clear(self):
+        instrument = asyncio.LoopInstrument(task_sample_interval=1)
+        self.loop.set_instrument(instrument)
+        self.loop.run_until_complete(asyncio.sleep(0))
+        instrument.clear()
+        self.assertEqual(instrument.iteration_time.count, 0)
+        self.assertEqual(instrument.ready_count.count, 0)
+        self.assertEqual(instrument.cpu_time, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,307 @@
+"""Tests for asyncio/pools.py"""
+
+import unittest
+
+import asyncio
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class ConnectionPoolTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+        self.server_writers = []
+        self.server = self.loop.run_until_complete(asyncio.start_server(
+            self.handle_client, '127.0.0.1', 0))
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    def tearDown(self):
+        for writer in self.server_writers:
+            writer.close()
+        self.server.close()
+        self.loop.run_until_complete(self.server.wait_closed())
+        self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        self.loop.close()
+        super().tearDown()
+
+    async def handle_client(self, reader, writer):
+        # Echo lines; close the connection on b'quit\n'.
+        self.server_writers.append(writer)
+        while True:
+            line = await reader.readline()
+            if not line or line == b'quit\n':
+                break
+            writer.write(line)
+            await writer.drain()
+        writer.close()
+
+    async def echo(self, conn, data=b'ping\n'):
+        conn.writer.write(data)
+        return await conn.reader.readline()
+
+    def run_pool(self, main, **kwargs):
+        async def runner():
+            async with asyncio.ConnectionPool(**kwargs) as pool:
+                return await main(pool)
+        return self.loop.run_until_complete(runner())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(limit_per_key=0)
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(idle_timeout=-1)
+
+    def test_reuse(self):
+        async def main(pool):
+            async with pool.connection('127.0.0.1', self.port) as conn:
+                self.assertEqual(await self.echo(conn), b'ping\n')
+                first = conn.writer
+            async with pool.connection('127.0.0.1', self.port) as conn:
+                self.assertEqual(await self.echo(conn), b'ping\n')
+                self.assertIs(conn.writer, first)
+            self.assertEqual(conn.key, ('127.0.0.1', self.port, None))
+            return pool.statistics()
+
+        stats = self.run_pool(main)
+        self.assertEqual(stats, {
+            'connections': 1, 'idle': 1, 'waiting': 0, 'created': 1,
+            'reused': 1, 'discarded': 0,
+        })
+
+    def test_keys(self):
+        async def main(pool):
+            server = await asyncio.start_server(
+                self.handle_client, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                conn1 = await pool.acquire('127.0.0.1', self.port)
+                pool.release(conn1)
+                conn2 = await pool.acquire('127.0.0.1', port)
+                self.assertIsNot(conn2.writer, conn1.writer)
+                self.assertEqual(conn2.key, ('127.0.0.1', port, None))
+                pool.release(conn2)
+                return pool.statistics()
+            finally:
+                server.close()
+
+        stats = self.run_pool(main)
+        self.assertEqual((stats['created'], stats['idle']), (2, 2))
+
+    def test_discard_on_error(self):
+        async def main(pool):
+            with self.assertRaises(ZeroDivisionError):
+                async with pool.connection('127.0.0.1', self.port) as conn:
+                    1/0
+            self.assertTrue(conn.writer.is_closing())
+            return pool.statistics()
+
+        stats = self.run_pool(main)
+        self.assertEqual((stats['connections'], stats['discarded']), (0, 1))
+
+    def test_release_errors(self):
+        async def main(pool):
+            conn = await pool.acquire('127.0.0.1', self.port)
+            pool.release(conn)
+            with self.assertRaises(RuntimeError):
+                pool.release(conn)
+            async with asyncio.ConnectionPool() as other:
+                with self.assertRaises(ValueError):
+                    other.release(conn)
+
+        self.run_pool(main)
+
+    def test_unread_data_not_reused(self):
+        async def main(pool):
+            conn = await pool.acquire('127.0.0.1', self.port)
+            conn.writer.write(b'ping\nping\n')
+            await conn.reader.readline()
+            await conn.reader.readline()
+            conn.writer.write(b'unread\n')
+            await asyncio.sleep(0.01)
+            pool.release(conn)
+            return pool.statistics()
+
+        stats = self.run_pool(main)
+        self.assertEqual((stats['idle'], stats['discarded']), (0, 1))
+
+    def test_closed_by_peer(self):
+        async def main(pool):
+            conn = await pool.acquire('127.0.0.1', self.port)
+            pool.release(conn)
+            # The server closes the idle connection.
+            conn.writer.write(b'quit\n')
+            await asyncio.sleep(0.01)
+            conn2 = await pool.acquire('127.0.0.1', self.port)
+            self.assertIsNot(conn2.writer, conn.writer)
+            self.assertEqual(await self.echo(conn2), b'ping\n')
+            pool.release(conn2)
+            return pool.statistics()
+
+        stats = self.run_pool(main)
+        self.assertEqual(stats, {
+            'connections': 1, 'idle': 1, 'waiting': 0, 'created': 2,
+            'reused': 0, 'discarded': 1,
+        })
+
+    def test_health_check(self):
+        checked = []
+
+        async def health_check(conn):
+            checked.append(conn)
+            return await self.echo(conn) == b'ping\n'
+
+        async def main(pool):
+            conn = await pool.acquire('127.0.0.1', self.port)
+            pool.release(conn)
+            conn2 = await pool.acquire('127.0.0.1', self.port)
+            self.assertIs(conn2, conn)
+            pool.release(conn2)
+
+        self.run_pool(main, health_check=health_check)
+        self.assertEqual(len(checked), 1)
+
+    def test_failed_health_check(self):
+        async def main(pool):
+            conn = await pool.acquire('127.0.0.1', self.port)
+            pool.release(conn)
+            conn2 = await pool.acquire('127.0.0.1', self.port)
+            self.assertIsNot(conn2, conn)
+            self.assertTrue(conn.writer.is_closing())
+            pool.release(conn2)
+            return pool.statistics()
+
+        stats = self.run_pool(main, health_check=lambda conn: False)
+        self.assertEqual(stats['created'], 2)
+        self.assertEqual(stats['connections'], 1)
+
+    def test_health_check_error(self):
+        def health_check(conn):
+            raise ZeroDivisionError
+
+        async def main(pool):
+            pool.release(await pool.acquire('127.0.0.1', self.port))
+            with self.assertRaises(ZeroDivisionError):
+                await pool.acquire('127.0.0.1', self.port)
+            return pool.statistics()
+
+        stats = self.run_pool(main, health_check=health_check)
+        self.assertEqual((stats['connections'], stats['discarded']), (0, 1))
+
+    def test_limit_and_fairness(self):
+        order = []
+
+        async def worker(pool, i):
+            async with pool.connection('127.0.0.1', self.port) as conn:
+                order.append(i)
+                await self.echo(conn)
+                await asyncio.sleep(0.01)
+
+        async def main(pool):
+            tasks = [asyncio.create_task(worker(pool, i)) for i in range(6)]
+            await asyncio.sleep(0.005)
+            stats = pool.statistics()
+            self.assertEqual(stats['connections'], 2)
+            self.assertEqual(stats['waiting'], 4)
+            await asyncio.gather(*tasks)
+            return pool.statistics()
+
+        stats = self.run_pool(main, limit_per_key=2)
+        self.assertEqual(order, list(range(6)))
+        self.assertEqual((stats['created'], stats['connections']), (2, 2))
+
+    def test_discard_wakes_waiter(self):
+        async def main(pool):
+            conn = await pool.acquire('127.0.0.1', self.port)
+            waiter = asyncio.create_task(
+                pool.acquire('127.0.0.1', self.port))
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+            pool.release(conn, discard=True)
+            conn2 = await waiter
+            self.assertIsNot(conn2.writer, conn.writer)
+            pool.release(conn2)
+            return pool.statistics()
+
+        stats = self.run_pool(main, limit_per_key=1)
+        self.assertEqual((stats['created'], stats['connections']), (2, 1))
+
+    def test_cancelled_waiter(self):
+        async def main(pool):
+            conn = await pool.acquire('127.0.0.1', self.port)
+            first = asyncio.create_task(pool.acquire('127.0.0.1', self.port))
+            second = asyncio.create_task(
+                pool.acquire('127.0.0.1', self.port))
+            await asyncio.sleep(0)
+            # The connection is handed over to first, which is cancelled
+            # before it runs: second gets the connection.
+            pool.release(conn)
+            first.cancel()
+            conn2 = await second
+            self.assertIs(conn2, conn)
+            self.assertTrue(first.cancelled())
+            pool.release(conn2)
+            return pool.statistics()
+
+        stats = self.run_pool(main, limit_per_key=1)
+        self.assertEqual((stats['created'], stats['waiting']), (1, 0))
+
+    def test_connect_error(self):
+        async def main(pool):
+            conn = await pool.acquire('127.0.0.1', self.port)
+            self.server.close()
+            await self.server.wait_closed()
+            pool.release(conn, discard=True)
+            with self.assertRaises(OSError):
+                await pool.acquire('127.0.0.1', self.port)
+            return pool.statistics()
+
+        stats = self.run_pool(main, limit_per_key=1)
+        self.assertEqual(stats['connections'], 0)
+
+    def test_idle_timeout(self):
+        async def main(pool):
+            conn = await pool.acquire('127.0.0.1', self.port)
+            pool.release(conn)
+            self.assertEqual(pool.statistics()['idle'], 1)
+            await asyncio.sleep(0.1)
+            self.assertTrue(conn.writer.is_closing())
+            return pool.statistics()
+
+        stats = self.run_pool(main, idle_timeout=0.01)
+        self.assertEqual(stats, {
+            'connections': 0, 'idle': 0, 'waiting': 0, 'created': 1,
+            'reused': 0, 'discarded': 1,
+        })
+
+    def test_close(self):
+        async def main():
+            pool = asyncio.ConnectionPool(limit_per_key=1)
+            idle = await pool.acquire('127.0.0.1', self.port)
+            pool.release(idle)
+            busy = await pool.acquire('localhost', self.port)
+            waiter = asyncio.create_task(
+                pool.acquire('localhost', self.port))
+            await asyncio.sleep(0)
+            await pool.close()
+            self.assertTrue(idle.writer.is_closing())
+            self.assertFalse(busy.writer.is_closing())
+            with self.assertRaisesRegex(RuntimeError, 'closed'):
+                await waiter
+            with self.assertRaisesRegex(RuntimeError, 'closed'):
+                await pool.acquire('127.0.0.1', self.port)
+            pool.release(busy)
+            self.assertTrue(busy.writer.is_closing())
+            self.assertEqual(pool.statistics()['connections'], 0)
+            self.assertIn('closed', repr(pool))
+
+        self.loop.run_until_complete(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
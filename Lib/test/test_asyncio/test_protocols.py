@@ -50,8 +50,17 @@ def test_datagram_protocol(self):
         self.assertIsNone(dp.connection_lost(f))
         self.assertIsNone(dp.error_received(f))
         self.assertIsNone(dp.datagram_received(f, f))
+        self.assertIsNone(dp.datagrams_received([(f, f)]))
         self.assertFalse(hasattr(dp, '__dict__'))
 
+    def test_datagrams_received(self):
+        dp = asyncio.DatagramProtocol()
+        with mock.patch.object(asyncio.DatagramProtocol,
+                               'datagram_received') as datagram_received:
+            dp.datagrams_received([(b'a', 1), (b'b', 2)])
+        self.assertEqual(datagram_received.call_args_list,
+                         [mock.call(b'a', 1), mock.call(b'b', 2)])
+
     def test_subprocess_protocol(self):
         f = mock.Mock()
         sp = asyncio.SubprocessProtocol()
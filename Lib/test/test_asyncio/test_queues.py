@@ -454,6 +454,150 @@ async def test_order(self):
         self.assertEqual([1, 2, 3], items)
 
 
+class QueueManyTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_get_many(self):
+        q = asyncio.Queue()
+        q.put_nowait(1)
+        q.put_nowait(2)
+        q.put_nowait(3)
+        self.assertEqual([1, 2], await q.get_many(2))
+        self.assertEqual([3], await q.get_many())
+        self.assertTrue(q.empty())
+
+    async def test_get_many_invalid(self):
+        q = asyncio.Queue()
+        with self.assertRaises(ValueError):
+            await q.get_many(0)
+
+    async def test_get_many_blocking(self):
+        q = asyncio.Queue()
+        getter = asyncio.create_task(q.get_many(10))
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+        await q.put_many([1, 2, 3])
+        self.assertEqual([1, 2, 3], await getter)
+        self.assertFalse(q._getters)
+
+    async def test_get_many_timeout(self):
+        q = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self.assertEqual([], await q.get_many(timeout=0.01))
+        self.assertGreaterEqual(loop.time() - start, 0.01)
+        self.assertFalse(q._getters)
+        self.assertEqual([], await q.get_many(timeout=0))
+
+        q.put_nowait(1)
+        self.assertEqual([1], await q.get_many(timeout=0))
+
+    async def test_get_many_timeout_not_expired(self):
+        q = asyncio.Queue()
+        getter = asyncio.create_task(q.get_many(timeout=10))
+        await asyncio.sleep(0)
+        q.put_nowait(1)
+        self.assertEqual([1], await getter)
+
+    async def test_get_many_cancelled(self):
+        q = asyncio.Queue()
+        getter = asyncio.create_task(q.get_many(timeout=10))
+        await asyncio.sleep(0)
+        getter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await getter
+        self.assertFalse(q._getters)
+
+    async def test_get_many_wakes_putters(self):
+        q = asyncio.Queue(maxsize=2)
+        q.put_nowait(1)
+        q.put_nowait(2)
+        putters = [asyncio.create_task(q.put(i)) for i in (3, 4, 5)]
+        await asyncio.sleep(0)
+        self.assertEqual(len(q._putters), 3)
+
+        self.assertEqual([1, 2], await q.get_many())
+        await asyncio.sleep(0)
+        self.assertEqual([3, 4], list(q._queue))
+        self.assertFalse(putters[2].done())
+        self.assertEqual([3, 4], await q.get_many())
+        await asyncio.gather(*putters)
+        self.assertEqual([5], await q.get_many())
+
+    async def test_put_many(self):
+        q = asyncio.Queue()
+        await q.put_many(i for i in range(5))
+        self.assertEqual(5, q.qsize())
+        self.assertEqual(5, q._unfinished_tasks)
+        self.assertEqual([0, 1, 2, 3, 4], await q.get_many())
+        await q.put_many([])
+        self.assertTrue(q.empty())
+
+    async def test_put_many_maxsize(self):
+        q = asyncio.Queue(maxsize=2)
+        putter = asyncio.create_task(q.put_many(range(5)))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual([0, 1], list(q._queue))
+
+        received = []
+        while len(received) < 5:
+            self.assertLessEqual(q.qsize(), 2)
+            received.extend(await q.get_many())
+        await putter
+        self.assertEqual([0, 1, 2, 3, 4], received)
+
+    async def test_put_many_float_maxsize(self):
+        q = asyncio.Queue(maxsize=1.3)
+        putter = asyncio.create_task(q.put_many([1, 2, 3]))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual([1, 2], list(q._queue))
+        self.assertTrue(q.full())
+        self.assertEqual([1, 2], await q.get_many())
+        await putter
+        self.assertEqual([3], await q.get_many())
+
+    async def test_put_many_cancelled(self):
+        q = asyncio.Queue(maxsize=2)
+        putter = asyncio.create_task(q.put_many(range(5)))
+        await asyncio.sleep(0)
+        putter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await putter
+        self.assertEqual([0, 1], list(q._queue))
+        self.assertFalse(q._putters)
+
+    async def test_put_many_wakes_getters(self):
+        q = asyncio.Queue()
+        getters = [asyncio.create_task(q.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        await q.put_many([1, 2])
+        # Only as many getters as items are woken up.
+        self.assertEqual(len(q._getters), 1)
+        self.assertEqual([1, 2], await asyncio.gather(*getters[:2]))
+        q.put_nowait(3)
+        self.assertEqual(3, await getters[2])
+
+    async def test_join(self):
+        q = asyncio.Queue()
+        await q.put_many(range(10))
+        items = await q.get_many()
+        for _ in items:
+            q.task_done()
+        await q.join()
+
+    async def test_lifo_queue(self):
+        q = asyncio.LifoQueue()
+        await q.put_many([1, 3, 2])
+        self.assertEqual([2, 3, 1], await q.get_many())
+
+    async def test_priority_queue(self):
+        q = asyncio.PriorityQueue(maxsize=10)
+        await q.put_many([5, 1, 3, 2, 4])
+        self.assertEqual([1, 2], await q.get_many(2))
+        self.assertEqual([3, 4, 5], await q.get_many())
+
+
 class _QueueJoinTestMixin:
 
     q_class = None
@@ -0,0 +1,366 @@
+"""Tests for asyncio/resolvers.py"""
+
+import os
+import socket
+import tempfile
+import unittest
+from unittest import mock
+
+import asyncio
+from asyncio import events
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+HOSTS = """\
+# Comments and blank lines are ignored.
+
+127.0.0.1   localhost example.test   # trailing comment
+::1         localhost
+127.0.0.2   other.test
+"""
+
+
+class SlowResolver:
+    """Resolver whose answers wait until release() is called."""
+
+    def __init__(self, resolver):
+        self.resolver = resolver
+        self.queries = 0
+        self._event = asyncio.Event()
+
+    def release(self):
+        self._event.set()
+
+    async def getaddrinfo(self, host, port, **kwargs):
+        self.queries += 1
+        await self._event.wait()
+        return await self.resolver.getaddrinfo(host, port, **kwargs)
+
+
+class ResolverTestCase(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = self.new_test_loop()
+        self.hosts = asyncio.HostsResolver.from_text(HOSTS)
+
+    def getaddrinfo(self, resolver, host, port=80, **kwargs):
+        return self.loop.run_until_complete(
+            resolver.getaddrinfo(host, port, **kwargs))
+
+
+class HostsResolverTests(ResolverTestCase):
+
+    def test_from_text(self):
+        infos = self.getaddrinfo(self.hosts, 'example.test',
+                                 type=socket.SOCK_STREAM)
+        self.assertEqual([info[4][:2] for info in infos],
+                         [('127.0.0.1', 80)])
+        infos = self.getaddrinfo(self.hosts, 'LocalHost', 8080,
+                                 type=socket.SOCK_STREAM)
+        self.assertEqual({info[0] for info in infos},
+                         {socket.AF_INET, socket.AF_INET6})
+        self.assertEqual(self.hosts.queries, 2)
+
+    def test_family(self):
+        infos = self.getaddrinfo(self.hosts, 'localhost',
+                                 family=socket.AF_INET,
+                                 type=socket.SOCK_STREAM)
+        self.assertEqual([info[4] for info in infos], [('127.0.0.1', 80)])
+
+    def test_bytes_host(self):
+        infos = self.getaddrinfo(self.hosts, b'other.test',
+                                 type=socket.SOCK_STREAM)
+        self.assertEqual(infos[0][4], ('127.0.0.2', 80))
+
+    def test_unknown(self):
+        with self.assertRaises(socket.gaierror) as cm:
+            self.getaddrinfo(self.hosts, 'unknown.test')
+        self.assertEqual(cm.exception.errno, socket.EAI_NONAME)
+        with self.assertRaises(socket.gaierror):
+            self.getaddrinfo(self.hosts, 'other.test',
+                             family=socket.AF_INET6)
+
+    def test_from_file(self):
+        with tempfile.NamedTemporaryFile('w', delete=False) as f:
+            f.write(HOSTS)
+        self.addCleanup(os.unlink, f.name)
+        resolver = asyncio.HostsResolver.from_file(f.name)
+        infos = self.getaddrinfo(resolver, 'other.test',
+                                 type=socket.SOCK_STREAM)
+        self.assertEqual(infos[0][4], ('127.0.0.2', 80))
+
+
+class CachingResolverTests(ResolverTestCase):
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.CachingResolver(ttl=-1)
+        with self.assertRaises(ValueError):
+            asyncio.CachingResolver(negative_ttl=-1)
+        with self.assertRaises(ValueError):
+            asyncio.CachingResolver(maxsize=0)
+
+    def test_default_resolver(self):
+        resolver = asyncio.CachingResolver()
+        self.assertIsInstance(resolver.resolver, asyncio.ThreadedResolver)
+
+    def test_positive_cache(self):
+        resolver = asyncio.CachingResolver(self.hosts, ttl=10)
+        first = self.getaddrinfo(resolver, 'example.test')
+        second = self.getaddrinfo(resolver, 'example.test')
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(self.hosts.queries, 1)
+        # The port and the other arguments are part of the query.
+        self.getaddrinfo(resolver, 'example.test', 443)
+        self.getaddrinfo(resolver, 'example.test', type=socket.SOCK_STREAM)
+        self.assertEqual(self.hosts.queries, 3)
+        self.assertEqual(resolver.statistics(), {
+            'hits': 1, 'negative_hits': 0, 'misses': 3, 'coalesced': 0,
+            'evictions': 0, 'entries': 3,
+        })
+
+    def test_mutating_answer(self):
+        resolver = asyncio.CachingResolver(self.hosts)
+        self.getaddrinfo(resolver, 'example.test').clear()
+        self.assertTrue(self.getaddrinfo(resolver, 'example.test'))
+
+    def test_ttl(self):
+        resolver = asyncio.CachingResolver(self.hosts, ttl=10)
+        self.getaddrinfo(resolver, 'example.test')
+        self.loop.advance_time(9)
+        self.getaddrinfo(resolver, 'example.test')
+        self.assertEqual(self.hosts.queries, 1)
+        self.loop.advance_time(1)
+        self.getaddrinfo(resolver, 'example.test')
+        self.assertEqual(self.hosts.queries, 2)
+        stats = resolver.statistics()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+
+    def test_zero_ttl(self):
+        resolver = asyncio.CachingResolver(self.hosts, ttl=0)
+        self.getaddrinfo(resolver, 'example.test')
+        self.getaddrinfo(resolver, 'example.test')
+        self.assertEqual(self.hosts.queries, 2)
+        self.assertEqual(resolver.statistics()['entries'], 0)
+
+    def test_negative_cache(self):
+        resolver = asyncio.CachingResolver(self.hosts, negative_ttl=5)
+        for _ in range(3):
+            with self.assertRaises(socket.gaierror):
+                self.getaddrinfo(resolver, 'unknown.test')
+        self.assertEqual(self.hosts.queries, 1)
+        self.loop.advance_time(5)
+        with self.assertRaises(socket.gaierror):
+            self.getaddrinfo(resolver, 'unknown.test')
+        self.assertEqual(self.hosts.queries, 2)
+        stats = resolver.statistics()
+        self.assertEqual((stats['negative_hits'], stats['misses']), (2, 2))
+
+    def test_negative_cache_new_exception(self):
+        resolver = asyncio.CachingResolver(self.hosts, negative_ttl=5)
+        errors = []
+        for _ in range(3):
+            with self.assertRaises(socket.gaierror) as cm:
+                self.getaddrinfo(resolver, 'unknown.test')
+            errors.append(cm.exception)
+        # Each hit raises its own exception, with a traceback of its own.
+        self.assertIsNot(errors[1], errors[2])
+        self.assertEqual(errors[1].args, errors[0].args)
+        self.assertEqual(errors[2].errno, socket.EAI_NONAME)
+
+    def test_negative_cache_disabled(self):
+        resolver = asyncio.CachingResolver(self.hosts, negative_ttl=0)
+        for _ in range(2):
+            with self.assertRaises(socket.gaierror):
+                self.getaddrinfo(resolver, 'unknown.test')
+        self.assertEqual(self.hosts.queries, 2)
+
+    def test_other_errors_not_cached(self):
+        backend = mock.Mock()
+        backend.getaddrinfo = mock.AsyncMock(side_effect=OSError)
+        resolver = asyncio.CachingResolver(backend)
+        for _ in range(2):
+            with self.assertRaises(OSError):
+                self.getaddrinfo(resolver, 'example.test')
+        self.assertEqual(backend.getaddrinfo.await_count, 2)
+        self.assertEqual(resolver.statistics()['entries'], 0)
+
+    def test_coalescing(self):
+        backend = SlowResolver(self.hosts)
+        resolver = asyncio.CachingResolver(backend)
+
+        async def main():
+            lookups = [asyncio.ensure_future(
+                resolver.getaddrinfo('example.test', 80)) for _ in range(5)]
+            await asyncio.sleep(0)
+            backend.release()
+            return await asyncio.gather(*lookups)
+
+        results = self.loop.run_until_complete(main())
+        self.assertEqual(backend.queries, 1)
+        self.assertTrue(all(result == results[0] for result in results))
+        stats = resolver.statistics()
+        self.assertEqual((stats['misses'], stats['coalesced']), (1, 4))
+
+    def test_coalescing_errors(self):
+        backend = SlowResolver(self.hosts)
+        resolver = asyncio.CachingResolver(backend)
+
+        async def main():
+            lookups = [asyncio.ensure_future(
+                resolver.getaddrinfo('unknown.test', 80)) for _ in range(3)]
+            await asyncio.sleep(0)
+            backend.release()
+            return await asyncio.gather(*lookups, return_exceptions=True)
+
+        results = self.loop.run_until_complete(main())
+        self.assertEqual(backend.queries, 1)
+        for result in results:
+            self.assertIsInstance(result, socket.gaierror)
+            self.assertEqual(result.args, results[0].args)
+        # Each waiter raises its own exception, with a traceback of its own.
+        self.assertEqual(len({id(result) for result in results}), 3)
+
+    def test_several_loops(self):
+        loop = self.loop
+        hosts = self.hosts
+
+        class BlockingResolver:
+            # Blocks the lookups made in the first loop until released.
+            future = None
+
+            async def getaddrinfo(self, host, port, **kwargs):
+                if events.get_running_loop() is loop:
+                    self.future = loop.create_future()
+                    await self.future
+                return await hosts.getaddrinfo(host, port, **kwargs)
+
+        backend = BlockingResolver()
+        resolver = asyncio.CachingResolver(backend)
+        first = loop.create_task(resolver.getaddrinfo('example.test', 80))
+        test_utils.run_briefly(loop)
+        self.assertIsNotNone(backend.future)
+
+        # The lookup pending in the first loop is not awaited from another.
+        other = self.new_test_loop()
+        self.assertTrue(other.run_until_complete(
+            resolver.getaddrinfo('example.test', 80)))
+        backend.future.set_result(None)
+        self.assertTrue(loop.run_until_complete(first))
+        self.assertEqual(hosts.queries, 2)
+
+    def test_cancelled_waiter(self):
+        backend = SlowResolver(self.hosts)
+        resolver = asyncio.CachingResolver(backend)
+
+        async def main():
+            first = asyncio.ensure_future(
+                resolver.getaddrinfo('example.test', 80))
+            second = asyncio.ensure_future(
+                resolver.getaddrinfo('example.test', 80))
+            await asyncio.sleep(0)
+            first.cancel()
+            backend.release()
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+            return await second
+
+        self.assertTrue(self.loop.run_until_complete(main()))
+        self.assertEqual(backend.queries, 1)
+        # The lookup completed for the remaining waiter and was cached.
+        self.getaddrinfo(resolver, 'example.test')
+        self.assertEqual(backend.queries, 1)
+
+    def test_maxsize(self):
+        resolver = asyncio.CachingResolver(self.hosts, maxsize=2)
+        self.getaddrinfo(resolver, 'example.test')
+        self.getaddrinfo(resolver, 'other.test')
+        # Use example.test, so that other.test is evicted first.
+        self.getaddrinfo(resolver, 'example.test')
+        self.getaddrinfo(resolver, 'localhost')
+        self.assertEqual(self.hosts.queries, 3)
+        self.getaddrinfo(resolver, 'example.test')
+        self.assertEqual(self.hosts.queries, 3)
+        self.getaddrinfo(resolver, 'other.test')
+        self.assertEqual(self.hosts.queries, 4)
+        stats = resolver.statistics()
+        self.assertEqual((stats['evictions'], stats['entries']), (2, 2))
+
+    def test_clear(self):
+        resolver = asyncio.CachingResolver(self.hosts)
+        self.getaddrinfo(resolver, 'example.test')
+        self.getaddrinfo(resolver, 'other.test')
+        resolver.clear('example.test')
+        self.assertEqual(resolver.statistics()['entries'], 1)
+        self.getaddrinfo(resolver, 'other.test')
+        self.assertEqual(self.hosts.queries, 2)
+        resolver.clear()
+        self.assertEqual(resolver.statistics()['entries'], 0)
+
+
+class LoopResolverTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        super().tearDown()
+
+    def test_default(self):
+        self.assertIsNone(self.loop.get_resolver())
+
+    def test_set_resolver_invalid(self):
+        with self.assertRaises(TypeError):
+            self.loop.set_resolver(object())
+
+    def test_getaddrinfo(self):
+        hosts = asyncio.HostsResolver({'example.test': ['127.0.0.1']})
+        resolver = asyncio.CachingResolver(hosts)
+        self.loop.set_resolver(resolver)
+        self.assertIs(self.loop.get_resolver(), resolver)
+        for _ in range(2):
+            infos = self.loop.run_until_complete(self.loop.getaddrinfo(
+                'example.test', 80, type=socket.SOCK_STREAM))
+            self.assertEqual(infos[0][4], ('127.0.0.1', 80))
+        self.assertEqual(hosts.queries, 1)
+
+        self.loop.set_resolver(None)
+        self.assertIsNone(self.loop.get_resolver())
+
+    def test_create_connection(self):
+        hosts = asyncio.HostsResolver({'example.test': ['127.0.0.1']})
+        self.loop.set_resolver(asyncio.CachingResolver(hosts))
+
+        class ServerProtocol(asyncio.Protocol):
+            def connection_made(self, transport):
+                transport.close()
+
+        async def main():
+            server = await self.loop.create_server(
+                ServerProtocol, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                for _ in range(2):
+                    transport, _ = await self.loop.create_connection(
+                        asyncio.Protocol, 'example.test', port)
+                    self.assertEqual(
+                        transport.get_extra_info('peername'),
+                        ('127.0.0.1', port))
+                    transport.close()
+
+        self.loop.run_until_complete(main())
+        # create_server() with a numeric address does not resolve anything.
+        self.assertEqual(hosts.queries, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
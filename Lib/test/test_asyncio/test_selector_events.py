@@ -1,5 +1,6 @@
 """Tests for selector_events.py"""
 
+import collections
 import sys
 import selectors
 import socket
@@ -11,6 +12,7 @@
     ssl = None
 
 import asyncio
+from asyncio import selector_events
 from asyncio.selector_events import BaseSelectorEventLoop
 from asyncio.selector_events import _SelectorTransport
 from asyncio.selector_events import _SelectorSocketTransport
@@ -40,6 +42,10 @@ def list_to_buffer(l=()):
     return bytearray().join(l)
 
 
+def list_to_deque(l=()):
+    return collections.deque(l)
+
+
 def close_transport(transport):
     # Don't call transport.close() because the event loop and the selector
     # are mocked
@@ -660,17 +666,17 @@ def test_write_memoryview(self):
 
     def test_write_no_data(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data')
+        transport._buffer_append(b'data')
         transport.write(b'')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_buffer(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data1')
+        transport._buffer_append(b'data1')
         transport.write(b'data2')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data1', b'data2']),
+        self.assertEqual(list_to_deque([b'data1', b'data2']),
                          transport._buffer)
 
     def test_write_partial(self):
@@ -681,7 +687,7 @@ def test_write_partial(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_partial_bytearray(self):
         data = bytearray(b'data')
@@ -691,7 +697,7 @@ def test_write_partial_bytearray(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
         self.assertEqual(data, bytearray(b'data'))  # Hasn't been mutated.
 
     def test_write_partial_memoryview(self):
@@ -702,7 +708,7 @@ def test_write_partial_memoryview(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_partial_none(self):
         data = b'data'
@@ -713,7 +719,7 @@ def test_write_partial_none(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
@@ -723,7 +729,7 @@ def test_write_tryagain(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     @mock.patch('asyncio.selector_events.logger')
     def test_write_exception(self, m_log):
@@ -764,7 +770,8 @@ def test_write_ready(self):
         self.sock.send.return_value = len(data)
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._write_ready = transport._write_send
+        transport._buffer_append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -775,8 +782,9 @@ def test_write_ready_closing(self):
         self.sock.send.return_value = len(data)
 
         transport = self.socket_transport()
+        transport._write_ready = transport._write_send
         transport._closing = True
-        transport._buffer.extend(data)
+        transport._buffer_append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -795,45 +803,257 @@ def test_write_ready_partial(self):
         self.sock.send.return_value = 2
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._write_ready = transport._write_send
+        transport._buffer_append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_ready_partial_none(self):
         data = b'data'
         self.sock.send.return_value = 0
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._write_ready = transport._write_send
+        transport._buffer_append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_ready_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
 
         transport = self.socket_transport()
-        transport._buffer = list_to_buffer([b'data1', b'data2'])
+        transport._write_ready = transport._write_send
+        transport._buffer = list_to_deque([b'data1', b'data2'])
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data1data2']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data1', b'data2']), transport._buffer)
 
     def test_write_ready_exception(self):
         err = self.sock.send.side_effect = OSError()
 
         transport = self.socket_transport()
+        transport._write_ready = transport._write_send
         transport._fatal_error = mock.Mock()
-        transport._buffer.extend(b'data')
+        transport._buffer_append(b'data')
         transport._write_ready()
         transport._fatal_error.assert_called_with(
                                    err,
                                    'Fatal write error on socket transport')
 
+    def test_get_write_buffer_size(self):
+        self.sock.send.side_effect = BlockingIOError
+
+        transport = self.socket_transport()
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+        transport.write(b'data1')
+        transport.write(bytearray(b'data2'))
+        transport.write(memoryview(b'data3')[1:])
+        self.assertEqual(transport.get_write_buffer_size(), 14)
+
+    def test_write_buffer_copies_mutable(self):
+        self.sock.send.side_effect = BlockingIOError
+
+        data = bytearray(b'data')
+        transport = self.socket_transport()
+        transport.write(data)
+        data[:] = b'xxxx'
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
+
+    def test_write_buffer_keeps_bytes(self):
+        self.sock.send.return_value = 2
+
+        data = b'data'
+        transport = self.socket_transport()
+        transport.write(data)
+        self.assertIs(transport._buffer[0].obj, data)
+
+    def test_write_buffer_casts_format(self):
+        self.sock.send.side_effect = BlockingIOError
+
+        data = memoryview(bytes(8)).cast('I')
+        transport = self.socket_transport()
+        transport.write(data)
+        self.assertEqual(transport._buffer[0].format, 'B')
+        self.assertEqual(transport.get_write_buffer_size(), 8)
+
+    def test_writelines(self):
+        sent = []
+        def sendmsg(buffers):
+            buffers = list(buffers)
+            sent.append(buffers)
+            return sum(map(len, buffers))
+        self.sock.sendmsg.side_effect = sendmsg
+
+        transport = self.socket_transport()
+        transport._write_ready = transport._write_sendmsg
+        transport.writelines([b'data1', bytearray(b'data2'), b'', b'data3'])
+        self.assertEqual(sent, [[b'data1', b'data2', b'data3']])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.loop.writers)
+        self.assertFalse(transport._buffer)
+
+    def test_writelines_partial(self):
+        self.sock.sendmsg.side_effect = lambda buffers: 7
+
+        transport = self.socket_transport()
+        transport._write_ready = transport._write_sendmsg
+        transport.writelines([b'data1', b'data2'])
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_deque([b'ta2']), transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 3)
+
+    def test_writelines_send_fallback(self):
+        self.sock.send.return_value = 5
+
+        transport = self.socket_transport()
+        transport._write_ready = transport._write_send
+        transport.writelines([b'data1', b'data2'])
+        self.sock.send.assert_called_once_with(b'data1')
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_deque([b'data2']), transport._buffer)
+
+    def test_writelines_buffer(self):
+        transport = self.socket_transport()
+        transport._buffer_append(b'data1')
+        transport.writelines([b'data2', b'data3'])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertEqual(list_to_deque([b'data1', b'data2', b'data3']),
+                         transport._buffer)
+
+    def test_writelines_no_data(self):
+        transport = self.socket_transport()
+        transport.writelines([])
+        transport.writelines([b'', b''])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertFalse(self.loop.writers)
+
+    def test_writelines_str(self):
+        transport = self.socket_transport()
+        self.assertRaises(TypeError, transport.writelines, [b'data', 'str'])
+        self.assertFalse(transport._buffer)
+
+    def test_writelines_closing(self):
+        transport = self.socket_transport()
+        transport.close()
+        self.assertEqual(transport._conn_lost, 1)
+        transport.writelines([b'data'])
+        self.assertEqual(transport._conn_lost, 2)
+
+    def test_writelines_after_eof(self):
+        transport = self.socket_transport()
+        transport.write_eof()
+        self.assertRaises(RuntimeError, transport.writelines, [b'data'])
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_sendmsg_default(self):
+        transport = self.socket_transport()
+        self.assertEqual(transport._write_ready, transport._write_sendmsg)
+
+    def test_write_ready_sendmsg(self):
+        self.sock.sendmsg.side_effect = lambda buffers: sum(map(len, buffers))
+
+        transport = self.socket_transport()
+        transport._write_ready = transport._write_sendmsg
+        transport._buffer_append(b'data1')
+        transport._buffer_append(b'data2')
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.assertTrue(self.sock.sendmsg.called)
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.loop.writers)
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+
+    def test_write_ready_sendmsg_closing(self):
+        self.sock.sendmsg.side_effect = lambda buffers: sum(map(len, buffers))
+
+        transport = self.socket_transport()
+        transport._write_ready = transport._write_sendmsg
+        transport._closing = True
+        transport._buffer_append(b'data')
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.assertFalse(self.loop.writers)
+        self.sock.close.assert_called_with()
+        self.protocol.connection_lost.assert_called_with(None)
+
+    def test_write_ready_sendmsg_partial(self):
+        self.sock.sendmsg.return_value = 7
+
+        transport = self.socket_transport()
+        transport._write_ready = transport._write_sendmsg
+        for data in (b'data1', b'data2', b'data3'):
+            transport._buffer_append(data)
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_deque([b'ta2', b'data3']), transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 8)
+
+    def test_write_ready_sendmsg_partial_none(self):
+        self.sock.sendmsg.return_value = 0
+
+        transport = self.socket_transport()
+        transport._write_ready = transport._write_sendmsg
+        transport._buffer_append(b'data')
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
+
+    def test_write_ready_sendmsg_tryagain(self):
+        self.sock.sendmsg.side_effect = BlockingIOError
+
+        transport = self.socket_transport()
+        transport._write_ready = transport._write_sendmsg
+        transport._buffer = list_to_deque([b'data1', b'data2'])
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_deque([b'data1', b'data2']),
+                         transport._buffer)
+
+    def test_write_ready_sendmsg_exception(self):
+        err = self.sock.sendmsg.side_effect = OSError()
+
+        transport = self.socket_transport()
+        transport._write_ready = transport._write_sendmsg
+        transport._fatal_error = mock.Mock()
+        transport._buffer_append(b'data')
+        transport._write_ready()
+        transport._fatal_error.assert_called_with(
+                                   err,
+                                   'Fatal write error on socket transport')
+        self.assertFalse(transport._buffer)
+
+    @mock.patch('asyncio.selector_events.SC_IOV_MAX', 2, create=True)
+    def test_write_ready_sendmsg_iov_max(self):
+        sent = []
+        def sendmsg(buffers):
+            buffers = list(buffers)
+            sent.append(buffers)
+            return sum(map(len, buffers))
+        self.sock.sendmsg.side_effect = sendmsg
+
+        transport = self.socket_transport()
+        transport._write_ready = transport._write_sendmsg
+        for data in (b'data1', b'data2', b'data3'):
+            transport._buffer_append(data)
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.assertEqual(sent, [[b'data1', b'data2']])
+        self.loop.assert_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.assertEqual(sent, [[b'data1', b'data2'], [b'data3']])
+        self.assertFalse(self.loop.writers)
+
     def test_write_eof(self):
         tr = self.socket_transport()
         self.assertTrue(tr.can_write_eof())
@@ -845,10 +1065,11 @@ def test_write_eof(self):
 
     def test_write_eof_buffer(self):
         tr = self.socket_transport()
+        tr._write_ready = tr._write_send
         self.sock.send.side_effect = BlockingIOError
         tr.write(b'data')
         tr.write_eof()
-        self.assertEqual(tr._buffer, list_to_buffer([b'data']))
+        self.assertEqual(tr._buffer, list_to_deque([b'data']))
         self.assertTrue(tr._eof)
         self.assertFalse(self.sock.shutdown.called)
         self.sock.send.side_effect = lambda _: 4
@@ -1107,6 +1328,102 @@ def test_read_ready_oserr(self):
         self.assertFalse(transport._fatal_error.called)
         self.protocol.error_received.assert_called_with(err)
 
+    def recvfrom_into(self, *results):
+        # Make sock.recvfrom_into() return datagrams, then raise.
+        results = list(results)
+
+        def recvfrom_into(buffer):
+            result = results.pop(0)
+            if isinstance(result, BaseException):
+                raise result
+            data, addr = result
+            buffer[:len(data)] = data
+            return len(data), addr
+
+        self.sock.recvfrom_into.side_effect = recvfrom_into
+
+    def test_read_batch_size(self):
+        transport = self.datagram_transport()
+        self.assertEqual(transport.get_read_batch_size(), 1)
+        transport.set_read_batch_size(16)
+        self.assertEqual(transport.get_read_batch_size(), 16)
+        with self.assertRaises(ValueError):
+            transport.set_read_batch_size(0)
+
+    def test_read_ready_batch(self):
+        transport = self.datagram_transport()
+        transport.set_read_batch_size(16)
+        self.recvfrom_into((b'data1', ('0.0.0.0', 1)),
+                           (b'data22', ('0.0.0.0', 2)),
+                           BlockingIOError())
+        transport._read_ready()
+
+        self.assertFalse(self.sock.recvfrom.called)
+        self.assertFalse(self.protocol.datagram_received.called)
+        self.protocol.datagrams_received.assert_called_once_with(
+            [(b'data1', ('0.0.0.0', 1)), (b'data22', ('0.0.0.0', 2))])
+        datagrams = self.protocol.datagrams_received.call_args[0][0]
+        self.assertIs(type(datagrams[0][0]), bytes)
+
+    def test_read_ready_batch_limit(self):
+        transport = self.datagram_transport()
+        transport.set_read_batch_size(2)
+        self.recvfrom_into(*[(b'data', ('0.0.0.0', i)) for i in range(3)])
+        transport._read_ready()
+        self.protocol.datagrams_received.assert_called_once_with(
+            [(b'data', ('0.0.0.0', 0)), (b'data', ('0.0.0.0', 1))])
+        self.assertEqual(self.sock.recvfrom_into.call_count, 2)
+
+    def test_read_ready_batch_tryagain(self):
+        transport = self.datagram_transport()
+        transport.set_read_batch_size(16)
+        self.recvfrom_into(BlockingIOError())
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+        self.assertFalse(self.protocol.datagrams_received.called)
+        self.assertFalse(transport._fatal_error.called)
+
+    def test_read_ready_batch_oserr(self):
+        transport = self.datagram_transport()
+        transport.set_read_batch_size(16)
+        err = ConnectionRefusedError()
+        self.recvfrom_into((b'data', ('0.0.0.0', 1)), err)
+        transport._read_ready()
+        # The datagrams read before the error are delivered first.
+        self.protocol.datagrams_received.assert_called_once_with(
+            [(b'data', ('0.0.0.0', 1))])
+        self.protocol.error_received.assert_called_once_with(err)
+
+    def test_read_ready_batch_err(self):
+        transport = self.datagram_transport()
+        transport.set_read_batch_size(16)
+        err = RuntimeError()
+        self.recvfrom_into((b'data', ('0.0.0.0', 1)), err)
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+        self.assertFalse(self.protocol.datagrams_received.called)
+        transport._fatal_error.assert_called_with(
+                                   err,
+                                   'Fatal read error on datagram transport')
+
+    def test_read_ready_batch_without_datagrams_received(self):
+        class Protocol:
+            def __init__(self):
+                self.received = []
+
+            def connection_made(self, transport):
+                pass
+
+            def datagram_received(self, data, addr):
+                self.received.append((data, addr))
+
+        self.protocol = Protocol()
+        transport = self.datagram_transport()
+        transport.set_read_batch_size(16)
+        self.recvfrom_into((b'a', 1), (b'b', 2), BlockingIOError())
+        transport._read_ready()
+        self.assertEqual(self.protocol.received, [(b'a', 1), (b'b', 2)])
+
     def test_sendto(self):
         data = b'data'
         transport = self.datagram_transport()
@@ -1307,6 +1624,36 @@ def test_sendto_ready_exception(self):
                                    err,
                                    'Fatal write error on datagram transport')
 
+    def test_sendto_ready_many(self):
+        transport = self.datagram_transport()
+        transport._buffer.extend([(b'data1', ('0.0.0.0', 1)),
+                                  (b'data22', ('0.0.0.0', 2)),
+                                  (b'data333', ('0.0.0.0', 3))])
+        transport._buffer_size = 18
+        self.sock.sendto.side_effect = [5, 6, BlockingIOError]
+        self.loop._add_writer(7, transport._sendto_ready)
+        transport._sendto_ready()
+
+        self.assertEqual(self.sock.sendto.call_count, 3)
+        self.assertEqual(list(transport._buffer),
+                         [(b'data333', ('0.0.0.0', 3))])
+        self.assertEqual(transport.get_write_buffer_size(), 7)
+        self.loop.assert_writer(7, transport._sendto_ready)
+
+    def test_sendto_ready_many_error_received(self):
+        transport = self.datagram_transport()
+        transport._buffer.extend([(b'data1', ()), (b'data22', ()),
+                                  (b'data333', ())])
+        transport._buffer_size = 18
+        err = ConnectionRefusedError()
+        self.sock.sendto.side_effect = [5, err]
+        transport._sendto_ready()
+
+        # The datagram that failed is dropped.
+        self.assertEqual(list(transport._buffer), [(b'data333', ())])
+        self.assertEqual(transport.get_write_buffer_size(), 7)
+        self.protocol.error_received.assert_called_once_with(err)
+
     def test_sendto_ready_error_received(self):
         self.sock.sendto.side_effect = ConnectionRefusedError
 
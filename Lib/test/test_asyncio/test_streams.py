@@ -454,7 +454,7 @@ def test_readuntil_limit_found_sep(self):
         stream = asyncio.StreamReader(loop=self.loop, limit=3)
         stream.feed_data(b'some dataAA')
         with self.assertRaisesRegex(asyncio.LimitOverrunError,
-                                    'not found') as cm:
+                                    'not found'):
             self.loop.run_until_complete(stream.readuntil(b'AAA'))
 
         self.assertEqual(b'some dataAA', stream._buffer)
@@ -1069,5 +1069,353 @@ def test_eof_feed_when_closing_writer(self):
         self.assertEqual(messages, [])
 
 
+class BufferedStreamReaderTests(test_utils.TestCase):
+
+    DATA = b'line1\nline2\nline3\n'
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+
+    def tearDown(self):
+        test_utils.run_briefly(self.loop)
+
+        self.loop.close()
+        gc.collect()
+        super().tearDown()
+
+    def test_read(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.read(30))
+
+        def cb():
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        data = self.loop.run_until_complete(read_task)
+        self.assertEqual(self.DATA, data)
+        self.assertTrue(stream.at_eof() is False)
+        stream.feed_eof()
+        self.assertTrue(stream.at_eof())
+
+    def test_read_until_eof(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop, limit=3)
+        read_task = self.loop.create_task(stream.read(-1))
+
+        def cb():
+            stream.feed_data(b'chunk1\n')
+            stream.feed_data(b'chunk2')
+            stream.feed_eof()
+        self.loop.call_soon(cb)
+
+        data = self.loop.run_until_complete(read_task)
+        self.assertEqual(b'chunk1\nchunk2', data)
+
+    def test_readline(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        stream.feed_data(b'chunk1 ')
+        read_task = self.loop.create_task(stream.readline())
+
+        def cb():
+            stream.feed_data(b'chunk2 ')
+            stream.feed_data(b'chunk3 ')
+            stream.feed_data(b'\n chunk4')
+        self.loop.call_soon(cb)
+
+        line = self.loop.run_until_complete(read_task)
+        self.assertEqual(b'chunk1 chunk2 chunk3 \n', line)
+        self.assertEqual(b' chunk4', self.loop.run_until_complete(
+            stream.read(7)))
+
+    def test_readline_limit(self):
+        stream = asyncio.BufferedStreamReader(limit=7, loop=self.loop)
+        stream.feed_data(b'1234567\n')
+        stream.feed_data(b'12345678\n')
+        stream.feed_data(b'1\n')
+        stream.feed_eof()
+
+        self.assertEqual(b'1234567\n',
+                         self.loop.run_until_complete(stream.readline()))
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(stream.readline())
+        self.assertEqual(b'1\n',
+                         self.loop.run_until_complete(stream.readline()))
+        self.assertTrue(stream.at_eof())
+
+    def test_readuntil(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        stream.feed_data(b'QWEaa')
+        stream.feed_data(b'XYaa')
+        stream.feed_data(b'a')
+        data = self.loop.run_until_complete(stream.readuntil(b'aaa'))
+        self.assertEqual(b'QWEaaXYaaa', data)
+
+        stream.feed_data(b'some dataAA')
+        stream.feed_eof()
+        with self.assertRaisesRegex(asyncio.IncompleteReadError,
+                                    'undefined expected bytes') as cm:
+            self.loop.run_until_complete(stream.readuntil(b'AAA'))
+        self.assertEqual(cm.exception.partial, b'some dataAA')
+        self.assertTrue(stream.at_eof())
+
+    def test_readuntil_limit(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop, limit=3)
+        stream.feed_data(b'some dataAA')
+        with self.assertRaisesRegex(asyncio.LimitOverrunError,
+                                    'not found'):
+            self.loop.run_until_complete(stream.readuntil(b'AAA'))
+        self.assertEqual(b'some dataAA', self.loop.run_until_complete(
+            stream.read(100)))
+
+    def test_readuntil_view(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.readuntil_view(b'\r\n'))
+
+        def cb():
+            stream.feed_data(b'frame1\r')
+            stream.feed_data(b'\nframe2\r\n')
+        self.loop.call_soon(cb)
+
+        view = self.loop.run_until_complete(read_task)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view, b'frame1\r\n')
+        view = self.loop.run_until_complete(stream.readuntil_view(b'\r\n'))
+        self.assertEqual(view, b'frame2\r\n')
+
+    def test_readexactly(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        n = 2 * len(self.DATA)
+        read_task = self.loop.create_task(stream.readexactly(n))
+
+        def cb():
+            stream.feed_data(self.DATA)
+            stream.feed_data(self.DATA)
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        data = self.loop.run_until_complete(read_task)
+        self.assertEqual(self.DATA + self.DATA, data)
+        self.assertEqual(self.DATA, self.loop.run_until_complete(
+            stream.read(100)))
+
+    def test_readexactly_eof(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        n = 2 * len(self.DATA)
+        read_task = self.loop.create_task(stream.readexactly(n))
+
+        def cb():
+            stream.feed_data(self.DATA)
+            stream.feed_eof()
+        self.loop.call_soon(cb)
+
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(cm.exception.partial, self.DATA)
+        self.assertEqual(cm.exception.expected, n)
+        self.assertTrue(stream.at_eof())
+
+    def test_readexactly_larger_than_buffer(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop, limit=16)
+        data = bytes(range(256)) * 100
+        read_task = self.loop.create_task(stream.readexactly(len(data)))
+
+        def cb():
+            for i in range(0, len(data), 1000):
+                stream.feed_data(data[i:i + 1000])
+        self.loop.call_soon(cb)
+
+        self.assertEqual(data, self.loop.run_until_complete(read_task))
+
+    def test_readexactly_view(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        stream.feed_data(b'\x00\x05hello\x00\x05world')
+
+        async def read_frames():
+            frames = []
+            for _ in range(2):
+                header = await stream.readexactly_view(2)
+                size = int.from_bytes(header, 'big')
+                frames.append(bytes(await stream.readexactly_view(size)))
+            return frames
+
+        frames = self.loop.run_until_complete(read_frames())
+        self.assertEqual(frames, [b'hello', b'world'])
+
+    def test_view_valid_until_next_read(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop, limit=1)
+        stream.feed_data(b'a' * 4096)
+        view = self.loop.run_until_complete(stream.readexactly_view(4096))
+        # More data than fits after the view forces a new buffer; the view
+        # still refers to the data it was returned with.
+        stream.feed_data(b'b' * 4096)
+        self.assertEqual(view, b'a' * 4096)
+        self.assertEqual(b'b' * 4096, self.loop.run_until_complete(
+            stream.readexactly(4096)))
+
+    def test_read_view(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        view = self.loop.run_until_complete(stream.read_view(3))
+        self.assertEqual(view, b'dat')
+        view = self.loop.run_until_complete(stream.read_view(3))
+        self.assertEqual(view, b'a')
+        stream.feed_eof()
+        view = self.loop.run_until_complete(stream.read_view(3))
+        self.assertEqual(view, b'')
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(stream.read_view(0))
+
+    def test_readinto(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        buf = bytearray(4)
+        read_task = self.loop.create_task(stream.readinto(buf))
+
+        def cb():
+            stream.feed_data(b'data1')
+        self.loop.call_soon(cb)
+
+        self.assertEqual(4, self.loop.run_until_complete(read_task))
+        self.assertEqual(buf, b'data')
+        self.assertEqual(1, self.loop.run_until_complete(stream.readinto(buf)))
+        self.assertEqual(buf, b'1ata')
+        self.assertEqual(0, self.loop.run_until_complete(
+            stream.readinto(bytearray())))
+        stream.feed_eof()
+        self.assertEqual(0, self.loop.run_until_complete(stream.readinto(buf)))
+
+    def test_readexactly_into(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop, limit=16)
+        data = bytes(range(256)) * 10
+        buf = bytearray(len(data))
+        read_task = self.loop.create_task(stream.readexactly_into(buf))
+
+        def cb():
+            for i in range(0, len(data), 100):
+                stream.feed_data(data[i:i + 100])
+            stream.feed_data(b'tail')
+        self.loop.call_soon(cb)
+
+        self.assertEqual(len(data), self.loop.run_until_complete(read_task))
+        self.assertEqual(buf, data)
+        self.assertEqual(b'tail', self.loop.run_until_complete(
+            stream.read(100)))
+
+    def test_readexactly_into_eof(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        stream.feed_eof()
+        buf = memoryview(bytearray(8))
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.readexactly_into(buf))
+        self.assertEqual(cm.exception.partial, b'data')
+        self.assertEqual(cm.exception.expected, 8)
+
+    def test_exception(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        exc = ValueError()
+        stream.set_exception(exc)
+        for coro in (stream.read(2), stream.read_view(2),
+                     stream.readinto(bytearray(2)),
+                     stream.readexactly_into(bytearray(2)),
+                     stream.readexactly_view(2), stream.readuntil_view()):
+            with self.subTest(coro=coro.__qualname__):
+                self.assertRaises(
+                    ValueError, self.loop.run_until_complete, coro)
+
+    def test_compact(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop, limit=16)
+        capacity = len(stream._buffer)
+
+        async def reader():
+            total = 0
+            while True:
+                data = await stream.read(3000)
+                if not data:
+                    return total
+                total += len(data)
+
+        async def writer():
+            for _ in range(100):
+                stream.feed_data(b'x' * 1000)
+                await asyncio.sleep(0)
+            stream.feed_eof()
+
+        task = self.loop.create_task(reader())
+        self.loop.run_until_complete(writer())
+        self.assertEqual(self.loop.run_until_complete(task), 100000)
+        self.assertEqual(len(stream._buffer), capacity)
+
+    def test_pause_reading(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop, limit=1)
+        transport = mock.Mock()
+        stream.set_transport(transport)
+        stream.feed_data(b'data')
+        transport.pause_reading.assert_called_once_with()
+        self.loop.run_until_complete(stream.read(3))
+        transport.resume_reading.assert_called_once_with()
+
+    def test_protocol_get_buffer(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        protocol = asyncio.BufferedStreamReaderProtocol(stream,
+                                                        loop=self.loop)
+        self.assertIsInstance(protocol, asyncio.BufferedProtocol)
+        buf = protocol.get_buffer(-1)
+        self.assertGreaterEqual(len(buf), 1)
+        buf[:4] = b'data'
+        protocol.buffer_updated(4)
+        self.assertEqual(b'data', self.loop.run_until_complete(
+            stream.read(100)))
+
+    def test___repr__(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop, limit=123)
+        stream.feed_data(b'data')
+        stream.feed_eof()
+        self.assertEqual("<BufferedStreamReader 4 bytes eof limit=123>",
+                         repr(stream))
+
+    def test_open_connection(self):
+        with test_utils.run_test_server() as httpd:
+            reader, writer = self.loop.run_until_complete(
+                asyncio.open_connection(*httpd.address, buffered=True))
+            self.assertIsInstance(reader, asyncio.BufferedStreamReader)
+            writer.write(b'GET / HTTP/1.0\r\n\r\n')
+            data = self.loop.run_until_complete(reader.readline())
+            self.assertEqual(data, b'HTTP/1.0 200 OK\r\n')
+            data = self.loop.run_until_complete(reader.read())
+            self.assertTrue(data.endswith(b'\r\n\r\nTest message'))
+            writer.close()
+            self.loop.run_until_complete(writer.wait_closed())
+
+    def test_start_server(self):
+        payload = os.urandom(300_000)
+
+        async def handle_client(reader, writer):
+            header = await reader.readexactly_view(4)
+            buf = bytearray(int.from_bytes(header, 'big'))
+            await reader.readexactly_into(buf)
+            writer.write(buf)
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+        async def main():
+            server = await asyncio.start_server(
+                handle_client, socket_helper.HOSTv4, 0, buffered=True)
+            addr = server.sockets[0].getsockname()
+            async with server:
+                reader, writer = await asyncio.open_connection(
+                    *addr, buffered=True)
+                writer.write(len(payload).to_bytes(4, 'big') + payload)
+                data = bytearray(len(payload))
+                await reader.readexactly_into(data)
+                self.assertEqual(await reader.read(), b'')
+                writer.close()
+                await writer.wait_closed()
+                return data
+
+        self.assertEqual(self.loop.run_until_complete(main()), payload)
+
+
 if __name__ == '__main__':
     unittest.main()
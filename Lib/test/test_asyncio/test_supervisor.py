@@ -0,0 +1,203 @@
+"""Tests for asyncio/supervisor.py"""
+
+import os
+import signal
+import socket
+import sys
+import unittest
+
+import asyncio
+from test import support
+from test.test_asyncio import utils as test_utils
+
+
+if sys.platform == 'win32' or not hasattr(socket, 'SO_REUSEPORT'):
+    raise unittest.SkipTest('SO_REUSEPORT required')
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+async def pid_server(sock):
+    # Send the process id, then wait for the client to close.
+    async def handle(reader, writer):
+        writer.write(b'%d\n' % os.getpid())
+        await reader.read()
+        writer.close()
+
+    return await asyncio.start_server(handle, sock=sock)
+
+
+async def failing_server(sock):
+    raise ZeroDivisionError
+
+
+@support.requires_fork()
+class ServerSupervisorTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        super().tearDown()
+
+    def supervisor(self, factory=pid_server, **kwargs):
+        kwargs.setdefault('workers', 2)
+        kwargs.setdefault('stats_interval', 0.01)
+        kwargs.setdefault('start_timeout', support.SHORT_TIMEOUT)
+        return asyncio.ServerSupervisor(factory, '127.0.0.1', 0,
+                                        mp_context='fork', **kwargs)
+
+    async def connect(self, supervisor):
+        reader, writer = await asyncio.open_connection(
+            *supervisor.sockname)
+        pid = int(await reader.readline())
+        return pid, writer
+
+    async def pid_of_connection(self, supervisor):
+        pid, writer = await self.connect(supervisor)
+        writer.close()
+        await writer.wait_closed()
+        return pid
+
+    async def wait_until(self, predicate):
+        async with asyncio.timeout(support.SHORT_TIMEOUT):
+            while not predicate():
+                await asyncio.sleep(0.01)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.ServerSupervisor(pid_server, workers=0)
+
+    def test_serve(self):
+        async def main():
+            async with self.supervisor() as supervisor:
+                pids = supervisor.pids
+                self.assertEqual(len(pids), 2)
+                self.assertNotIn(os.getpid(), pids)
+                self.assertEqual(supervisor.sockname[0], '127.0.0.1')
+                self.assertNotEqual(supervisor.sockname[1], 0)
+                for _ in range(6):
+                    pid = await self.pid_of_connection(supervisor)
+                    self.assertIn(pid, pids)
+                await self.wait_until(
+                    lambda: supervisor.statistics()['accepted'] == 6)
+                stats = supervisor.statistics()
+                self.assertEqual(stats['workers'], 2)
+                self.assertEqual(set(stats['per_worker']), set(pids))
+                self.assertEqual(stats['respawns'], 0)
+            self.assertEqual(supervisor.pids, [])
+            self.assertEqual(supervisor.statistics()['accepted'], 6)
+            with self.assertRaises(RuntimeError):
+                await supervisor.restart()
+
+        self.loop.run_until_complete(main())
+
+    def test_restart(self):
+        async def main():
+            async with self.supervisor() as supervisor:
+                old_pids = supervisor.pids
+                await supervisor.restart()
+                new_pids = supervisor.pids
+                self.assertEqual(len(new_pids), 2)
+                self.assertFalse(set(old_pids) & set(new_pids))
+                pid = await self.pid_of_connection(supervisor)
+                self.assertIn(pid, new_pids)
+                self.assertEqual(supervisor.statistics()['restarts'], 1)
+
+        self.loop.run_until_complete(main())
+
+    def test_restart_failure(self):
+        async def main():
+            async with self.supervisor() as supervisor:
+                old_pids = supervisor.pids
+                supervisor._server_factory = failing_server
+                msg = 'before serving: ZeroDivisionError'
+                with self.assertRaisesRegex(RuntimeError, msg):
+                    await supervisor.restart()
+                # The failed worker is not respawned.
+                await asyncio.sleep(0.1)
+                self.assertEqual(supervisor.pids, old_pids)
+                self.assertEqual(supervisor.statistics()['restarts'], 0)
+
+        self.loop.run_until_complete(main())
+
+    def test_respawn(self):
+        async def main():
+            async with self.supervisor() as supervisor:
+                victim, survivor = supervisor.pids
+                os.kill(victim, signal.SIGKILL)
+                await self.wait_until(
+                    lambda: supervisor.statistics()['workers'] == 2
+                    and victim not in supervisor.pids)
+                self.assertIn(survivor, supervisor.pids)
+                self.assertEqual(supervisor.statistics()['respawns'], 1)
+                pid = await self.pid_of_connection(supervisor)
+                self.assertIn(pid, supervisor.pids)
+
+        with self.assertLogs('asyncio', 'WARNING'):
+            self.loop.run_until_complete(main())
+
+    def test_start_failure(self):
+        async def main():
+            supervisor = self.supervisor(failing_server)
+            msg = 'before serving: ZeroDivisionError'
+            with self.assertRaisesRegex(RuntimeError, msg):
+                await supervisor.start()
+            self.assertEqual(supervisor.pids, [])
+
+        self.loop.run_until_complete(main())
+
+    def test_drain(self):
+        async def main():
+            supervisor = self.supervisor(workers=1)
+            await supervisor.start()
+            pid, writer = await self.connect(supervisor)
+            await self.wait_until(
+                lambda: supervisor.statistics()['connections'] == 1)
+            stop = asyncio.create_task(supervisor.stop())
+            await asyncio.sleep(0.2)
+            # The worker waits for the connection to be closed.
+            self.assertFalse(stop.done())
+            self.assertEqual(supervisor.pids, [pid])
+            writer.close()
+            await stop
+            self.assertEqual(supervisor.pids, [])
+
+        self.loop.run_until_complete(main())
+
+    def test_drain_timeout(self):
+        async def main():
+            supervisor = self.supervisor(workers=1, drain_timeout=0.1)
+            await supervisor.start()
+            pid, writer = await self.connect(supervisor)
+            await supervisor.stop()
+            self.assertEqual(supervisor.pids, [])
+            writer.close()
+
+        self.loop.run_until_complete(main())
+
+    def test_serve_forever_signals(self):
+        async def main():
+            supervisor = self.supervisor()
+            await supervisor.start()
+            old_pids = supervisor.pids
+            serve = asyncio.create_task(supervisor.serve_forever())
+            await asyncio.sleep(0)
+            os.kill(os.getpid(), signal.SIGHUP)
+            await self.wait_until(
+                lambda: supervisor.statistics()['restarts'] == 1)
+            self.assertFalse(set(old_pids) & set(supervisor.pids))
+            os.kill(os.getpid(), signal.SIGTERM)
+            await serve
+            self.assertEqual(supervisor.pids, [])
+
+        self.loop.run_until_complete(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
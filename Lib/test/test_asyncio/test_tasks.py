@@ -3308,6 +3308,152 @@ async def coro():
         self.assertEqual(result, 11)
 
 
+class BoundedMapTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+        self.running = 0
+        self.max_running = 0
+        self.cancelled = []
+
+    def tearDown(self):
+        self.loop.close()
+        self.loop = None
+        super().tearDown()
+
+    async def delayed(self, item):
+        # Return item after abs(item) hundredths of a second, or raise
+        # ZeroDivisionError if item is negative.
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(abs(item) / 100)
+        except asyncio.CancelledError:
+            self.cancelled.append(item)
+            raise
+        finally:
+            self.running -= 1
+        if item < 0:
+            raise ZeroDivisionError(item)
+        return item
+
+    async def collect(self, *args, **kwargs):
+        return [result async for result in asyncio.bounded_map(*args, **kwargs)]
+
+    def test_builtin_map_not_shadowed(self):
+        # "from asyncio import *" must not replace the builtin map().
+        self.assertNotIn('map', asyncio.__all__)
+
+    def test_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(
+                self.collect(self.delayed, [1], limit=0))
+
+    def test_ordered(self):
+        items = [3, 1, 2, 0, 1]
+        results = self.loop.run_until_complete(
+            self.collect(self.delayed, items, limit=2))
+        self.assertEqual(results, items)
+        self.assertEqual(self.max_running, 2)
+
+    def test_unordered(self):
+        results = self.loop.run_until_complete(
+            self.collect(self.delayed, [5, 1, 3], limit=3, ordered=False))
+        self.assertEqual(results, [1, 3, 5])
+
+    def test_empty(self):
+        results = self.loop.run_until_complete(
+            self.collect(self.delayed, [], limit=2))
+        self.assertEqual(results, [])
+
+    def test_async_iterable_consumed_lazily(self):
+        pulled = []
+
+        async def items():
+            for item in range(10):
+                pulled.append(item)
+                yield item % 3
+
+        async def main():
+            results = []
+            async for result in asyncio.bounded_map(self.delayed, items(), limit=3):
+                results.append(result)
+                # The items are pulled as the results are consumed.
+                self.assertLessEqual(len(pulled), len(results) + 3)
+            return results
+
+        results = self.loop.run_until_complete(main())
+        self.assertEqual(results, [item % 3 for item in range(10)])
+        self.assertEqual(self.max_running, 3)
+
+    def test_failure_cancels_other_calls(self):
+        async def main():
+            results = []
+            with self.assertRaises(ZeroDivisionError):
+                async for result in asyncio.bounded_map(
+                        self.delayed, [1, 10, -2, 10, 10], limit=3):
+                    results.append(result)
+            return results
+
+        results = self.loop.run_until_complete(main())
+        self.assertEqual(results, [1])
+        # The failure is raised before the result of the slower item 10.
+        self.assertEqual(self.cancelled, [10, 10])
+        self.assertEqual(self.running, 0)
+
+    def test_failure_yields_available_results(self):
+        async def main(ordered):
+            results = []
+            with self.assertRaises(ZeroDivisionError):
+                async for result in asyncio.bounded_map(
+                        self.delayed, [1, 2, -3, 10], limit=4, ordered=ordered):
+                    results.append(result)
+                    # Item 2 completes and item -3 fails meanwhile.
+                    await asyncio.sleep(0.05)
+            return results
+
+        for ordered in (True, False):
+            with self.subTest(ordered=ordered):
+                self.cancelled.clear()
+                results = self.loop.run_until_complete(main(ordered))
+                self.assertEqual(results, [1, 2])
+                self.assertEqual(self.cancelled, [10])
+                self.assertEqual(self.running, 0)
+
+    def test_close_cancels_running_calls(self):
+        async def main():
+            results = asyncio.bounded_map(self.delayed, [0, 10, 10, 10], limit=3)
+            self.assertEqual(await anext(results), 0)
+            await results.aclose()
+
+        self.loop.run_until_complete(main())
+        # The last item was not pulled.
+        self.assertEqual(self.cancelled, [10, 10])
+        self.assertEqual(self.running, 0)
+
+    def test_cancel_consumer(self):
+        started = self.loop.create_future()
+
+        async def block(item):
+            if not started.done():
+                started.set_result(None)
+            await self.delayed(item)
+
+        async def main():
+            task = asyncio.create_task(
+                self.collect(block, [100, 100], limit=2))
+            await started
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        self.loop.run_until_complete(main())
+        self.assertEqual(self.cancelled, [100, 100])
+        self.assertEqual(self.running, 0)
+
+
 class CompatibilityTests(test_utils.TestCase):
     # Tests for checking a bridge between old-styled coroutines
     # and async/await syntax
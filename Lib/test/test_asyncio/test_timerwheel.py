@@ -0,0 +1,223 @@
+"""Tests for asyncio/timerwheel.py"""
+
+import random
+import unittest
+from unittest import mock
+
+import asyncio
+from asyncio import events
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+def make_handle(when, loop=None):
+    return events.TimerHandle(when, lambda: None, (), loop or mock.Mock())
+
+
+class TimerWheelTests(unittest.TestCase):
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.TimerWheel(0)
+        with self.assertRaises(ValueError):
+            asyncio.TimerWheel(bits=0)
+        with self.assertRaises(ValueError):
+            asyncio.TimerWheel(levels=0)
+
+    def test_empty(self):
+        wheel = asyncio.TimerWheel()
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(wheel.next_deadline())
+        self.assertEqual(wheel.pop_expired(100.0), [])
+
+    def test_repr(self):
+        wheel = asyncio.TimerWheel(0.01, bits=4, levels=2)
+        wheel.add(make_handle(1.0), 0.0)
+        self.assertEqual(
+            repr(wheel), '<TimerWheel tick=0.01 bits=4 levels=2 handles=1>')
+
+    def test_pop_expired(self):
+        wheel = asyncio.TimerWheel(0.01)
+        h1 = make_handle(10.05)
+        h2 = make_handle(10.02)
+        h3 = make_handle(10.5)
+        for h in (h1, h2, h3):
+            wheel.add(h, 10.0)
+        self.assertEqual(len(wheel), 3)
+        self.assertEqual(wheel.pop_expired(10.01), [])
+        self.assertEqual(wheel.pop_expired(10.1), [h2, h1])
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.pop_expired(11.0), [h3])
+        self.assertEqual(len(wheel), 0)
+
+    def test_never_early(self):
+        wheel = asyncio.TimerWheel(0.01)
+        h = make_handle(10.015)
+        wheel.add(h, 10.0)
+        self.assertEqual(wheel.pop_expired(10.0149), [])
+        deadline = wheel.next_deadline()
+        self.assertGreaterEqual(deadline, h.when())
+        self.assertEqual(wheel.pop_expired(deadline), [h])
+
+    def test_already_due(self):
+        wheel = asyncio.TimerWheel(0.01)
+        h = make_handle(9.0)
+        wheel.add(h, 10.0)
+        self.assertEqual(wheel.next_deadline(), 0.0)
+        self.assertEqual(wheel.pop_expired(10.0), [h])
+
+    def test_remove(self):
+        wheel = asyncio.TimerWheel(0.01)
+        h1 = make_handle(10.05)
+        h2 = make_handle(10.05)
+        wheel.add(h1, 10.0)
+        wheel.add(h2, 10.0)
+        self.assertTrue(wheel.remove(h1))
+        self.assertFalse(wheel.remove(h1))
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.pop_expired(11.0), [h2])
+        self.assertFalse(wheel.remove(h2))
+
+    def test_next_deadline_upper_level(self):
+        wheel = asyncio.TimerWheel(1, bits=2, levels=2)
+        h = make_handle(13)
+        wheel.add(h, 0)
+        # The handle is moved down to level 0 at tick 12.
+        self.assertEqual(wheel.next_deadline(), 12)
+        self.assertEqual(wheel.pop_expired(12), [])
+        self.assertEqual(wheel.next_deadline(), 13)
+        self.assertEqual(wheel.pop_expired(13), [h])
+
+    def test_overflow(self):
+        wheel = asyncio.TimerWheel(1, bits=2, levels=1)
+        h1 = make_handle(2)
+        h2 = make_handle(1000)
+        wheel.add(h1, 0)
+        wheel.add(h2, 0)
+        self.assertEqual(wheel.pop_expired(999), [h1])
+        self.assertEqual(wheel.next_deadline(), 1000)
+        self.assertEqual(wheel.pop_expired(1000), [h2])
+
+    def test_clear(self):
+        wheel = asyncio.TimerWheel()
+        handles = [make_handle(when) for when in (1, 2, 3, 10**7)]
+        for h in handles:
+            h._scheduled = True
+            wheel.add(h, 0)
+        self.assertCountEqual(wheel.handles(), handles)
+        wheel.clear()
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(wheel.handles(), [])
+        self.assertFalse(any(h._scheduled for h in handles))
+        self.assertEqual(wheel.pop_expired(10.0**8), [])
+
+    def test_randomized(self):
+        rng = random.Random(42)
+        for bits, levels in ((8, 4), (2, 1), (3, 2), (2, 3)):
+            with self.subTest(bits=bits, levels=levels):
+                wheel = asyncio.TimerWheel(0.001, bits=bits, levels=levels)
+                now = rng.uniform(0, 100)
+                handles = [make_handle(now + rng.expovariate(1 / scale))
+                           for scale in rng.choices((0.001, 0.1, 5, 60),
+                                                    k=1000)]
+                for h in handles:
+                    wheel.add(h, now)
+                cancelled = set(rng.sample(handles, 250))
+                for h in cancelled:
+                    self.assertTrue(wheel.remove(h))
+
+                fired = []
+                while len(wheel):
+                    now = max(now + rng.choice((0, 0.0005, 0.01, 1)),
+                              wheel.next_deadline())
+                    expired = wheel.pop_expired(now)
+                    self.assertEqual(expired, sorted(expired))
+                    for h in expired:
+                        self.assertLessEqual(h.when(), now)
+                    fired.extend(expired)
+                self.assertCountEqual(
+                    fired, [h for h in handles if h not in cancelled])
+
+
+class TimerWheelLoopTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        super().tearDown()
+
+    def test_default(self):
+        self.assertIsNone(self.loop.get_timer_wheel())
+
+    def test_set_timer_wheel_invalid(self):
+        with self.assertRaises(TypeError):
+            self.loop.set_timer_wheel(object())
+
+    def test_call_later(self):
+        wheel = asyncio.TimerWheel()
+        self.loop.set_timer_wheel(wheel)
+        self.assertIs(self.loop.get_timer_wheel(), wheel)
+        results = []
+
+        def callback(arg):
+            results.append((arg, self.loop.time()))
+
+        start = self.loop.time()
+        for delay in (0.03, 0.01, 0.02):
+            self.loop.call_later(delay, callback, delay)
+        handle = self.loop.call_later(0.015, callback, 'cancelled')
+        self.assertEqual(len(wheel), 4)
+        handle.cancel()
+        self.assertEqual(len(wheel), 3)
+        self.assertFalse(self.loop._scheduled)
+
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual([arg for arg, _ in results], [0.01, 0.02, 0.03])
+        for delay, when in results:
+            self.assertGreaterEqual(when, start + delay)
+
+    def test_timeouts(self):
+        self.loop.set_timer_wheel(asyncio.TimerWheel())
+
+        async def main():
+            with self.assertRaises(TimeoutError):
+                await asyncio.wait_for(asyncio.sleep(10), 0.01)
+            async with asyncio.timeout(1):
+                await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(main())
+        self.assertEqual(len(self.loop.get_timer_wheel()), 0)
+
+    def test_switch(self):
+        h1 = self.loop.call_later(10, lambda: None)
+        h2 = self.loop.call_later(20, lambda: None)
+        h2.cancel()
+        wheel = asyncio.TimerWheel()
+        self.loop.set_timer_wheel(wheel)
+        self.assertEqual(wheel.handles(), [h1])
+        self.assertFalse(self.loop._scheduled)
+        self.assertTrue(h1._scheduled)
+
+        self.loop.set_timer_wheel(None)
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(self.loop._scheduled, [h1])
+        self.assertTrue(h1._scheduled)
+
+    def test_close(self):
+        wheel = asyncio.TimerWheel()
+        self.loop.set_timer_wheel(wheel)
+        h = self.loop.call_later(10, lambda: None)
+        self.loop.close()
+        self.assertEqual(len(wheel), 0)
+        self.assertFalse(h._scheduled)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -61,6 +61,9 @@ def test_dgram_not_implemented(self):
         transport = asyncio.DatagramTransport()
 
         self.assertRaises(NotImplementedError, transport.sendto, 'data')
+        self.assertRaises(NotImplementedError,
+                          transport.set_read_batch_size, 16)
+        self.assertRaises(NotImplementedError, transport.get_read_batch_size)
         self.assertRaises(NotImplementedError, transport.abort)
 
     def test_subprocess_transport_not_implemented(self):
@@ -868,6 +868,80 @@ def test_map_timeout(self):
 
         self.assertEqual([None, None], results)
 
+    def test_map_buffersize_type_validation(self):
+        for buffersize in ("foo", 2.0):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    TypeError,
+                    "buffersize must be an integer or None",
+                ):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize_value_validation(self):
+        for buffersize in (0, -1):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    ValueError,
+                    "buffersize must be None or > 0",
+                ):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(str, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), ["0", "1", "2", "3"])
+
+    def test_map_buffersize_on_multiple_iterables(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(mul, ints, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), [0, 1, 4, 9])
+
+    def test_map_buffersize_on_infinite_iterable(self):
+        res = self.executor.map(str, itertools.count(), buffersize=2)
+        self.assertEqual(next(res, None), "0")
+        self.assertEqual(next(res, None), "1")
+        self.assertEqual(next(res, None), "2")
+
+    def test_map_buffersize_on_multiple_infinite_iterables(self):
+        res = self.executor.map(
+            mul,
+            itertools.count(),
+            itertools.count(),
+            buffersize=2
+        )
+        self.assertEqual(next(res, None), 0)
+        self.assertEqual(next(res, None), 1)
+        self.assertEqual(next(res, None), 4)
+
+    def test_map_buffersize_on_empty_iterable(self):
+        res = self.executor.map(str, [], buffersize=2)
+        self.assertIsNone(next(res, None))
+
+    def test_map_buffersize_when_buffer_is_full(self):
+        ints = iter(range(4))
+        buffersize = 2
+        self.executor.map(str, ints, buffersize=buffersize)
+        self.executor.shutdown(wait=True)  # wait for tasks to complete
+        self.assertEqual(
+            next(ints),
+            buffersize,
+            msg="should have fetched only `buffersize` elements from `ints`.",
+        )
+
+    def test_map_buffersize_timeout(self):
+        results = []
+        with self.assertRaises(futures.TimeoutError):
+            # The timeout counts from the call to map(), not from the
+            # submission of each call.
+            for i in self.executor.map(time.sleep, [0, 0, 6], timeout=5,
+                                       buffersize=1):
+                results.append(i)
+        self.assertEqual([None, None], results)
+
     def test_shutdown_race_issue12456(self):
         # Issue #12456: race condition at shutdown where trying to post a
         # sentinel in the call queue blocks (the queue is full while processes
@@ -1023,6 +1097,28 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_auto_chunksize(self):
+        ref = list(map(pow, range(1000), range(1000)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(1000), range(1000),
+                                   chunksize='auto')),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(1000), range(1000),
+                                   chunksize='auto', buffersize=1)),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, [], chunksize='auto')), [])
+
+        # The input is consumed lazily.
+        res = self.executor.map(str, itertools.count(), chunksize='auto')
+        self.assertEqual(list(itertools.islice(res, 3)), ["0", "1", "2"])
+
+        res = self.executor.map(divmod, [1, 1, 1], [1, 0, 1],
+                                chunksize='auto')
+        self.assertEqual(next(res), (1, 0))
+        self.assertRaises(ZeroDivisionError, next, res)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -1152,6 +1248,32 @@ def test_max_tasks_early_shutdown(self):
         for i, future in enumerate(futures):
             self.assertEqual(future.result(), mul(i, i))
 
+    @unittest.skipIf(sys.platform == 'win32', 'POSIX shared memory only')
+    def test_shared_memory_threshold(self):
+        large = os.urandom(100_000)
+        executor = self.executor_type(
+                2, mp_context=self.get_context(),
+                shared_memory_threshold=1024)
+        self.assertEqual(executor.submit(mul, large, 1).result(), large)
+        self.assertEqual(list(executor.map(mul, [large, b'small'], [1, 2])),
+                         [large, b'smallsmall'])
+        self.assertEqual(executor.submit(mul, bytearray(large), 1).result(),
+                         bytearray(large))
+        # Unpicklable arguments and results fail their future only.
+        with self.assertRaises(PicklingError):
+            executor.submit(mul, large, ErrorAtPickle()).result()
+        with self.assertRaises(PicklingError):
+            executor.submit(_return_instance, ErrorAtPickle).result()
+        self.assertEqual(executor.submit(mul, large, 1).result(), large)
+        executor.shutdown()
+
+        for threshold in (0, -1):
+            with self.assertRaises(ValueError):
+                self.executor_type(1, shared_memory_threshold=threshold)
+        for threshold in (1.5, True):
+            with self.assertRaises(TypeError):
+                self.executor_type(1, shared_memory_threshold=threshold)
+
 
 create_executor_tests(ProcessPoolExecutorTest,
                       executor_mixins=(ProcessPoolForkMixin,
@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+with warnings.catch_warnings():
+    # Foundation compares strings with "is" in code older than this test.
+    warnings.simplefilter("ignore", SyntaxWarning)
+    import Foundation
+
+
+def git(*args, cwd):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com",
+                    *args], cwd=cwd, check=True, capture_output=True)
+
+
+@unittest.skipUnless(shutil.which("git"), "requires git")
+class InstallManyTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.repository = os.path.join(self.directory, "repository")
+        self.library = os.path.join(self.directory, "library")
+        self.progress = os.path.join(self.directory, "progress.json")
+        os.mkdir(self.repository)
+        git("init", "-q", "-b", "main", cwd=self.repository)
+        self.commit("one")
+
+        for patcher in (mock.patch.object(Foundation, "LibLocation", self.library),
+                        mock.patch.object(Foundation.Store, "Location",
+                                          os.path.join(self.directory, "store")),
+                        mock.patch.object(Foundation.Console, "Log")):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.package = {
+            "ApplicationPublisher": "Publisher",
+            "ApplicationName": "Package",
+            "ApplicationGitIdentifier": "main",
+            "ApplicationGitUrl": self.repository,
+        }
+        _, self.location = Foundation.Locate("Publisher", "Package")
+
+    def commit(self, contents):
+        with open(os.path.join(self.repository, "contents.txt"), "w") as f:
+            f.write(contents)
+        git("add", "contents.txt", cwd=self.repository)
+        git("commit", "-q", "-m", contents, cwd=self.repository)
+
+    def installed(self):
+        with open(os.path.join(self.location, "contents.txt")) as f:
+            return f.read()
+
+    def test_locate(self):
+        for publisher in ("Riverside", "RiversideValley"):
+            self.assertEqual(Foundation.Locate(publisher, "Fluid"), (
+                "https://github.com/RiversideValley/Fluid.git",
+                os.path.join(self.library, "Riverside", "Fluid")))
+        self.assertEqual(Foundation.Locate("Publisher", "Package", "/repository")[0],
+                         "/repository")
+
+    def test_resume_after_interrupt(self):
+        def interrupted(*args, **kwargs):
+            os.makedirs(self.location)
+            with open(os.path.join(self.location, "partial"), "w"):
+                pass
+            raise OSError("interrupted")
+
+        with mock.patch.object(Foundation, "Install", interrupted):
+            with self.assertRaises(Foundation.Exception.FoundationCloneError):
+                Foundation.InstallMany([self.package], ProgressFile=self.progress)
+        with open(self.progress) as f:
+            self.assertEqual([entry["State"] for entry in json.load(f).values()],
+                             ["Failed"])
+        self.assertTrue(os.path.isdir(self.location))
+
+        Foundation.InstallMany([self.package], ProgressFile=self.progress)
+        self.assertEqual(self.installed(), "one")
+        self.assertNotIn("partial", os.listdir(self.location))
+        self.assertFalse(os.path.exists(self.progress))
+
+    def test_resume_after_branch_moved(self):
+        missing = dict(self.package, ApplicationName="Missing",
+                       ApplicationGitUrl=os.path.join(self.directory, "missing"))
+        with self.assertRaises(Foundation.Exception.FoundationCloneError):
+            Foundation.InstallMany([self.package, missing], ProgressFile=self.progress)
+        self.assertEqual(self.installed(), "one")
+
+        self.commit("two")
+        with self.assertRaises(Foundation.Exception.FoundationCloneError):
+            Foundation.InstallMany([self.package, missing], ProgressFile=self.progress)
+        self.assertEqual(self.installed(), "two")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from System import Explore
+
+
+class ExploreWriteTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "file.txt")
+
+    def test_write_returns_bytes_written(self):
+        text = "héllo €"
+        expected = len(text.encode("utf-8"))
+        for options in ({}, {"Atomic": True}, {"Sync": True},
+                        {"Atomic": True, "Sync": True}):
+            with self.subTest(**options):
+                self.assertEqual(Explore(self.path, True, text).Write(**options),
+                                 expected)
+                with open(self.path, encoding="utf-8") as f:
+                    self.assertEqual(f.read(), text)
+
+    def test_write_binary_returns_bytes_written(self):
+        data = "héllo".encode("utf-8")
+        for options in ({}, {"Atomic": True}, {"Sync": True}):
+            with self.subTest(**options):
+                self.assertEqual(
+                    Explore(self.path, True, data, Binary=True).Write(**options),
+                    len(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
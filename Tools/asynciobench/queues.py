@@ -0,0 +1,93 @@
+"""Compare per-item and batched transfers through asyncio queues.
+
+Several producers feed one consumer through a bounded queue, first with
+put() and get(), then with put_many() and get_many().  The benchmark
+reports the number of items moved per second for Queue, LifoQueue and
+PriorityQueue.
+
+The asyncio package of this source tree is used unless --path says
+otherwise.
+"""
+import argparse
+import os
+import sys
+import time
+
+LIB = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                   os.pardir, os.pardir, "Lib")
+
+
+async def single(asyncio, queue_class, items, producers, maxsize, batch):
+    queue = queue_class(maxsize)
+    per_producer = items // producers
+
+    async def produce():
+        for i in range(per_producer):
+            await queue.put(i)
+
+    async def consume():
+        for _ in range(per_producer * producers):
+            await queue.get()
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(producers):
+            tg.create_task(produce())
+        tg.create_task(consume())
+
+
+async def batched(asyncio, queue_class, items, producers, maxsize, batch):
+    queue = queue_class(maxsize)
+    per_producer = items // producers
+
+    async def produce():
+        for start in range(0, per_producer, batch):
+            await queue.put_many(range(start, min(start + batch,
+                                                  per_producer)))
+
+    async def consume():
+        remaining = per_producer * producers
+        while remaining:
+            remaining -= len(await queue.get_many(batch))
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(producers):
+            tg.create_task(produce())
+        tg.create_task(consume())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--items", type=int, default=200_000,
+                        help="items to transfer (default: 200000)")
+    parser.add_argument("-p", "--producers", type=int, default=4,
+                        help="producer tasks (default: 4)")
+    parser.add_argument("-m", "--maxsize", type=int, default=1000,
+                        help="queue size (default: 1000)")
+    parser.add_argument("-b", "--batch", type=int, default=100,
+                        help="items per put_many()/get_many() call "
+                             "(default: 100)")
+    parser.add_argument("--path", default=os.path.normpath(LIB),
+                        help="directory to import asyncio from")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    import asyncio
+
+    print(f"{args.items} items, {args.producers} producers, "
+          f"maxsize={args.maxsize}, batch={args.batch}")
+    print(f"{'queue':<15} {'get/put':>14} {'get_many/put_many':>18}  "
+          f"(items/s)")
+    for queue_class in (asyncio.Queue, asyncio.LifoQueue,
+                        asyncio.PriorityQueue):
+        rates = []
+        for transfer in (single, batched):
+            start = time.perf_counter()
+            asyncio.run(transfer(asyncio, queue_class, args.items,
+                                 args.producers, args.maxsize, args.batch))
+            rates.append(args.items / (time.perf_counter() - start))
+        print(f"{queue_class.__name__:<15} {rates[0]:14,.0f} "
+              f"{rates[1]:18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
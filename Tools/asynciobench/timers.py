@@ -0,0 +1,100 @@
+"""Compare the heap and the timer wheel under heavy timer churn.
+
+The benchmark models a server with many idle connections: every
+connection holds an idle timeout, and on each loop iteration a batch of
+connections sees activity, so their timeouts are cancelled and
+scheduled again.  It reports the throughput of rescheduling and the
+latency of loop iterations, which includes the periodic rebuild of the
+heap once too many of its handles are cancelled.  Like timeit, the
+benchmark disables the garbage collector while measuring, so that its
+pauses do not hide the cost of the schedulers.
+
+The asyncio package of this source tree is used unless --path says
+otherwise.
+"""
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+
+LIB = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                   os.pardir, os.pardir, "Lib")
+
+
+def run(asyncio, scheduler, connections, batch, iterations, timeout, seed):
+    """Return (total seconds, list of iteration latencies)."""
+    loop = asyncio.new_event_loop()
+    if scheduler == "wheel":
+        loop.set_timer_wheel(asyncio.TimerWheel())
+    rng = random.Random(seed)
+    expired = 0
+
+    def on_timeout():
+        nonlocal expired
+        expired += 1
+
+    async def main():
+        handles = [loop.call_later(timeout * rng.random(), on_timeout)
+                   for _ in range(connections)]
+        batches = [rng.sample(range(connections), batch)
+                   for _ in range(iterations)]
+        latencies = []
+        for indexes in batches:
+            t0 = time.perf_counter()
+            for i in indexes:
+                handles[i].cancel()
+                handles[i] = loop.call_later(timeout, on_timeout)
+            await asyncio.sleep(0)
+            latencies.append(time.perf_counter() - t0)
+        for handle in handles:
+            handle.cancel()
+        return sum(latencies), latencies
+
+    gc.collect()
+    gc.disable()
+    try:
+        return loop.run_until_complete(main())
+    finally:
+        gc.enable()
+        loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--connections", type=int, default=200_000,
+                        help="number of idle timeouts (default: 200000)")
+    parser.add_argument("-b", "--batch", type=int, default=1000,
+                        help="timeouts rescheduled per iteration "
+                             "(default: 1000)")
+    parser.add_argument("-i", "--iterations", type=int, default=500,
+                        help="loop iterations (default: 500)")
+    parser.add_argument("-t", "--timeout", type=float, default=60.0,
+                        help="idle timeout in seconds (default: 60)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--path", default=os.path.normpath(LIB),
+                        help="directory to import asyncio from")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    import asyncio
+
+    print(f"{args.connections} timeouts, {args.batch} rescheduled per "
+          f"iteration, {args.iterations} iterations")
+    print(f"{'scheduler':<10} {'total (s)':>10} {'median':>9} {'p99':>9} "
+          f"{'max':>9}  (ms per iteration)")
+    for scheduler in ("heap", "wheel"):
+        total, latencies = run(asyncio, scheduler, args.connections,
+                               args.batch, args.iterations, args.timeout,
+                               args.seed)
+        latencies = sorted(latency * 1000 for latency in latencies)
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"{scheduler:<10} {total:10.3f} "
+              f"{statistics.median(latencies):9.3f} {p99:9.3f} "
+              f"{latencies[-1]:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
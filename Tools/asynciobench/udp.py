@@ -0,0 +1,100 @@
+"""Compare reading UDP datagrams one at a time and in batches.
+
+A blocking socket in a thread sends small datagrams as fast as it can
+to a datagram endpoint, which counts them with datagram_received(), or
+with datagrams_received() after transport.set_read_batch_size().  The
+benchmark reports the number of datagrams received per second and the
+number of loop iterations per datagram.  Datagrams dropped by the kernel
+because the receive buffer is full are not counted.
+
+The asyncio package of this source tree is used unless --path says
+otherwise.
+"""
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+
+LIB = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                   os.pardir, os.pardir, "Lib")
+
+
+def run(asyncio, batch, datagrams, size, duration):
+    """Return (datagrams received per second, iterations per datagram)."""
+
+    class Counter(asyncio.DatagramProtocol):
+        received = 0
+
+        def datagram_received(self, data, addr):
+            self.received += 1
+
+        def datagrams_received(self, datagrams):
+            self.received += len(datagrams)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_datagram_endpoint(
+            Counter, local_addr=("127.0.0.1", 0))
+        if batch > 1:
+            transport.set_read_batch_size(batch)
+        addr = transport.get_extra_info("sockname")
+        stop = threading.Event()
+
+        def send():
+            payload = b"x" * size
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                for _ in range(datagrams):
+                    if stop.is_set():
+                        break
+                    sock.sendto(payload, addr)
+
+        instrument = asyncio.LoopInstrument()
+        loop.set_instrument(instrument)
+        start = time.perf_counter()
+        sender = loop.run_in_executor(None, send)
+        try:
+            await asyncio.wait_for(asyncio.shield(sender), duration)
+        except TimeoutError:
+            stop.set()
+            await sender
+        # Let the loop read what is left in the socket.
+        await asyncio.sleep(0.05)
+        elapsed = time.perf_counter() - start
+        loop.set_instrument(None)
+        transport.close()
+        received = protocol.received
+        return (received / elapsed,
+                instrument.iteration_time.count / max(received, 1))
+
+    return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--datagrams", type=int, default=200_000,
+                        help="datagrams to send (default: 200000)")
+    parser.add_argument("-s", "--size", type=int, default=64,
+                        help="datagram size in bytes (default: 64)")
+    parser.add_argument("-b", "--batch", type=int, default=64,
+                        help="read batch size (default: 64)")
+    parser.add_argument("-t", "--duration", type=float, default=10.0,
+                        help="maximum duration in seconds (default: 10)")
+    parser.add_argument("--path", default=os.path.normpath(LIB),
+                        help="directory to import asyncio from")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    import asyncio
+
+    print(f"{args.datagrams} datagrams of {args.size} bytes")
+    print(f"{'batch':>6} {'datagrams/s':>12} {'iterations/datagram':>20}")
+    for batch in (1, args.batch):
+        rate, iterations = run(asyncio, batch, args.datagrams, args.size,
+                               args.duration)
+        print(f"{batch:6} {rate:12,.0f} {iterations:20.3f}")
+
+
+if __name__ == "__main__":
+    main()
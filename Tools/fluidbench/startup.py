@@ -0,0 +1,55 @@
+"""Measure how long importing the Fluid runtime modules takes.
+
+Every measurement runs in a fresh interpreter with -X importtime, so the
+numbers are what a short-lived command line tool pays on each invocation.
+By default the modules are imported from the Lib directory of this source
+tree; use --path to point at another copy.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = ("Fluid", "System", "Foundation")
+LIB = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "Lib")
+
+
+def import_time(module, path):
+    """Return the cumulative import time of *module* in microseconds."""
+    env = dict(os.environ, PYTHONPATH=path)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-W", "ignore",
+                           "-c", f"import {module}"],
+                          env=env, capture_output=True, text=True, check=True)
+    for line in reversed(proc.stderr.splitlines()):
+        _, _, cumulative, name = (field.strip() for field in
+                                  line.replace(":", "|", 1).split("|"))
+        if name == module:
+            return int(cumulative)
+    raise RuntimeError(f"{module} missing from -X importtime output")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--repeat", type=int, default=20,
+                        help="fresh interpreters per module (default: 20)")
+    parser.add_argument("--path", default=os.path.normpath(LIB),
+                        help="directory to import the modules from")
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    # Prime the bytecode caches so compilation is not measured.
+    for module in args.modules:
+        import_time(module, args.path)
+
+    print(f"{'module':<12} {'min':>9} {'median':>9} {'max':>9}  (ms)")
+    for module in args.modules:
+        times = [import_time(module, args.path) / 1000
+                 for _ in range(args.repeat)]
+        print(f"{module:<12} {min(times):9.2f} {statistics.median(times):9.2f}"
+              f" {max(times):9.2f}")
+
+
+if __name__ == "__main__":
+    main()
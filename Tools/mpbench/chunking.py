@@ -0,0 +1,91 @@
+"""Compare chunk sizes for ProcessPoolExecutor.map() and Pool.imap().
+
+Three workloads are mapped over a process pool:
+
+* tiny: squaring integers, where the IPC overhead dominates;
+* uniform: items which all take about the same time;
+* skewed: mostly fast items, with slow items grouped at the end of the
+  input, where large chunks leave a single worker running the stragglers.
+
+For each workload, the benchmark reports the time taken with one item
+per chunk, with the fixed chunk size of Pool.map() (a quarter of the
+items per worker), and with chunksize='auto'.
+
+The multiprocessing and concurrent.futures packages of this source tree
+are used unless --path says otherwise.
+"""
+import argparse
+import os
+import sys
+import time
+
+LIB = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                   os.pardir, os.pardir, "Lib")
+
+
+def tiny(x):
+    return x * x
+
+
+def spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return seconds
+
+
+def workloads(items, item_time):
+    slow = max(items // 100, 1)
+    return {
+        "tiny": (tiny, range(items * 20)),
+        "uniform": (spin, [item_time] * items),
+        "skewed": (spin, [item_time / 10] * (items - slow)
+                         + [item_time * 10] * slow),
+    }
+
+
+def run(mapper, func, args, chunksize):
+    start = time.perf_counter()
+    for _ in mapper(func, args, chunksize=chunksize):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--items", type=int, default=2000,
+                        help="items of the uniform and skewed workloads; "
+                             "the tiny workload has 20 times more "
+                             "(default: 2000)")
+    parser.add_argument("-t", "--item-time", type=float, default=0.0005,
+                        help="seconds per item of the uniform workload "
+                             "(default: 0.0005)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of worker processes "
+                             "(default: the number of CPUs)")
+    parser.add_argument("--path", default=os.path.normpath(LIB),
+                        help="directory to import the packages from")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = args.workers or os.cpu_count() or 1
+    print(f"{workers} workers")
+    print(f"{'pool':>8} {'workload':>9} {'chunksize':>10} {'seconds':>9}")
+    with ProcessPoolExecutor(workers) as executor, \
+         multiprocessing.Pool(workers) as pool:
+        for name, mapper in (("executor", executor.map),
+                             ("pool", pool.imap)):
+            for workload, (func, items) in workloads(
+                    args.items, args.item_time).items():
+                fixed = max(len(items) // (4 * workers), 1)
+                for chunksize in (1, fixed, "auto"):
+                    seconds = run(mapper, func, items, chunksize)
+                    print(f"{name:>8} {workload:>9} {chunksize:>10} "
+                          f"{seconds:9.3f}")
+
+
+if __name__ == "__main__":
+    main()